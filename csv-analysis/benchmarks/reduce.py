@@ -0,0 +1,77 @@
+"""
+Grouped reduction benchmark for SalesAnalyzer.aggregate_with_reduce.
+
+Generates a sales file of the requested size, then times
+aggregate_with_reduce for a reducer that maps to a group-by kernel (sum),
+one that does not (a lambda applied per group), and the original row
+iteration (iterrows plus reduce) on a sample of the rows, extrapolated to
+the full size since it takes minutes at a million rows.
+
+Usage:
+    python benchmarks/reduce.py [--rows 1000000] [--sample 50000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from functools import reduce
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from generate_data import generate_sales_data, write_to_csv
+from src.analyzer import SalesAnalyzer
+
+
+def iterrows_reduce(data, group_field):
+    """Group and sum revenue row by row, as aggregate_with_reduce used to"""
+    groups = {}
+    for _, row in data.iterrows():
+        groups.setdefault(row[group_field], []).append(row['revenue'])
+    return {key: reduce(lambda acc, val: acc + val, values, 0) for key, values in groups.items()}
+
+
+def timed(function, *args, **kwargs):
+    """Call a function and return its result and elapsed seconds"""
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--sample', type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'sales.csv')
+        write_to_csv(generate_sales_data(args.rows), path)
+        analyzer = SalesAnalyzer(path)
+
+    data = analyzer.data
+    sample = min(args.sample, len(data))
+
+    kernel, kernel_time = timed(analyzer.aggregate_with_reduce, 'product')
+    fallback, fallback_time = timed(analyzer.aggregate_with_reduce, 'product',
+                                    lambda acc, x: acc + x, initial=0)
+    _, sample_time = timed(iterrows_reduce, data.iloc[:sample], 'product')
+    iterrows_time = sample_time * len(data) / sample
+
+    drift = max(abs(kernel[key] - fallback[key]) / abs(fallback[key]) for key in fallback)
+
+    print(f"Rows: {len(data)}  |  groups: {len(kernel)}  |  iterrows sample: {sample} rows")
+    print("-" * 58)
+    print(f"{'Method':<28}{'Time (s)':>12}{'Speedup':>12}")
+    print("-" * 58)
+    for name, elapsed in (("iterrows + reduce (est.)", iterrows_time),
+                          ("per-group fallback", fallback_time),
+                          ("group-by kernel", kernel_time)):
+        print(f"{name:<28}{elapsed:>12.3f}{iterrows_time / elapsed:>11.0f}x")
+    print("-" * 58)
+    print(f"Largest relative difference, kernel vs fallback: {drift:.1e}")
+
+
+if __name__ == "__main__":
+    main()
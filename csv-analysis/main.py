@@ -1,8 +1,31 @@
 from src.analyzer import SalesAnalyzer
+from src.expressions import col, lit, Expr
+from src.aggregates import PartialAggregates
+from src.schema import SALES_SCHEMA
+from src.cache import ColumnarCache
+from src.memo import ResultCache
+from src.reducers import grouped_reduce
+from src.date_index import DateIndex
+from src.partitions import byte_ranges, read_range
+from src.dataset import PartitionedDataset
+from src.query import Query
 from src.operations import filter_data, map_data, aggregate_data, group_and_sum
 
 __all__ = [
     'SalesAnalyzer',
+    'col',
+    'lit',
+    'Expr',
+    'PartialAggregates',
+    'SALES_SCHEMA',
+    'ColumnarCache',
+    'ResultCache',
+    'grouped_reduce',
+    'DateIndex',
+    'byte_ranges',
+    'read_range',
+    'PartitionedDataset',
+    'Query',
     'filter_data',
     'map_data',
     'aggregate_data',
@@ -1,4 +1,14 @@
 from .analyzer import SalesAnalyzer
+from .expressions import col, lit, Expr
+from .aggregates import PartialAggregates
+from .schema import SALES_SCHEMA
+from .cache import ColumnarCache
+from .memo import ResultCache
+from .reducers import grouped_reduce
+from .date_index import DateIndex
+from .partitions import byte_ranges, read_range
+from .dataset import PartitionedDataset
+from .query import Query
 from .operations import (
     filter_data,
     map_data,
@@ -0,0 +1,193 @@
+"""
+Mergeable partial aggregates for the standard sales analyses.
+
+Partial aggregates hold running totals rather than rows: revenue per
+category, product, region and month, transaction counts, and the distinct
+categories and regions. They can be updated chunk by chunk and merged with
+each other, so the standard analyses can be answered for data that never
+fits in memory at once.
+"""
+
+import pandas as pd
+
+class PartialAggregates:
+    """
+    Running totals behind the standard sales analyses.
+
+    Memory use is proportional to the number of distinct categories,
+    products, regions and months, not to the number of rows.
+    """
+
+    def __init__(self):
+        """
+        Initialize empty aggregates.
+        """
+        self.category_revenue = None
+        self.product_revenue = None
+        self.region_revenue = None
+        self.region_count = None
+        self.monthly_revenue = None
+        self.transactions = 0
+        self.revenue = 0.0
+        self.categories = set()
+        self.regions = set()
+        # Categorical dtype of each grouping column, or None once a plain part was added
+        self.dtypes = {}
+
+    @classmethod
+    def from_frame(cls, data):
+        """
+        Compute aggregates for a DataFrame.
+
+        Args:
+            data: DataFrame with category, product, region, month and revenue columns
+
+        Returns:
+            PartialAggregates instance
+        """
+        return cls().update(data)
+
+    def update(self, data):
+        """
+        Add the rows of a DataFrame to the totals.
+
+        Args:
+            data: DataFrame with category, product, region, month and revenue columns
+
+        Returns:
+            self, for chaining
+        """
+        self.category_revenue = _add(self.category_revenue, _group(data, 'category').sum())
+        self.product_revenue = _add(self.product_revenue, _group(data, 'product').sum())
+        self.region_revenue = _add(self.region_revenue, _group(data, 'region').sum())
+        self.region_count = _add(self.region_count, _group(data, 'region').count())
+        self.monthly_revenue = _add(self.monthly_revenue, _group(data, 'month').sum())
+
+        self.transactions += len(data)
+        self.revenue += data['revenue'].sum()
+        self.categories.update(data['category'].dropna().unique())
+        self.regions.update(data['region'].dropna().unique())
+        for column in ('category', 'product', 'region'):
+            dtype = data[column].dtype
+            self._merge_dtype(column, dtype if isinstance(dtype, pd.CategoricalDtype) else None)
+        return self
+
+    def merge(self, other):
+        """
+        Add another set of partial aggregates to this one.
+
+        Args:
+            other: PartialAggregates computed over different rows
+
+        Returns:
+            self, for chaining
+        """
+        self.category_revenue = _add(self.category_revenue, other.category_revenue)
+        self.product_revenue = _add(self.product_revenue, other.product_revenue)
+        self.region_revenue = _add(self.region_revenue, other.region_revenue)
+        self.region_count = _add(self.region_count, other.region_count)
+        self.monthly_revenue = _add(self.monthly_revenue, other.monthly_revenue)
+
+        self.transactions += other.transactions
+        self.revenue += other.revenue
+        self.categories |= other.categories
+        self.regions |= other.regions
+        for column, dtype in other.dtypes.items():
+            self._merge_dtype(column, dtype)
+        return self
+
+    def total_revenue_by_category(self):
+        """
+        Get total revenue per category.
+
+        Returns:
+            Series with revenue totals per category, sorted by revenue
+        """
+        return self._series(self.category_revenue, 'category').sort_values(ascending=False)
+
+    def top_products(self, n=5):
+        """
+        Get the top N products by revenue.
+
+        Args:
+            n: Number of top products to return
+
+        Returns:
+            Series with top N products and their revenues
+        """
+        return self._series(self.product_revenue, 'product').sort_values(ascending=False).head(n)
+
+    def average_by_region(self):
+        """
+        Get average revenue per transaction in each region.
+
+        Returns:
+            Series with average revenue per region, sorted descending
+        """
+        revenue = self._series(self.region_revenue, 'region')
+        count = self._series(self.region_count, 'region')
+        return (revenue / count).rename('revenue').sort_values(ascending=False)
+
+    def monthly_trend(self):
+        """
+        Get revenue per month.
+
+        Returns:
+            Series with monthly revenue totals, chronologically sorted
+        """
+        return self._series(self.monthly_revenue, 'month').sort_index()
+
+    def summary_statistics(self):
+        """
+        Get the summary statistics of SalesAnalyzer.summary_statistics.
+
+        Returns:
+            Dictionary with key summary statistics
+        """
+        return {
+            'total_transactions': self.transactions,
+            'total_revenue': self.revenue,
+            'average_revenue': self.revenue / self.transactions if self.transactions else float('nan'),
+            'categories': len(self.categories),
+            'regions': len(self.regions)
+        }
+
+    def _merge_dtype(self, column, dtype):
+        """Widen a grouping column's categorical dtype to the categories of another part."""
+        known = self.dtypes.get(column, dtype)
+        if known is None or dtype is None:
+            self.dtypes[column] = None
+        else:
+            # Categories sorted as when chunks are concatenated
+            self.dtypes[column] = pd.CategoricalDtype(sorted(set(known.categories) | set(dtype.categories)))
+
+    def _series(self, values, index_name):
+        """Return a named revenue Series, indexed like a group-by of the column."""
+        series = _series(values, index_name)
+        dtype = self.dtypes.get(index_name)
+        if dtype is not None:
+            series.index = series.index.astype(dtype)
+        return series
+
+def _group(data, column):
+    """Group revenue by a column, over the observed values of categoricals."""
+    return data.groupby(column, observed=True)['revenue']
+
+def _add(total, part):
+    """Add two per-group Series, treating missing groups as zero."""
+    if part is None:
+        return total
+
+    # Chunks may have different categories, so align on the plain values
+    if isinstance(part.index, pd.CategoricalIndex):
+        part = part.set_axis(part.index.astype(part.index.categories.dtype))
+
+    if total is None:
+        return part.copy()
+    return total.add(part, fill_value=0)
+
+def _series(values, index_name):
+    """Return a named revenue Series, empty if nothing was aggregated."""
+    if values is None:
+        return pd.Series(dtype=float, name='revenue').rename_axis(index_name)
+    return values.rename('revenue').rename_axis(index_name)
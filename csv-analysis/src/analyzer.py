@@ -1,5 +1,21 @@
 import pandas as pd
 from functools import reduce
+from .expressions import Expr, col
+from .aggregates import PartialAggregates
+from .schema import SALES_SCHEMA, read_csv, apply_schema, memory_usage
+from .cache import ColumnarCache
+from .reducers import grouped_reduce
+from .date_index import DateIndex
+from .partitions import map_ranges, read_range
+from .dataset import PartitionedDataset, is_partitioned, map_files
+from .query import Query, prune_arguments
+from .memo import ResultCache, memoized, DEFAULT_MAXSIZE, DEFAULT_MAX_BYTES
+
+# Source columns each derived column is computed from
+DERIVED_SOURCES = {
+    'revenue': ('quantity', 'price'),
+    'month': ('date',)
+}
 
 class SalesAnalyzer:
     """
@@ -9,39 +25,479 @@ class SalesAnalyzer:
     and functional programming paradigms for CSV data analysis.
     """
 
-    def __init__(self, csv_path):
+    def __init__(self, csv_path, chunksize=None, schema=SALES_SCHEMA, use_cache=False,
+                 cache_dir=None, result_cache_size=DEFAULT_MAXSIZE,
+                 result_cache_bytes=DEFAULT_MAX_BYTES, workers=None):
         """
         Initialize the analyzer with sales data from CSV file.
 
         Automatically calculates revenue and parses dates for time-series analysis.
+        Columns are typed by a schema: by default product, category and region
+        load as categoricals, integers as int64, floats as float32 where
+        lossless, and dates are parsed while reading.
+
+        Results of the standard analyses are memoized per method and
+        arguments, and discarded whenever the data changes.
+
+        With a chunksize, the analyzer runs in streaming mode for files larger
+        than memory: the file is read chunk by chunk into partial aggregates
+        that answer the standard analyses, and self.data stays None. Other
+        methods re-read the file chunk by chunk when called.
+
+        New transactions can be added with append and append_csv, which
+        update the aggregates by the new rows alone.
+
+        With more than one worker, the file is split into byte ranges at line
+        boundaries that are parsed in parallel processes: in streaming mode
+        each process computes partial aggregates for its range, which are
+        merged; otherwise each process returns its parsed rows, which are
+        concatenated. Results are the same as reading the file in one pass.
+
+        A directory or glob pattern of CSV files is read as one partitioned
+        dataset, in streaming mode: partitions are read only when a method
+        needs them, one whole file at a time without a chunksize, and in
+        parallel processes with workers. A manifest of each partition's date
+        range and categories lets date range and category queries skip
+        partitions that cannot match.
 
         Args:
-            csv_path: Path to the CSV file containing sales data
+            csv_path: Path to the CSV file containing sales data, or to a
+                     directory of CSV files, or a glob pattern matching them
+            chunksize: Optional number of rows per chunk; enables streaming mode
+            schema: Dictionary mapping column names to 'category', 'integer',
+                   'float' or 'date' (default: SALES_SCHEMA); None lets pandas
+                   infer every type
+            use_cache: Load the parsed and derived columns from a binary
+                      columnar cache next to the file when it is current,
+                      and write the cache after parsing otherwise
+                      (default: False; ignored in streaming mode)
+            cache_dir: Optional cache directory (default: the CSV path with a
+                      '.cache' suffix)
+            result_cache_size: Maximum number of memoized analysis results;
+                              0 disables memoization
+            result_cache_bytes: Maximum estimated size of the memoized
+                               results in bytes
+            workers: Optional number of processes to parse the file or
+                    partitions with, such as os.cpu_count() (default: parse
+                    in this process)
         """
-        self.data = pd.read_csv(csv_path)
+        self.results = ResultCache(result_cache_size, result_cache_bytes)
+        self.dataset = None
+        self.data_version = 0
+        self.date_index = None
+        self._appended = []
+        self._data = None
+        self._pending = []
+        self.csv_path = csv_path
+        self.chunksize = chunksize
+        self.schema = schema
+        self.workers = workers
+        self.aggregates = None
+        self.cache = None
+        self.cache_hit = False
+        self.csv_columns = None
+
+        parallel = workers is not None and workers > 1
+
+        if is_partitioned(csv_path):
+            # Partitions are aggregated on first use, like every other query
+            self.dataset = PartitionedDataset(csv_path, schema, workers=workers)
+            self.csv_columns = _header(self.dataset.paths[0])
+            self.data = None
+            return
+
+        if chunksize:
+            self.csv_columns = _header(csv_path)
+            self.data = None
+            self.aggregates = PartialAggregates()
+            if parallel:
+                for partials in map_ranges(_aggregate_range, csv_path, workers, schema, chunksize):
+                    self.aggregates.merge(partials)
+                return
+
+            for chunk in self._chunks():
+                self.aggregates.update(chunk)
+            return
+
+        # A current cache skips parsing and deriving columns altogether
+        if use_cache:
+            self.cache = ColumnarCache(csv_path, cache_dir)
+            self.data = self.cache.load(schema)
+            self.cache_hit = self.data is not None
+
+        if not self.cache_hit:
+            if parallel:
+                frames = map_ranges(_load_range, csv_path, workers, schema)
+                self.data = _concat(frames).reset_index(drop=True)
+            else:
+                self.data = _derive_columns(read_csv(csv_path, schema))
+            if self.cache:
+                self.cache.store(self.data, schema)
+        self.csv_columns = _source_columns(self.data.columns)
+
+    @property
+    def aggregates(self):
+        """
+        Totals behind the standard analyses, or None when computed from
+        self.data; built on first use for partitioned datasets.
+        """
+        if self._aggregates is None and self.dataset is not None:
+            self._aggregates = PartialAggregates()
+            paths = self.dataset.paths
+            for partials in map_files(_aggregate_file, paths, self.workers, self.schema, self.chunksize):
+                self._aggregates.merge(partials)
+        return self._aggregates
+
+    @aggregates.setter
+    def aggregates(self, aggregates):
+        self._aggregates = aggregates
+
+    @property
+    def data(self):
+        """The loaded sales data, including appended rows; None in streaming mode."""
+        if self._pending:
+            # Appended rows are joined to the data only when it is needed
+            self._data = _concat([self._data, *self._pending])
+            self._pending = []
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._pending = []
+        self.invalidate_results()
+
+    def invalidate_results(self):
+        """
+        Discard memoized analysis results, the date index and aggregates
+        maintained by append, by bumping the data version.
 
-        # Calculate revenue for each transaction
-        self.data['revenue'] = self.data['quantity'] * self.data['price']
+        Replacing self.data does this automatically; call it after modifying
+        the loaded data in place.
+        """
+        self._new_version()
+        if self._data is not None:
+            self.aggregates = None
 
-        # Parse dates for time-based filtering and analysis
-        self.data['date'] = pd.to_datetime(self.data['date'])
+    def _new_version(self):
+        """Bump the data version, discarding everything computed from the data."""
+        self.data_version += 1
+        self.results.clear()
+        self.date_index = None
 
-        # Extract month for time-series aggregation
-        self.data['month'] = self.data['date'].dt.to_period('M')
+    def append(self, rows):
+        """
+        Add transactions to the analyzer.
+
+        Only the new rows are typed and get revenue, date and month derived.
+        The totals behind the standard analyses (revenue by category,
+        product, region and month, and the summary statistics) are updated
+        by the new rows alone; in memory, they are computed from the loaded
+        data once, on the first append. The new rows join self.data the next
+        time it is used.
+
+        Args:
+            rows: DataFrame or list of dictionaries with the columns of the
+                 CSV file
+
+        Returns:
+            Number of rows added
+
+        Raises:
+            ValueError: If the rows do not have the columns of the CSV file
+        """
+        if len(rows) == 0:
+            return 0
+        new = apply_schema(self._conform(pd.DataFrame(rows)), self.schema)
+        return self._add(new)
+
+    def append_csv(self, csv_path):
+        """
+        Add the transactions of another CSV file with the same columns.
+
+        In streaming mode the file is read chunk by chunk, and later reads
+        of the data include it.
+
+        Args:
+            csv_path: Path of the CSV file to add
+
+        Returns:
+            Number of rows added
+
+        Raises:
+            ValueError: If the file does not have the columns of the CSV file
+        """
+        self._conform(pd.read_csv(csv_path, nrows=0))
+        if not self.streaming:
+            return self._add(read_csv(csv_path, self.schema))
+
+        added = 0
+        for chunk in read_csv(csv_path, self.schema, chunksize=self.chunksize):
+            self.aggregates.update(_derive_columns(chunk))
+            added += len(chunk)
+
+        self._appended.append(csv_path)
+        self._new_version()
+        return added
+
+    def _add(self, new):
+        """Add typed rows to the data and the aggregates."""
+        if self.streaming:
+            # Keep the rows as read, to be derived again with the file's chunks
+            new.index = pd.RangeIndex(self.aggregates.transactions, self.aggregates.transactions + len(new))
+            self._appended.append(new)
+            self.aggregates.update(_derive_columns(new.copy()))
+        else:
+            if self.aggregates is None:
+                self.aggregates = PartialAggregates.from_frame(self.data)
+
+            start = len(self._data) + sum(len(frame) for frame in self._pending)
+            new.index = pd.RangeIndex(start, start + len(new))
+            self._pending.append(_derive_columns(new))
+            self.aggregates.update(new)
+
+        self._new_version()
+        return len(new)
+
+    def _conform(self, rows):
+        """
+        Put new rows' columns in the order of the CSV file.
+
+        Raises:
+            ValueError: If columns are missing or unknown
+        """
+        columns = self.csv_columns
+        if set(rows.columns) != set(columns):
+            missing = sorted(set(columns) - set(rows.columns))
+            unknown = sorted(set(rows.columns) - set(columns))
+            raise ValueError(f"Appended rows must have the CSV columns; missing {missing}, unknown {unknown}")
+        return rows[columns]
+
+    def cache_info(self):
+        """
+        Get statistics of the memoized analysis results.
+
+        Returns:
+            CacheInfo with hits, misses, maxsize, currsize, bytes and max_bytes
+        """
+        return self.results.info()
+
+    @property
+    def streaming(self):
+        """Whether the analyzer reads its file in chunks instead of holding it in memory."""
+        return self._data is None
+
+    def _sources(self):
+        """Paths of the CSV files holding the data, in order."""
+        return self.dataset.paths if self.dataset is not None else [self.csv_path]
+
+    def _prune(self, **query):
+        """Select the partitions a query may match, or None to read everything."""
+        return self.dataset.prune(**query) if self.dataset is not None else None
+
+    def _chunks(self, columns=None, paths=None):
+        """
+        Read the CSV files chunk by chunk with derived columns added, followed
+        by appended files and rows.
+
+        Args:
+            columns: Optional columns to read, including derived ones;
+                    default all
+            paths: Optional subset of the files to read, in order; default all
+
+        Yields:
+            DataFrame chunks; row labels continue across chunks, and number
+            the rows of every file even when some are skipped
+        """
+        usecols = None
+        if columns is not None:
+            usecols = set()
+            for column in columns:
+                usecols.update(DERIVED_SOURCES.get(column, (column,)))
+
+        if paths is None:
+            paths = self._sources()
+        elif not paths:
+            # Nothing can match, but an empty chunk still gives results their columns
+            yield _derive_columns(read_range(self._sources()[0], 0, 0, self.schema, usecols=usecols))
+
+        offsets = self.dataset.offsets() if self.dataset is not None else {}
+        start = 0
+        for source in paths:
+            start = offsets.get(source, start)
+            for chunk in self._read(source, usecols):
+                chunk = _derive_columns(chunk.set_axis(pd.RangeIndex(start, start + len(chunk))))
+                start += len(chunk)
+                yield chunk
+
+        if self.dataset is not None:
+            start = self.dataset.rows
+        for source in self._appended:
+            for chunk in self._read(source, usecols):
+                chunk = _derive_columns(chunk.set_axis(pd.RangeIndex(start, start + len(chunk))))
+                start += len(chunk)
+                yield chunk
+
+    def _read(self, source, usecols):
+        """Get the chunks of a CSV file or of appended rows, without derived columns."""
+        if isinstance(source, pd.DataFrame):
+            return [source if usecols is None else source[[c for c in source.columns if c in usecols]]]
+        if not self.chunksize:
+            return [read_csv(source, self.schema, usecols=usecols)]
+        return read_csv(source, self.schema, usecols=usecols, chunksize=self.chunksize)
+
+    def _scan(self, predicate, paths=None):
+        """
+        Select the matching rows of data that is not held in memory.
+
+        Args:
+            predicate: Expr or row predicate, as for filter_by
+            paths: Optional subset of the files that may hold matching rows
+
+        Returns:
+            DataFrame of matching rows
+        """
+        frames = []
+        if self.dataset is not None and self.workers and self.workers > 1 and isinstance(predicate, Expr):
+            # Expressions can be sent to worker processes, each filtering whole partitions
+            paths = self.dataset.paths if paths is None else paths
+            offsets = self.dataset.offsets()
+            for path, frame in zip(paths, map_files(_filter_file, paths, self.workers, self.schema, predicate)):
+                frames.append(frame.set_axis(frame.index + offsets[path]))
+            paths = []
+
+        frames.extend(_filter(chunk, predicate) for chunk in self._chunks(paths=paths))
+        return _concat(frames)
+
+    def columns(self):
+        """
+        Get the names of the columns of the data, including derived ones.
+
+        Returns:
+            List of column names
+        """
+        if not self.streaming:
+            return list(self.data.columns)
+
+        columns = self.csv_columns
+        derived = [name for name, sources in DERIVED_SOURCES.items()
+                   if set(sources) <= set(columns) and name not in columns]
+        return columns + derived
+
+    def query(self):
+        """
+        Start a lazy query over the data.
+
+        Steps added to the query run only on collect(), after the plan is
+        optimized: filters are fused and applied while the rows are loaded,
+        and only the columns the query uses are read. See Query.
+
+        Returns:
+            Query
+        """
+        return Query(self)
+
+    def _load(self, columns=None, predicate=None):
+        """
+        Load the rows matching a predicate, with only some columns.
+
+        In streaming mode the predicate is applied chunk by chunk as the
+        rows are read, skipping partitions it rules out.
+
+        Args:
+            columns: Optional set of columns to keep, including derived ones
+            predicate: Optional Expr the rows must match
+
+        Returns:
+            DataFrame, never a view of self.data
+        """
+        if not self.streaming:
+            data = self.data
+            if columns is not None:
+                data = data[[column for column in data.columns if column in columns]]
+            if predicate is not None:
+                data = data[predicate.mask(data)]
+            # Selections above already copy; without one, copy explicitly, as
+            # a shallow copy still aliases self.data unless Copy-on-Write is on
+            return data.copy() if data is self.data else data
+
+        frames = []
+        for chunk in self._chunks(columns, self._prune(**prune_arguments(predicate))):
+            if columns is not None:
+                chunk = chunk[[column for column in chunk.columns if column in columns]]
+            frames.append(chunk if predicate is None else chunk[predicate.mask(chunk)])
+        return _concat(frames)
+
+    def memory_report(self, baseline=False):
+        """
+        Report the memory used by each column of the loaded data.
+
+        Args:
+            baseline: Also load the file with inferred types, as without a
+                     schema, and report its memory use for comparison
+
+        Returns:
+            DataFrame indexed by column with 'dtype' and 'bytes', plus a
+            'total' row; with baseline, also 'baseline_dtype',
+            'baseline_bytes' and 'ratio' (bytes / baseline_bytes)
+
+        Raises:
+            ValueError: In streaming mode, where no data is held in memory
+        """
+        if self.streaming:
+            raise ValueError("memory_report needs the data in memory; streaming mode holds none")
+
+        report = memory_usage(self.data)
+        if not baseline:
+            return report
+
+        inferred = memory_usage(_derive_columns(pd.read_csv(self.csv_path)))
+        report['baseline_dtype'] = inferred['dtype']
+        report['baseline_bytes'] = inferred['bytes']
+        report['ratio'] = report['bytes'] / report['baseline_bytes']
+        return report
+
+    def index_dates(self):
+        """
+        Build a sorted date index for fast date range queries.
+
+        Once built, filter_date_range, revenue_between and quantity_between
+        find ranges by binary search instead of testing every row, and the
+        totals come from running sums in O(log n). The index is dropped
+        whenever the data changes.
+
+        Returns:
+            DateIndex over the loaded data
+
+        Raises:
+            ValueError: In streaming mode, where no data is held in memory
+        """
+        if self.streaming:
+            raise ValueError("index_dates needs the data in memory; streaming mode holds none")
+
+        self.date_index = DateIndex(self.data)
+        return self.date_index
 
     def filter_by(self, predicate):
         """
-        Filter data using a lambda predicate function.
+        Filter data using a column expression or a lambda predicate function.
 
-        Demonstrates functional programming with lambda expressions for filtering.
+        Column expressions, such as (col('quantity') > 5) & (col('region') == 'North'),
+        are evaluated as vectorized boolean masks over whole columns. Any other
+        callable is applied row by row, which is much slower on large data.
 
         Args:
-            predicate: Lambda function that takes a row and returns boolean
+            predicate: Expr built with col(), or lambda function that takes a
+                      row and returns boolean
 
         Returns:
             Filtered DataFrame copy
         """
-        return self.data[self.data.apply(predicate, axis=1)].copy()
+        if self.streaming:
+            paths = self._prune(**prune_arguments(predicate)) if isinstance(predicate, Expr) else None
+            return self._scan(predicate, paths)
+
+        return _filter(self.data, predicate).copy()
 
     def map_field(self, mapper):
         """
@@ -55,6 +511,9 @@ class SalesAnalyzer:
         Returns:
             Series of transformed values
         """
+        if self.streaming:
+            return pd.concat([chunk.apply(mapper, axis=1) for chunk in self._chunks()])
+
         return self.data.apply(mapper, axis=1)
 
     def reduce_by_field(self, field, reducer, initial=0):
@@ -71,6 +530,13 @@ class SalesAnalyzer:
         Returns:
             Final reduced value
         """
+        if self.streaming:
+            # Carry the accumulator from one chunk to the next
+            result = initial
+            for chunk in self._chunks([field]):
+                result = reduce(reducer, chunk[field], result)
+            return result
+
         return reduce(reducer, self.data[field], initial)
 
     def group_and_aggregate(self, group_by, agg_field, agg_func):
@@ -87,8 +553,14 @@ class SalesAnalyzer:
         Returns:
             Series with grouped and aggregated results, sorted descending
         """
-        return self.data.groupby(group_by)[agg_field].apply(agg_func).sort_values(ascending=False)
+        data = self.data
+        if self.streaming:
+            # Arbitrary aggregations need whole groups, so load only the two columns
+            data = _concat(list(self._chunks([group_by, agg_field])))
+
+        return data.groupby(group_by, observed=True)[agg_field].apply(agg_func).sort_values(ascending=False)
 
+    @memoized
     def total_revenue_by_category(self):
         """
         Calculate total revenue for each category using lambda aggregation.
@@ -96,8 +568,12 @@ class SalesAnalyzer:
         Returns:
             Series with revenue totals per category, sorted by revenue
         """
+        if self.aggregates is not None:
+            return self.aggregates.total_revenue_by_category()
+
         return self.group_and_aggregate('category', 'revenue', lambda x: x.sum())
 
+    @memoized
     def top_products(self, n=5):
         """
         Find top N products by revenue using lambda aggregation.
@@ -108,8 +584,12 @@ class SalesAnalyzer:
         Returns:
             Series with top N products and their revenues
         """
+        if self.aggregates is not None:
+            return self.aggregates.top_products(n)
+
         return self.group_and_aggregate('product', 'revenue', lambda x: x.sum()).head(n)
 
+    @memoized
     def average_by_region(self):
         """
         Calculate average revenue per region using lambda aggregation.
@@ -117,8 +597,12 @@ class SalesAnalyzer:
         Returns:
             Series with average revenue per region
         """
+        if self.aggregates is not None:
+            return self.aggregates.average_by_region()
+
         return self.group_and_aggregate('region', 'revenue', lambda x: x.mean())
 
+    @memoized
     def monthly_trend(self):
         """
         Analyze monthly sales trend using time-series grouping.
@@ -128,11 +612,14 @@ class SalesAnalyzer:
         Returns:
             Series with monthly revenue totals, chronologically sorted
         """
+        if self.aggregates is not None:
+            return self.aggregates.monthly_trend()
+
         return self.data.groupby('month')['revenue'].apply(lambda x: x.sum()).sort_index()
 
     def filter_high_quantity(self, threshold):
         """
-        Filter transactions with quantity above threshold using lambda.
+        Filter transactions with quantity above threshold.
 
         Args:
             threshold: Minimum quantity value
@@ -140,11 +627,11 @@ class SalesAnalyzer:
         Returns:
             Filtered DataFrame with high-quantity transactions
         """
-        return self.filter_by(lambda row: row['quantity'] > threshold)
+        return self.filter_by(col('quantity') > threshold)
 
     def filter_by_category(self, category):
         """
-        Filter transactions by category using lambda predicate.
+        Filter transactions by category.
 
         Args:
             category: Category name to filter by
@@ -152,11 +639,17 @@ class SalesAnalyzer:
         Returns:
             Filtered DataFrame with matching category
         """
-        return self.filter_by(lambda row: row['category'] == category)
+        if self.dataset is not None:
+            return self._scan(col('category') == category, self.dataset.prune(category=category))
+
+        return self.filter_by(col('category') == category)
 
     def filter_date_range(self, start_date, end_date):
         """
-        Filter transactions within date range using lambda predicate.
+        Filter transactions within date range, both ends inclusive.
+
+        With a date index (see index_dates), the range is found by binary
+        search; rows keep their original order either way.
 
         Args:
             start_date: Start date string (YYYY-MM-DD)
@@ -165,9 +658,54 @@ class SalesAnalyzer:
         Returns:
             Filtered DataFrame with transactions in date range
         """
+        if self.date_index is not None:
+            return self.data.iloc[self.date_index.rows_between(start_date, end_date)].copy()
+
         start = pd.to_datetime(start_date)
         end = pd.to_datetime(end_date)
-        return self.filter_by(lambda row: start <= row['date'] <= end)
+        if self.dataset is not None:
+            return self._scan(col('date').between(start, end), self.dataset.prune(start_date=start, end_date=end))
+
+        return self.filter_by(col('date').between(start, end))
+
+    def revenue_between(self, start_date, end_date):
+        """
+        Total the revenue of transactions within a date range, both ends inclusive.
+
+        Args:
+            start_date: Start date string (YYYY-MM-DD)
+            end_date: End date string (YYYY-MM-DD)
+
+        Returns:
+            Revenue total
+        """
+        if self.date_index is not None:
+            return self.date_index.revenue_between(start_date, end_date)
+        return float(self._total_between('revenue', start_date, end_date))
+
+    def quantity_between(self, start_date, end_date):
+        """
+        Total the quantity sold within a date range, both ends inclusive.
+
+        Args:
+            start_date: Start date string (YYYY-MM-DD)
+            end_date: End date string (YYYY-MM-DD)
+
+        Returns:
+            Quantity total
+        """
+        if self.date_index is not None:
+            return self.date_index.quantity_between(start_date, end_date)
+        return int(self._total_between('quantity', start_date, end_date))
+
+    def _total_between(self, field, start_date, end_date):
+        """Sum a field over a date range by scanning the rows, without an index."""
+        within = col('date').between(pd.to_datetime(start_date), pd.to_datetime(end_date))
+        if self.streaming:
+            frames = self._chunks(['date', field], self._prune(start_date=start_date, end_date=end_date))
+        else:
+            frames = [self.data]
+        return sum(data.loc[within.mask(data), field].sum() for data in frames)
 
     def top_n_by_metric(self, n, metric_func):
         """
@@ -182,6 +720,16 @@ class SalesAnalyzer:
         Returns:
             DataFrame with top N items by custom metric
         """
+        if self.streaming:
+            # Keep each chunk's top N rows, then pick the top N of those
+            candidates = []
+            for chunk in self._chunks():
+                metrics = chunk.apply(metric_func, axis=1)
+                candidates.append(chunk.loc[metrics.nlargest(n).index].assign(_metric=metrics))
+
+            candidates = _concat(candidates)
+            return candidates.loc[candidates['_metric'].nlargest(n).index].drop(columns='_metric')
+
         # Map custom metric across all rows
         metrics = self.map_field(metric_func)
 
@@ -190,32 +738,36 @@ class SalesAnalyzer:
 
         return self.data.loc[indices]
 
-    def aggregate_with_reduce(self, group_field):
+    def aggregate_with_reduce(self, group_field, reducer='sum', field='revenue', initial=None):
         """
-        Group and sum using functional reduce pattern.
+        Group and reduce a field using a functional reduce pattern.
 
-        Demonstrates manual grouping with reduce and lambda expressions.
+        Each group's result is reduce(reducer, values, initial), computed
+        without iterating over rows: addition, multiplication, min and max
+        (as operator/builtin/numpy functions or by name) run as vectorized
+        group-by kernels, and other reducers are applied to each group's
+        values as a plain array.
 
         Args:
             group_field: Field to group by
+            reducer: Lambda function for reduction (acc, value) => result, or
+                    one of 'sum', 'prod', 'min' and 'max' (default: 'sum')
+            field: Field to reduce (default: 'revenue')
+            initial: Optional initial accumulator value of every group
 
         Returns:
-            Dictionary with group keys and revenue totals
+            Dictionary with group keys and reduced values
         """
-        # Manual grouping using iteration
-        groups = {}
-        for _, row in self.data.iterrows():
-            key = row[group_field]
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(row['revenue'])
+        frames = self._chunks([group_field, field]) if self.streaming else [self.data]
 
-        # Apply reduce with lambda to each group
-        return {
-            key: reduce(lambda acc, val: acc + val, values, 0)
-            for key, values in groups.items()
-        }
+        # One chunk at a time in streaming mode, continuing earlier chunks' totals
+        totals = {}
+        for data in frames:
+            grouped_reduce(data, group_field, field, reducer, initial, totals)
 
+        return totals
+
+    @memoized
     def summary_statistics(self):
         """
         Generate summary statistics using various functional operations.
@@ -225,6 +777,9 @@ class SalesAnalyzer:
         Returns:
             Dictionary with key summary statistics
         """
+        if self.aggregates is not None:
+            return self.aggregates.summary_statistics()
+
         return {
             'total_transactions': len(self.data),
             'total_revenue': self.reduce_by_field('revenue', lambda acc, x: acc + x),
@@ -232,3 +787,93 @@ class SalesAnalyzer:
             'categories': self.data['category'].nunique(),
             'regions': self.data['region'].nunique()
         }
+
+def _header(path):
+    """Read the column names of a CSV file."""
+    return list(pd.read_csv(path, nrows=0).columns)
+
+def _source_columns(columns):
+    """Drop the derived columns computed from others from a list of columns."""
+    return [column for column in columns
+            if not (column in DERIVED_SOURCES and set(DERIVED_SOURCES[column]) <= set(columns))]
+
+def _derive_columns(data):
+    """
+    Add revenue and month columns and parse dates, for the columns present.
+
+    Args:
+        data: DataFrame of raw CSV rows
+
+    Returns:
+        The same DataFrame, modified in place
+    """
+    # Calculate revenue for each transaction, in float64 whatever the input widths
+    if 'quantity' in data and 'price' in data:
+        data['revenue'] = data['quantity'].astype('float64') * data['price'].astype('float64')
+
+    if 'date' in data:
+        # Parse dates for time-based filtering and analysis, unless the schema already did
+        if not pd.api.types.is_datetime64_any_dtype(data['date']):
+            data['date'] = pd.to_datetime(data['date'])
+
+        # Extract month for time-series aggregation
+        data['month'] = data['date'].dt.to_period('M')
+
+    return data
+
+def _load_range(path, start, end, schema):
+    """Parse one byte range of a CSV file with derived columns, in a worker process."""
+    return _derive_columns(read_range(path, start, end, schema))
+
+def _aggregate_range(path, start, end, schema, chunksize):
+    """Compute partial aggregates for one byte range of a CSV file, in a worker process."""
+    partials = PartialAggregates()
+    for chunk in read_range(path, start, end, schema, chunksize=chunksize):
+        partials.update(_derive_columns(chunk))
+    return partials
+
+def _aggregate_file(path, schema, chunksize):
+    """Compute partial aggregates for one partition of a dataset, in a worker process."""
+    chunks = read_csv(path, schema, chunksize=chunksize) if chunksize else [read_csv(path, schema)]
+    partials = PartialAggregates()
+    for chunk in chunks:
+        partials.update(_derive_columns(chunk))
+    return partials
+
+def _filter_file(path, schema, predicate):
+    """Select the matching rows of one partition of a dataset, in a worker process."""
+    return _filter(_derive_columns(read_csv(path, schema)), predicate)
+
+def _filter(data, predicate):
+    """Select the rows of a DataFrame matching an expression or row predicate."""
+    if isinstance(predicate, Expr):
+        return data[predicate.mask(data)]
+
+    return data[data.apply(predicate, axis=1)]
+
+def _concat(frames):
+    """
+    Concatenate DataFrame chunks read separately.
+
+    Categorical columns get the union of every chunk's categories, including
+    chunks with no rows left, so they stay categorical as in a single read.
+
+    Args:
+        frames: List of DataFrames with the same columns
+
+    Returns:
+        Concatenated DataFrame, empty with the same columns if no rows remain
+    """
+    if not frames:
+        return pd.DataFrame()
+
+    for column in frames[0].columns:
+        dtypes = [frame[column].dtype for frame in frames]
+        if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            categories = sorted(set().union(*(dtype.categories for dtype in dtypes)))
+            frames = [
+                frame.assign(**{column: frame[column].cat.set_categories(categories)})
+                for frame in frames
+            ]
+
+    return pd.concat([frame for frame in frames if len(frame)] or frames[:1])
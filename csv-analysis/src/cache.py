@@ -0,0 +1,211 @@
+"""
+Binary columnar cache of parsed CSV files.
+
+Parsed and derived columns are stored as one .npy file per column in a
+directory next to the source file, with a JSON manifest describing the
+source they were built from. A load checks the source's size, modification
+time and content hash against the manifest, so a stale cache is never used;
+loading a valid cache skips CSV parsing entirely.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Bumped whenever the on-disk layout or column types change, invalidating older caches
+CACHE_VERSION = 2
+
+# Bytes hashed per read when fingerprinting the source file
+HASH_BLOCK_SIZE = 1 << 20
+
+class ColumnarCache:
+    """
+    Cache of a parsed CSV file as binary columns.
+
+    Numeric, boolean and datetime columns are saved as raw arrays,
+    categoricals as integer codes plus their categories, periods as integer
+    ordinals, and string columns as codes into their distinct values.
+    """
+
+    def __init__(self, csv_path, cache_dir=None):
+        """
+        Initialize the cache for a source file.
+
+        Args:
+            csv_path: Path of the source CSV file
+            cache_dir: Optional cache directory (default: the source path
+                      with a '.cache' suffix)
+        """
+        self.csv_path = os.path.abspath(csv_path)
+        self.cache_dir = cache_dir or self.csv_path + '.cache'
+        self.manifest_path = os.path.join(self.cache_dir, 'manifest.json')
+
+    def fingerprint(self):
+        """
+        Identify the current contents of the source file.
+
+        Returns:
+            Dictionary with 'path', 'size', 'mtime_ns' and 'hash' (BLAKE2b of
+            the file contents)
+        """
+        stat = os.stat(self.csv_path)
+        digest = hashlib.blake2b(digest_size=16)
+        with open(self.csv_path, 'rb') as file:
+            for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+
+        return {
+            'path': self.csv_path,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': digest.hexdigest()
+        }
+
+    def load(self, schema=None):
+        """
+        Load the cached columns if they match the source file and schema.
+
+        Args:
+            schema: Schema the data must have been loaded with
+
+        Returns:
+            DataFrame, or None if there is no valid cache
+        """
+        try:
+            with open(self.manifest_path) as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get('version') != CACHE_VERSION or manifest.get('schema') != _plain(schema):
+            return None
+
+        # Cheap checks first, then the content hash
+        source = manifest.get('source', {})
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return None
+        if source.get('size') != stat.st_size or source.get('mtime_ns') != stat.st_mtime_ns:
+            return None
+        if source != self.fingerprint():
+            return None
+
+        try:
+            columns = {
+                column['name']: _decode(column, np.load(os.path.join(self.cache_dir, column['file'])))
+                for column in manifest['columns']
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return pd.DataFrame(columns)
+
+    def store(self, data, schema=None):
+        """
+        Save a parsed DataFrame as the cache of the source file.
+
+        The manifest is written last, replacing any previous one atomically,
+        so an interrupted store leaves no valid cache behind.
+
+        Args:
+            data: DataFrame parsed from the source file
+            schema: Schema the data was loaded with
+
+        Returns:
+            True if the data was cached, False if a column cannot be stored
+            (such as an object column of mixed types)
+        """
+        encoded = []
+        for index, name in enumerate(data.columns):
+            column = _encode(data[name])
+            if column is None:
+                return False
+            encoded.append((f'{index}.npy', name, column))
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.invalidate()
+
+        columns = []
+        for file_name, name, (values, meta) in encoded:
+            np.save(os.path.join(self.cache_dir, file_name), values, allow_pickle=False)
+            columns.append({'name': name, 'file': file_name, **meta})
+
+        manifest = {
+            'version': CACHE_VERSION,
+            'source': self.fingerprint(),
+            'schema': _plain(schema),
+            'rows': len(data),
+            'columns': columns
+        }
+
+        temporary = self.manifest_path + '.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(manifest, file)
+        os.replace(temporary, self.manifest_path)
+        return True
+
+    def invalidate(self):
+        """
+        Remove the manifest, so the cached columns are no longer used.
+        """
+        try:
+            os.remove(self.manifest_path)
+        except FileNotFoundError:
+            pass
+
+def _encode(series):
+    """
+    Convert a column to an array and the metadata needed to restore it.
+
+    Returns:
+        Tuple of (numpy array, metadata dictionary), or None if the column
+        cannot be stored without pickling
+    """
+    dtype = series.dtype
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), {
+            'kind': 'category',
+            'categories': series.cat.categories.tolist(),
+            'ordered': bool(dtype.ordered)
+        }
+
+    if isinstance(dtype, pd.PeriodDtype):
+        return series.array.asi8, {'kind': 'period', 'dtype': str(dtype)}
+
+    if pd.api.types.is_string_dtype(dtype):
+        if pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+            return None
+        codes, uniques = pd.factorize(series)
+        return codes, {'kind': 'string', 'values': uniques.tolist(), 'dtype': str(dtype)}
+
+    if dtype.kind in 'biufcmM':
+        return series.to_numpy(), {'kind': 'array'}
+
+    return None
+
+def _decode(column, values):
+    """Restore a column saved by _encode."""
+    kind = column['kind']
+
+    if kind == 'category':
+        return pd.Categorical.from_codes(values, categories=column['categories'],
+                                         ordered=column['ordered'])
+
+    if kind == 'period':
+        return pd.arrays.PeriodArray(values, dtype=pd.api.types.pandas_dtype(column['dtype']))
+
+    if kind == 'string':
+        # Code -1 marks a missing value
+        categorical = pd.Categorical.from_codes(values, categories=column['values'])
+        return pd.Series(categorical).astype(column['dtype'])
+
+    return values
+
+def _plain(schema):
+    """Return the schema as JSON-compatible data for comparison."""
+    return dict(schema) if schema is not None else None
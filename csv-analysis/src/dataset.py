@@ -0,0 +1,252 @@
+"""
+Datasets partitioned over several CSV files.
+
+A partitioned dataset is a directory of CSV files, or a glob pattern
+matching them, such as one file per day or month, all with the same
+columns. A small JSON manifest records each partition's row count, date
+range and categories, so queries can skip whole files that cannot hold
+matching rows. The manifest is kept next to the files and refreshed only
+for partitions whose size or modification time changed.
+"""
+
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .schema import read_csv
+
+# Bumped whenever the manifest layout changes, invalidating older manifests
+MANIFEST_VERSION = 1
+
+# File name of the manifest, kept next to the partitions
+MANIFEST_NAME = '_manifest.json'
+
+def is_partitioned(source):
+    """
+    Whether a source path names a partitioned dataset rather than one file.
+
+    Args:
+        source: Path of a file or directory, or a glob pattern
+
+    Returns:
+        True for directories and glob patterns
+    """
+    return os.path.isdir(source) or glob.has_magic(source)
+
+class PartitionedDataset:
+    """
+    CSV files read as one dataset, with per-partition statistics.
+
+    Partitions are ordered by path, and their rows are numbered in that
+    order as if the files were concatenated.
+    """
+
+    def __init__(self, source, schema=None, manifest_path=None, workers=None):
+        """
+        Find the partitions and load or build their statistics.
+
+        Args:
+            source: Directory of CSV files, or a glob pattern matching them
+            schema: Optional schema for reading partitions
+            manifest_path: Optional manifest location (default:
+                          '_manifest.json' in the partitions' common directory)
+            workers: Optional number of processes computing missing statistics
+
+        Raises:
+            ValueError: If no CSV files match the source
+        """
+        pattern = os.path.join(source, '*.csv') if os.path.isdir(source) else source
+        self.source = source
+        self.schema = schema
+        # A broad pattern such as 'dir/*' also matches the manifest and its temporary file
+        manifests = (MANIFEST_NAME, MANIFEST_NAME + '.tmp')
+        self.paths = sorted(os.path.abspath(path) for path in glob.glob(pattern)
+                            if os.path.basename(path) not in manifests)
+        if not self.paths:
+            raise ValueError(f"No CSV files match '{source}'")
+
+        directory = os.path.commonpath([os.path.dirname(path) for path in self.paths])
+        self.manifest_path = manifest_path or os.path.join(directory, MANIFEST_NAME)
+        self.partitions = {}
+        self.refresh(workers)
+
+    def refresh(self, workers=None):
+        """
+        Recompute the statistics of new and changed partitions.
+
+        Statistics are computed from the date and category columns alone, in
+        parallel with workers. The manifest is rewritten if anything changed;
+        a manifest that cannot be written is skipped silently.
+
+        Args:
+            workers: Optional number of processes
+
+        Returns:
+            Number of partitions whose statistics were recomputed
+        """
+        directory = os.path.dirname(self.manifest_path)
+        stored = self._read_manifest()
+
+        partitions, stale = {}, []
+        for path in self.paths:
+            stat = os.stat(path)
+            entry = stored.get(os.path.relpath(path, directory))
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                partitions[path] = entry
+            else:
+                stale.append(path)
+
+        for path, stats in zip(stale, map_files(partition_stats, stale, workers, self.schema)):
+            partitions[path] = stats
+        self.partitions = partitions
+
+        if stale or len(stored) != len(partitions):
+            self._write_manifest(directory)
+        return len(stale)
+
+    @property
+    def rows(self):
+        """Total number of rows over all partitions."""
+        return sum(self.partitions[path]['rows'] for path in self.paths)
+
+    def offsets(self):
+        """
+        Get the label of each partition's first row.
+
+        Returns:
+            Dictionary mapping partition paths to row offsets
+        """
+        offsets, start = {}, 0
+        for path in self.paths:
+            offsets[path] = start
+            start += self.partitions[path]['rows']
+        return offsets
+
+    def prune(self, start_date=None, end_date=None, category=None):
+        """
+        Select the partitions that may hold rows matching a query.
+
+        Partitions without rows are always skipped; partitions whose date
+        range or categories are unknown are always kept.
+
+        Args:
+            start_date: Optional first date of the query range
+            end_date: Optional last date of the query range
+            category: Optional category the rows must have
+
+        Returns:
+            List of partition paths, in order
+        """
+        start = pd.Timestamp(start_date) if start_date is not None else None
+        end = pd.Timestamp(end_date) if end_date is not None else None
+
+        selected = []
+        for path in self.paths:
+            stats = self.partitions[path]
+            if stats['rows'] == 0:
+                continue
+            if stats['min_date'] is not None:
+                if start is not None and pd.Timestamp(stats['max_date']) < start:
+                    continue
+                if end is not None and pd.Timestamp(stats['min_date']) > end:
+                    continue
+            if category is not None and stats['categories'] is not None and category not in stats['categories']:
+                continue
+            selected.append(path)
+        return selected
+
+    def _read_manifest(self):
+        """Load the stored partition statistics, or none if missing or outdated."""
+        try:
+            with open(self.manifest_path) as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if manifest.get('version') != MANIFEST_VERSION or manifest.get('schema') != _plain(self.schema):
+            return {}
+        return manifest.get('partitions', {})
+
+    def _write_manifest(self, directory):
+        """Save the partition statistics, replacing the manifest atomically."""
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'schema': _plain(self.schema),
+            'partitions': {os.path.relpath(path, directory): stats for path, stats in self.partitions.items()}
+        }
+
+        temporary = self.manifest_path + '.tmp'
+        try:
+            with open(temporary, 'w') as file:
+                json.dump(manifest, file, indent=1)
+            os.replace(temporary, self.manifest_path)
+        except OSError:
+            pass
+
+def partition_stats(path, schema=None):
+    """
+    Compute the manifest statistics of one partition.
+
+    Args:
+        path: Path of the CSV file
+        schema: Optional schema for reading it
+
+    Returns:
+        Dictionary with 'size', 'mtime_ns', 'rows', 'min_date' and
+        'max_date' (ISO strings, None without dates) and 'categories'
+        (sorted list, None without a category column)
+    """
+    stat = os.stat(path)
+    header = list(pd.read_csv(path, nrows=0).columns)
+    usecols = [column for column in ('date', 'category') if column in header] or header[:1]
+    data = read_csv(path, schema, usecols=usecols)
+
+    min_date = max_date = None
+    if 'date' in data:
+        dates = pd.to_datetime(data['date'], format='ISO8601').dropna()
+        if len(dates):
+            min_date, max_date = dates.min().isoformat(), dates.max().isoformat()
+
+    categories = None
+    if 'category' in data:
+        categories = sorted(str(value) for value in data['category'].dropna().unique())
+
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'rows': len(data),
+        'min_date': min_date,
+        'max_date': max_date,
+        'categories': categories
+    }
+
+def map_files(function, paths, workers, *args):
+    """
+    Apply a function to several files, in a process pool with workers.
+
+    The function must be defined at module level so it can be sent to the
+    worker processes.
+
+    Args:
+        function: Callable taking (path, *args)
+        paths: Paths of the files
+        workers: Optional number of worker processes; None or 1 runs the
+                calls in this process
+        *args: Further arguments passed to every call
+
+    Returns:
+        List of the function's results, in the order of paths
+    """
+    if workers is None or workers <= 1 or len(paths) <= 1:
+        return [function(path, *args) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        futures = [pool.submit(function, path, *args) for path in paths]
+        return [future.result() for future in futures]
+
+def _plain(schema):
+    """Return the schema as JSON-compatible data for comparison."""
+    return dict(schema) if schema is not None else None
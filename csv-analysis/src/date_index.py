@@ -0,0 +1,133 @@
+"""
+Sorted date index for fast date range queries.
+
+The index keeps the row positions of the data in date order, the sorted
+dates as integers, and running totals of revenue and quantity in that
+order. A date range maps to a contiguous slice of the sorted rows by binary
+search, so range totals take O(log n) time without selecting any rows.
+"""
+
+import numpy as np
+import pandas as pd
+
+class DateIndex:
+    """
+    Binary-search index over the date column of a DataFrame.
+
+    Rows with a missing date are left out of the index, so no range
+    contains them.
+    """
+
+    def __init__(self, data):
+        """
+        Build the index, sorting the rows by date once.
+
+        Args:
+            data: DataFrame with a datetime 'date' column, and optionally
+                 'revenue' and 'quantity' columns
+        """
+        dates = data['date']
+        valid = np.flatnonzero(dates.notna().to_numpy())
+        values = dates.to_numpy()[valid].astype('datetime64[ns]').view('int64')
+
+        # Stable, so rows with the same date keep their original order
+        order = np.argsort(values, kind='stable')
+        self.positions = valid[order]
+        self.dates = values[order]
+        self.rows = len(data)
+
+        # Already sorted data lets ranges be returned as slices of the original rows
+        self.monotonic = len(self.positions) == self.rows and bool(np.all(np.diff(self.positions) == 1))
+
+        self.revenue = _prefix_sums(data, 'revenue', self.positions, 'float64')
+        self.quantity = _prefix_sums(data, 'quantity', self.positions, 'int64')
+
+    def __len__(self):
+        """Number of indexed rows."""
+        return len(self.dates)
+
+    def bounds(self, start_date, end_date):
+        """
+        Find the slice of sorted rows within a date range, both ends inclusive.
+
+        Args:
+            start_date: Start date (string, Timestamp or datetime)
+            end_date: End date (string, Timestamp or datetime)
+
+        Returns:
+            Tuple of (low, high) positions in the sorted rows
+        """
+        low = np.searchsorted(self.dates, _nanoseconds(start_date), side='left')
+        high = np.searchsorted(self.dates, _nanoseconds(end_date), side='right')
+        return int(low), int(max(low, high))
+
+    def rows_between(self, start_date, end_date):
+        """
+        Get the row positions within a date range, in their original order.
+
+        Args:
+            start_date: Start date (string, Timestamp or datetime)
+            end_date: End date (string, Timestamp or datetime)
+
+        Returns:
+            slice of the rows if the data is sorted by date, else a sorted
+            array of row positions
+        """
+        low, high = self.bounds(start_date, end_date)
+        if self.monotonic:
+            return slice(low, high)
+        return np.sort(self.positions[low:high])
+
+    def count_between(self, start_date, end_date):
+        """
+        Count the rows within a date range, both ends inclusive.
+
+        Returns:
+            Number of rows
+        """
+        low, high = self.bounds(start_date, end_date)
+        return high - low
+
+    def revenue_between(self, start_date, end_date):
+        """
+        Total the revenue within a date range, both ends inclusive.
+
+        Returns:
+            Revenue total (float)
+
+        Raises:
+            ValueError: If the indexed data had no revenue column
+        """
+        return float(_range_total(self.revenue, 'revenue', *self.bounds(start_date, end_date)))
+
+    def quantity_between(self, start_date, end_date):
+        """
+        Total the quantity within a date range, both ends inclusive.
+
+        Returns:
+            Quantity total (int)
+
+        Raises:
+            ValueError: If the indexed data had no quantity column
+        """
+        return int(_range_total(self.quantity, 'quantity', *self.bounds(start_date, end_date)))
+
+def _prefix_sums(data, column, positions, dtype):
+    """Running totals of a column in index order, starting at zero; None if absent."""
+    if column not in data:
+        return None
+
+    values = data[column].to_numpy(dtype=dtype, na_value=0)[positions]
+    sums = np.zeros(len(values) + 1, dtype=dtype)
+    np.cumsum(values, out=sums[1:])
+    return sums
+
+def _range_total(sums, column, low, high):
+    """Total of the sorted rows low to high from their prefix sums."""
+    if sums is None:
+        raise ValueError(f"The date index has no '{column}' totals")
+    return sums[high] - sums[low]
+
+def _nanoseconds(date):
+    """Convert a date to nanoseconds since the epoch, as stored in the index."""
+    return pd.Timestamp(date).as_unit('ns').value
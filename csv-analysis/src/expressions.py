@@ -0,0 +1,399 @@
+"""
+Column expressions for vectorized predicates and computed values.
+
+Expressions are built from column references and literals with Python
+operators, and evaluate against a whole DataFrame at once:
+
+    (col('quantity') > 5) & col('region').isin(['North', 'East'])
+
+As with pandas masks, comparisons must be parenthesized when combined with
+& and |, because those operators bind more tightly than comparisons.
+"""
+
+import operator
+
+import numpy as np
+import pandas as pd
+
+
+class Expr:
+    """
+    Base class of column expressions.
+
+    Subclasses implement evaluate, which computes the expression for every row
+    of a DataFrame as a Series (or a scalar for literals), and columns, which
+    lists the columns the expression reads.
+    """
+
+    def evaluate(self, data):
+        """
+        Compute the expression for every row of a DataFrame.
+
+        Args:
+            data: DataFrame to evaluate against
+
+        Returns:
+            Series aligned with data, or a scalar for constant expressions
+        """
+        raise NotImplementedError
+
+    def columns(self):
+        """
+        Get the names of the columns the expression reads.
+
+        Returns:
+            Set of column names
+        """
+        raise NotImplementedError
+
+    def mask(self, data):
+        """
+        Evaluate the expression as a row filter.
+
+        Missing values count as False.
+
+        Args:
+            data: DataFrame to evaluate against
+
+        Returns:
+            Boolean numpy array with one entry per row
+
+        Raises:
+            TypeError: If the expression does not produce booleans
+        """
+        result = self.evaluate(data)
+
+        if not isinstance(result, pd.Series):
+            if not isinstance(result, (bool, np.bool_)):
+                raise TypeError(f"Expression {self!r} is not a predicate")
+            return np.full(len(data), bool(result))
+
+        if result.dtype == bool:
+            return result.to_numpy()
+        if pd.api.types.is_bool_dtype(result.dtype):
+            return result.fillna(False).to_numpy(dtype=bool)
+
+        raise TypeError(f"Expression {self!r} is not a predicate (dtype {result.dtype})")
+
+    # Comparisons
+    def __eq__(self, other):
+        return BinaryOp('==', self, other)
+
+    def __ne__(self, other):
+        return BinaryOp('!=', self, other)
+
+    def __lt__(self, other):
+        return BinaryOp('<', self, other)
+
+    def __le__(self, other):
+        return BinaryOp('<=', self, other)
+
+    def __gt__(self, other):
+        return BinaryOp('>', self, other)
+
+    def __ge__(self, other):
+        return BinaryOp('>=', self, other)
+
+    # Arithmetic
+    def __add__(self, other):
+        return BinaryOp('+', self, other)
+
+    def __radd__(self, other):
+        return BinaryOp('+', other, self)
+
+    def __sub__(self, other):
+        return BinaryOp('-', self, other)
+
+    def __rsub__(self, other):
+        return BinaryOp('-', other, self)
+
+    def __mul__(self, other):
+        return BinaryOp('*', self, other)
+
+    def __rmul__(self, other):
+        return BinaryOp('*', other, self)
+
+    def __truediv__(self, other):
+        return BinaryOp('/', self, other)
+
+    def __rtruediv__(self, other):
+        return BinaryOp('/', other, self)
+
+    # Boolean logic
+    def __and__(self, other):
+        return BinaryOp('&', self, _predicate_operand(other))
+
+    def __rand__(self, other):
+        return BinaryOp('&', _predicate_operand(other), self)
+
+    def __or__(self, other):
+        return BinaryOp('|', self, _predicate_operand(other))
+
+    def __ror__(self, other):
+        return BinaryOp('|', _predicate_operand(other), self)
+
+    def __invert__(self):
+        return Not(self)
+
+    def __bool__(self):
+        raise TypeError(
+            "Expressions have no truth value; use & | ~ instead of and / or / not"
+        )
+
+    __hash__ = None
+
+    def isin(self, values):
+        """
+        Test whether each value is one of the given values.
+
+        Args:
+            values: Iterable of values to match
+
+        Returns:
+            Predicate expression
+        """
+        return IsIn(self, values)
+
+    def between(self, low, high):
+        """
+        Test whether each value lies in the closed range [low, high].
+
+        Args:
+            low: Lower bound, inclusive
+            high: Upper bound, inclusive
+
+        Returns:
+            Predicate expression
+        """
+        return (self >= low) & (self <= high)
+
+    def isnull(self):
+        """
+        Test whether each value is missing.
+
+        Returns:
+            Predicate expression
+        """
+        return IsNull(self)
+
+    def notnull(self):
+        """
+        Test whether each value is present.
+
+        Returns:
+            Predicate expression
+        """
+        return ~IsNull(self)
+
+
+class Column(Expr):
+    """
+    Reference to a DataFrame column.
+    """
+
+    def __init__(self, name):
+        """
+        Initialize the column reference.
+
+        Args:
+            name: Column name
+        """
+        self.name = name
+
+    def evaluate(self, data):
+        return data[self.name]
+
+    def columns(self):
+        return {self.name}
+
+    def __repr__(self):
+        return f"col({self.name!r})"
+
+
+class Literal(Expr):
+    """
+    Constant value.
+    """
+
+    def __init__(self, value):
+        """
+        Initialize the literal.
+
+        Args:
+            value: The constant value
+        """
+        self.value = value
+
+    def evaluate(self, data):
+        return self.value
+
+    def columns(self):
+        return set()
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+# Operator symbols and the vectorized functions that implement them
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '&': operator.and_,
+    '|': operator.or_
+}
+
+
+class BinaryOp(Expr):
+    """
+    Comparison, arithmetic or boolean operation on two expressions.
+    """
+
+    def __init__(self, op, left, right):
+        """
+        Initialize the operation.
+
+        Args:
+            op: Operator symbol, a key of OPERATORS
+            left: Left operand; non-expressions are wrapped as literals
+            right: Right operand; non-expressions are wrapped as literals
+        """
+        self.op = op
+        self.left = _as_expr(left)
+        self.right = _as_expr(right)
+
+    def evaluate(self, data):
+        return OPERATORS[self.op](self.left.evaluate(data), self.right.evaluate(data))
+
+    def columns(self):
+        return self.left.columns() | self.right.columns()
+
+    def __repr__(self):
+        return f"({self.left!r} {self.op} {self.right!r})"
+
+
+class Not(Expr):
+    """
+    Boolean negation of a predicate.
+    """
+
+    def __init__(self, operand):
+        """
+        Initialize the negation.
+
+        Args:
+            operand: Predicate expression to negate
+        """
+        self.operand = operand
+
+    def evaluate(self, data):
+        return ~self.operand.evaluate(data)
+
+    def columns(self):
+        return self.operand.columns()
+
+    def __repr__(self):
+        return f"~{self.operand!r}"
+
+
+class IsIn(Expr):
+    """
+    Membership test against a fixed set of values.
+    """
+
+    def __init__(self, operand, values):
+        """
+        Initialize the membership test.
+
+        Args:
+            operand: Expression whose values are tested
+            values: Iterable of values to match
+        """
+        self.operand = operand
+        self.values = list(values)
+
+    def evaluate(self, data):
+        return self.operand.evaluate(data).isin(self.values)
+
+    def columns(self):
+        return self.operand.columns()
+
+    def __repr__(self):
+        return f"{self.operand!r}.isin({self.values!r})"
+
+
+class IsNull(Expr):
+    """
+    Missing-value test.
+    """
+
+    def __init__(self, operand):
+        """
+        Initialize the missing-value test.
+
+        Args:
+            operand: Expression whose values are tested
+        """
+        self.operand = operand
+
+    def evaluate(self, data):
+        return self.operand.evaluate(data).isna()
+
+    def columns(self):
+        return self.operand.columns()
+
+    def __repr__(self):
+        return f"{self.operand!r}.isnull()"
+
+
+def col(name):
+    """
+    Reference a column in an expression.
+
+    Args:
+        name: Column name
+
+    Returns:
+        Column expression
+    """
+    return Column(name)
+
+
+def lit(value):
+    """
+    Use a constant value in an expression.
+
+    Args:
+        value: The constant value
+
+    Returns:
+        Literal expression
+    """
+    return Literal(value)
+
+
+def _as_expr(value):
+    """Wrap non-expression operands as literals."""
+    return value if isinstance(value, Expr) else Literal(value)
+
+
+def _predicate_operand(value):
+    """
+    Check an operand of & or |.
+
+    Only expressions and booleans are accepted, which catches unparenthesized
+    comparisons such as col('a') > 5 & col('b'), parsed as col('a') > (5 & col('b')).
+    """
+    if isinstance(value, (Expr, bool, np.bool_)):
+        return _as_expr(value)
+    raise TypeError(
+        f"Cannot combine {value!r} with & or |; parenthesize comparisons, "
+        "e.g. (col('a') > 5) & (col('b') < 3)"
+    )
@@ -0,0 +1,161 @@
+"""
+Memoization of analysis results.
+
+Results are kept in a least-recently-used cache bounded both by the number
+of entries and by their estimated size in bytes. Keys include the data
+version of the analyzer, so results computed before the data changed are
+never returned afterwards.
+"""
+
+import inspect
+import sys
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+import pandas as pd
+
+# Default bounds of an analyzer's result cache
+DEFAULT_MAXSIZE = 128
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'bytes', 'max_bytes'])
+
+class ResultCache:
+    """
+    Least-recently-used cache of analysis results with a size budget.
+
+    Values are copied on the way in and out, so callers modifying a returned
+    Series, DataFrame or dictionary do not change the cached result.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached results; 0 disables caching
+            max_bytes: Maximum estimated size of all cached results; a single
+                      result larger than this is not cached
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """
+        Look up a cached result, counting a hit or a miss.
+
+        Args:
+            key: Hashable key of the result
+
+        Returns:
+            Tuple of (found, value); value is None when not found
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, _copy(entry[0])
+
+    def put(self, key, value):
+        """
+        Cache a result, evicting the least recently used ones as needed.
+
+        Args:
+            key: Hashable key of the result
+            value: Result to cache
+        """
+        size = _size(value)
+        if self.maxsize <= 0 or size > self.max_bytes:
+            return
+
+        self._discard(key)
+        self._entries[key] = (_copy(value), size)
+        self.bytes += size
+
+        while len(self._entries) > self.maxsize or self.bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def clear(self):
+        """
+        Remove every cached result, keeping the hit and miss counts.
+        """
+        self._entries.clear()
+        self.bytes = 0
+
+    def info(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            CacheInfo with hits, misses, maxsize, currsize (number of cached
+            results), bytes and max_bytes
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries),
+                         self.bytes, self.max_bytes)
+
+    def _discard(self, key):
+        """Remove a cached result if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+def memoized(method):
+    """
+    Cache the results of an analyzer method in the analyzer's result cache.
+
+    Results are keyed by method name, arguments and the analyzer's
+    data_version. Arguments are bound to the method's signature with
+    defaults applied, so top_products(), top_products(5) and
+    top_products(n=5) share one entry. Calls with unhashable arguments are
+    computed every time.
+    """
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            bound = signature.bind(self, *args, **kwargs)
+        except TypeError:
+            # Let the method report the bad call
+            return method(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(list(bound.arguments.items())[1:])
+
+        key = (method.__name__, arguments, self.data_version)
+        try:
+            found, value = self.results.get(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        if found:
+            return value
+
+        value = method(self, *args, **kwargs)
+        self.results.put(key, value)
+        return value
+
+    return wrapper
+
+def _copy(value):
+    """Copy a mutable result; immutable values are returned as they are."""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return value.copy()
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+def _size(value):
+    """Estimate the memory used by a result, in bytes."""
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    return sys.getsizeof(value)
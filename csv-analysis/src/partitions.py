@@ -0,0 +1,144 @@
+"""
+Byte-range partitions of CSV files for parallel parsing.
+
+A file is split into ranges of roughly equal size whose boundaries fall at
+the start of a line, so each range holds whole rows and can be parsed on its
+own with the file's header. Ranges are handed to a process pool and the
+results come back in file order.
+
+Boundaries are found by looking for line breaks, so quoted fields containing
+line breaks are not supported.
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .schema import read_csv
+
+def byte_ranges(path, partitions):
+    """
+    Split a CSV file into byte ranges aligned to line boundaries.
+
+    Args:
+        path: Path of the CSV file
+        partitions: Number of ranges to aim for; small files may yield fewer
+
+    Returns:
+        List of (start, end) byte offsets covering every row after the
+        header, in file order; at least one range
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as file:
+        file.readline()
+        first = file.tell()
+        bounds = [first]
+
+        for part in range(1, partitions):
+            target = first + (size - first) * part // partitions
+            if target <= bounds[-1]:
+                continue
+            # Finish the line the target falls in; the next one starts a range
+            file.seek(target - 1)
+            file.readline()
+            bounds.append(min(file.tell(), size))
+
+    bounds.append(size)
+    # A file with no rows still gets one (empty) range, so its columns are read
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start] or [(first, size)]
+
+def read_range(path, start, end, schema=None, usecols=None, chunksize=None):
+    """
+    Parse the rows in one byte range of a CSV file.
+
+    The range is streamed from the file after its header, so with a
+    chunksize only one chunk of it is held in memory at a time.
+
+    Args:
+        path: Path of the CSV file
+        start: Offset of the first byte, at the start of a line
+        end: Offset after the last byte, at the start of a line or the end
+            of the file
+        schema: Optional schema, as for schema.read_csv
+        usecols: Optional collection of columns to read
+        chunksize: Optional number of rows per chunk
+
+    Returns:
+        DataFrame, or an iterator of DataFrame chunks with a chunksize
+    """
+    file = open(path, 'rb')
+    try:
+        header = file.readline()
+        file.seek(start)
+        stream = io.BufferedReader(_RangeReader(file, header, end - start))
+        result = read_csv(stream, schema, usecols=usecols, chunksize=chunksize)
+    except BaseException:
+        file.close()
+        raise
+
+    if chunksize:
+        return _closing(result, file)
+    file.close()
+    return result
+
+class _RangeReader(io.RawIOBase):
+    """Readable stream of a CSV header followed by a byte range of the file."""
+
+    def __init__(self, file, header, size):
+        """
+        Initialize the stream.
+
+        Args:
+            file: Binary file positioned at the start of the range
+            header: Header line to yield first, as bytes
+            size: Number of bytes in the range
+        """
+        self.file = file
+        self.header = header
+        self.remaining = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.header:
+            count = min(len(buffer), len(self.header))
+            buffer[:count] = self.header[:count]
+            self.header = self.header[count:]
+            return count
+
+        data = self.file.read(min(len(buffer), self.remaining))
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        return len(data)
+
+def _closing(chunks, file):
+    """Yield the chunks of a range, closing its file once they are consumed."""
+    try:
+        yield from chunks
+    finally:
+        file.close()
+
+def map_ranges(function, path, workers, *args):
+    """
+    Apply a function to every byte range of a CSV file in a process pool.
+
+    The file is split into one range per worker. The function must be
+    defined at module level so it can be sent to the worker processes.
+
+    Args:
+        function: Callable taking (path, start, end, *args)
+        path: Path of the CSV file
+        workers: Number of worker processes
+        *args: Further arguments passed to every call
+
+    Returns:
+        List of the function's results, in file order
+    """
+    ranges = byte_ranges(path, workers)
+    if len(ranges) <= 1:
+        return [function(path, start, end, *args) for start, end in ranges]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        futures = [pool.submit(function, path, start, end, *args) for start, end in ranges]
+        return [future.result() for future in futures]
@@ -0,0 +1,449 @@
+"""
+Lazy query plans over the sales data.
+
+A Query records steps (filters, computed columns, column selection,
+grouping and top-N selection) without running them:
+
+    analyzer.query().filter(col('region') == 'North').group_by('category').top(3)
+
+Before the plan runs, it is optimized: filters are moved below the computed
+columns they do not use and fused into one predicate, which is applied as
+the rows are loaded; computed columns nothing uses are dropped; and only the
+columns later steps need are read. Rows are then selected once, as the data
+is loaded, and later steps only see the columns the query needs.
+"""
+
+import pandas as pd
+
+from .expressions import Expr, BinaryOp, Column, Literal
+
+# Aggregations a group-by step can apply
+AGGREGATIONS = ('sum', 'mean', 'min', 'max', 'count')
+
+# Comparison with its operands swapped, to read literal-first terms column-first
+FLIPPED = {'==': '==', '<': '>', '<=': '>=', '>': '<', '>=': '<='}
+
+class Step:
+    """
+    Base class of query plan steps.
+
+    Subclasses implement run, which applies the step to the result of the
+    previous step, and requires, which works out the columns the step needs
+    from its input.
+    """
+
+    def requires(self, needed):
+        """
+        Get the columns the step's input must have.
+
+        Args:
+            needed: Set of columns needed from the step's output, or None for all
+
+        Returns:
+            Set of column names, or None for all
+        """
+        raise NotImplementedError
+
+    def run(self, data):
+        """
+        Apply the step.
+
+        Args:
+            data: DataFrame, or Series after a group-by
+
+        Returns:
+            DataFrame or Series
+        """
+        raise NotImplementedError
+
+class Filter(Step):
+    """Plan step keeping the rows matching a predicate."""
+
+    def __init__(self, predicate):
+        """
+        Initialize the step.
+
+        Args:
+            predicate: Predicate Expr
+        """
+        self.predicate = predicate
+
+    def requires(self, needed):
+        return None if needed is None else needed | self.predicate.columns()
+
+    def run(self, data):
+        return data[self.predicate.mask(data)]
+
+    def __repr__(self):
+        return f"Filter {self.predicate!r}"
+
+class WithColumn(Step):
+    """Plan step adding or replacing a column computed by an expression."""
+
+    def __init__(self, name, expr):
+        """
+        Initialize the step.
+
+        Args:
+            name: Column name
+            expr: Expr computing the column
+        """
+        self.name = name
+        self.expr = expr
+
+    def requires(self, needed):
+        return None if needed is None else (needed - {self.name}) | self.expr.columns()
+
+    def run(self, data):
+        return data.assign(**{self.name: self.expr.evaluate(data)})
+
+    def __repr__(self):
+        return f"WithColumn {self.name} = {self.expr!r}"
+
+class Select(Step):
+    """Plan step keeping some columns, in the given order."""
+
+    def __init__(self, columns):
+        """
+        Initialize the step.
+
+        Args:
+            columns: Column names
+        """
+        self.columns = list(columns)
+
+    def requires(self, needed):
+        return set(self.columns)
+
+    def run(self, data):
+        return data[self.columns]
+
+    def __repr__(self):
+        return f"Select {self.columns}"
+
+class GroupBy(Step):
+    """Plan step aggregating a column per group, producing a Series."""
+
+    def __init__(self, by, field, how):
+        """
+        Initialize the step.
+
+        Args:
+            by: Column name, or list of column names
+            field: Column to aggregate
+            how: Aggregation, one of AGGREGATIONS
+        """
+        self.by = by
+        self.field = field
+        self.how = how
+
+    def requires(self, needed):
+        keys = [self.by] if isinstance(self.by, str) else self.by
+        return set(keys) | {self.field}
+
+    def run(self, data):
+        return data.groupby(self.by, observed=True)[self.field].agg(self.how)
+
+    def __repr__(self):
+        return f"GroupBy {self.by!r} {self.how}({self.field})"
+
+class Top(Step):
+    """Plan step keeping the n largest rows by a column, or the n largest group results."""
+
+    def __init__(self, n, by=None):
+        """
+        Initialize the step.
+
+        Args:
+            n: Number of rows or groups to keep
+            by: Column to rank rows by; None to rank group results
+        """
+        self.n = n
+        self.by = by
+
+    def requires(self, needed):
+        return needed if needed is None or self.by is None else needed | {self.by}
+
+    def run(self, data):
+        if self.by is None:
+            return data.nlargest(self.n)
+        return data.nlargest(self.n, self.by)
+
+    def __repr__(self):
+        return f"Top {self.n}" + (f" by {self.by}" if self.by else "")
+
+class Scan:
+    """First step of an optimized plan: the columns to read and the rows to keep."""
+
+    def __init__(self, columns=None, predicate=None):
+        """
+        Initialize the scan.
+
+        Args:
+            columns: Set of columns to read, or None for all
+            predicate: Optional Expr the rows must match
+        """
+        self.columns = columns
+        self.predicate = predicate
+
+    def __repr__(self):
+        columns = sorted(self.columns) if self.columns is not None else 'all'
+        text = f"Scan columns={columns}"
+        if self.predicate is not None:
+            text += f" where {self.predicate!r}"
+        return text
+
+class Plan:
+    """Optimized query plan: a scan followed by the remaining steps."""
+
+    def __init__(self, scan, steps):
+        """
+        Initialize the plan.
+
+        Args:
+            scan: Scan step
+            steps: List of the steps that follow it
+        """
+        self.scan = scan
+        self.steps = steps
+
+    def __repr__(self):
+        return '\n'.join(repr(step) for step in [self.scan, *self.steps])
+
+class Query:
+    """
+    Lazily built query over the data of a SalesAnalyzer.
+
+    Every method returns a new Query, so partial queries can be reused.
+    Steps are checked against the available columns as they are added;
+    nothing is read until collect().
+    """
+
+    def __init__(self, analyzer, steps=(), columns=None, grouped=False):
+        """
+        Initialize a query.
+
+        Args:
+            analyzer: SalesAnalyzer whose data is queried
+            steps: Steps recorded so far
+            columns: Columns available after the steps (default: the
+                    analyzer's columns)
+            grouped: Whether the steps end with a group-by
+        """
+        self.analyzer = analyzer
+        self.steps = tuple(steps)
+        self.columns = list(columns) if columns is not None else analyzer.columns()
+        self.grouped = grouped
+
+    def filter(self, predicate):
+        """
+        Keep the rows matching a column expression.
+
+        Args:
+            predicate: Expr built with col()
+
+        Returns:
+            New Query
+
+        Raises:
+            TypeError: If the predicate is not a column expression
+            ValueError: If it uses unknown columns, or follows a group-by
+        """
+        if not isinstance(predicate, Expr):
+            raise TypeError("Query filters must be column expressions built with col()")
+        self._check(predicate.columns())
+        return self._then(Filter(predicate))
+
+    def with_column(self, name, expr):
+        """
+        Add or replace a column computed by an expression.
+
+        Args:
+            name: Column name
+            expr: Expr built with col() and lit()
+
+        Returns:
+            New Query
+        """
+        self._check(expr.columns())
+        columns = self.columns + ([name] if name not in self.columns else [])
+        return self._then(WithColumn(name, expr), columns)
+
+    def select(self, *columns):
+        """
+        Keep only some columns.
+
+        Args:
+            *columns: Column names, in output order
+
+        Returns:
+            New Query
+        """
+        self._check(columns)
+        return self._then(Select(columns), columns)
+
+    def group_by(self, by, field='revenue', how='sum'):
+        """
+        Aggregate a field per group; the query then produces a Series.
+
+        Args:
+            by: Column name, or list of column names
+            field: Column to aggregate (default: 'revenue')
+            how: One of 'sum', 'mean', 'min', 'max' and 'count'
+
+        Returns:
+            New Query
+        """
+        if how not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation '{how}'; expected one of {list(AGGREGATIONS)}")
+        self._check(([by] if isinstance(by, str) else list(by)) + [field])
+        return Query(self.analyzer, self.steps + (GroupBy(by, field, how),), self.columns, grouped=True)
+
+    def top(self, n, by=None):
+        """
+        Keep the n largest rows by a column, or the n largest group results.
+
+        Args:
+            n: Number of rows or groups to keep
+            by: Column to rank rows by; must be omitted after group_by
+
+        Returns:
+            New Query
+        """
+        if self.grouped:
+            if by is not None:
+                raise ValueError("top() after group_by ranks the group results; omit by")
+            return Query(self.analyzer, self.steps + (Top(n),), self.columns, grouped=True)
+
+        if by is None:
+            raise ValueError("top() needs a column to rank rows by")
+        self._check([by])
+        return self._then(Top(n, by))
+
+    def optimize(self):
+        """
+        Build the optimized plan of the query.
+
+        Returns:
+            Plan
+        """
+        # Move each filter below the steps it commutes with, so filters collect at the bottom
+        steps = []
+        for step in self.steps:
+            position = len(steps)
+            if isinstance(step, Filter):
+                while position > 0 and _commutes(step, steps[position - 1]):
+                    position -= 1
+            steps.insert(position, step)
+
+        # Fuse adjacent filters into one predicate
+        fused = []
+        for step in steps:
+            if isinstance(step, Filter) and fused and isinstance(fused[-1], Filter):
+                fused[-1] = Filter(fused[-1].predicate & step.predicate)
+            else:
+                fused.append(step)
+
+        predicate = fused.pop(0).predicate if fused and isinstance(fused[0], Filter) else None
+
+        # Work out the columns each step needs, from the last step back
+        needed = None
+        kept = []
+        for step in reversed(fused):
+            if isinstance(step, WithColumn) and needed is not None and step.name not in needed:
+                continue
+            needed = step.requires(needed)
+            kept.append(step)
+        kept.reverse()
+
+        if needed is not None and predicate is not None:
+            needed = needed | predicate.columns()
+        return Plan(Scan(needed, predicate), kept)
+
+    def explain(self):
+        """
+        Describe the optimized plan, one step per line from the scan up.
+
+        Returns:
+            String
+        """
+        return repr(self.optimize())
+
+    def collect(self):
+        """
+        Run the query.
+
+        Returns:
+            DataFrame, or Series after group_by
+        """
+        plan = self.optimize()
+        result = self.analyzer._load(plan.scan.columns, plan.scan.predicate)
+        for step in plan.steps:
+            result = step.run(result)
+        return result
+
+    def _then(self, step, columns=None):
+        """Return a new query with one more step."""
+        return Query(self.analyzer, self.steps + (step,), columns if columns is not None else self.columns)
+
+    def _check(self, columns):
+        """Reject unknown columns, and row steps after a group-by."""
+        if self.grouped:
+            raise ValueError("Only top() can follow group_by")
+        unknown = sorted(set(columns) - set(self.columns))
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown}; available: {self.columns}")
+
+def prune_arguments(predicate):
+    """
+    Find the date range and category a predicate restricts rows to.
+
+    Only terms joined by & that compare the 'date' or 'category' column with
+    a literal are used; strict comparisons are treated as inclusive, so the
+    result never excludes a matching row.
+
+    Args:
+        predicate: Expr, or None
+
+    Returns:
+        Dictionary of PartitionedDataset.prune arguments; empty if the
+        predicate restricts neither
+    """
+    arguments = {}
+    for term in _conjuncts(predicate) if predicate is not None else []:
+        if not isinstance(term, BinaryOp) or term.op not in FLIPPED:
+            continue
+
+        column, op, value = term.left, term.op, term.right
+        if isinstance(column, Literal) and isinstance(value, Column):
+            column, op, value = value, FLIPPED[op], column
+        if not isinstance(column, Column) or not isinstance(value, Literal):
+            continue
+
+        if column.name == 'category' and op == '==':
+            arguments['category'] = value.value
+        elif column.name == 'date':
+            try:
+                date = pd.Timestamp(value.value)
+            except (TypeError, ValueError):
+                continue
+            if op in ('>', '>=', '=='):
+                arguments['start_date'] = max(date, arguments.get('start_date', date))
+            if op in ('<', '<=', '=='):
+                arguments['end_date'] = min(date, arguments.get('end_date', date))
+    return arguments
+
+def _conjuncts(predicate):
+    """Split a predicate into the terms joined by &."""
+    if isinstance(predicate, BinaryOp) and predicate.op == '&':
+        return _conjuncts(predicate.left) + _conjuncts(predicate.right)
+    return [predicate]
+
+def _commutes(step, previous):
+    """Whether a filter can run before the previous step with the same result."""
+    # Filters stop at the filter below them, keeping their order when fused
+    if isinstance(previous, Select):
+        return True
+    if isinstance(previous, WithColumn):
+        return previous.name not in step.predicate.columns()
+    return False
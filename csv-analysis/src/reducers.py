@@ -0,0 +1,131 @@
+"""
+Grouped reductions with reduce() semantics.
+
+grouped_reduce gives the same result as reducing each group's values one by
+one with a binary reducer, as functools.reduce would. Reducers known to be
+associative (addition, multiplication, minimum and maximum) run as native
+pandas group-by kernels, except integer products, which could overflow; any
+other reducer is applied to each group's values as a plain array, without
+creating a Series per row.
+"""
+
+import builtins
+import operator
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+# Associative reducers and the group-by kernel computing them over a whole group
+KERNELS = {
+    operator.add: 'sum',
+    operator.iadd: 'sum',
+    np.add: 'sum',
+    operator.mul: 'prod',
+    operator.imul: 'prod',
+    np.multiply: 'prod',
+    builtins.min: 'min',
+    np.minimum: 'min',
+    builtins.max: 'max',
+    np.maximum: 'max'
+}
+
+# Reducers that may be given by name
+NAMED_REDUCERS = {
+    'sum': operator.add,
+    'prod': operator.mul,
+    'min': builtins.min,
+    'max': builtins.max
+}
+
+def resolve(reducer):
+    """
+    Look up a reducer given by name.
+
+    Args:
+        reducer: Binary function (acc, value) => result, or one of 'sum',
+                'prod', 'min' and 'max'
+
+    Returns:
+        Binary function
+
+    Raises:
+        ValueError: If reducer is an unknown name
+    """
+    if isinstance(reducer, str):
+        if reducer not in NAMED_REDUCERS:
+            raise ValueError(f"Unknown reducer '{reducer}'; expected one of {sorted(NAMED_REDUCERS)}")
+        return NAMED_REDUCERS[reducer]
+    return reducer
+
+def kernel(reducer):
+    """
+    Get the group-by kernel equivalent to a reducer.
+
+    Returns:
+        Kernel name, or None if the reducer must be applied value by value
+    """
+    try:
+        return KERNELS.get(resolve(reducer))
+    except TypeError:
+        # Unhashable callables cannot be known reducers
+        return None
+
+def grouped_reduce(data, group_field, field, reducer, initial=None, totals=None):
+    """
+    Reduce a field's values within each group.
+
+    Each group's result equals reduce(reducer, values, start), where start
+    is the group's entry in totals if present, else initial; with neither,
+    the reduction starts from the group's first value. Groups are those of
+    DataFrame.groupby: rows with a missing key are left out.
+
+    Args:
+        data: DataFrame with the group and value columns
+        group_field: Column to group by
+        field: Column to reduce
+        reducer: Binary function (acc, value) => result, or one of 'sum',
+                'prod', 'min' and 'max'
+        initial: Optional starting value of every group
+        totals: Optional dictionary of results for earlier rows, continued
+               and updated in place
+
+    Returns:
+        Dictionary mapping group keys to reduced values
+    """
+    function = resolve(reducer)
+    totals = {} if totals is None else totals
+
+    name = kernel(function)
+    if name == 'prod' and data[field].dtype.kind in 'iu':
+        # Integer products overflow the kernel's fixed width, unlike Python integers
+        name = None
+
+    if name is not None:
+        # Associative reducers can reduce each group at once, then fold in the start value
+        grouped = data.groupby(group_field, observed=True, sort=False)[field]
+        results = getattr(grouped, name)()
+        if data[field].hasnans:
+            # Kernels skip missing values, but reducing one in yields NaN
+            missing = data[field].isna().groupby(data[group_field], observed=True, sort=False).any()
+            results = results.mask(missing.reindex(results.index, fill_value=False))
+        for key, value in zip(results.index.tolist(), results.tolist()):
+            start = totals.get(key, initial)
+            totals[key] = value if start is None else function(start, value)
+        return totals
+
+    # Sort row positions by group once, then reduce each group's slice of the array
+    codes, uniques = pd.factorize(data[group_field], sort=False)
+    values = data[field].to_numpy()
+    present = codes >= 0
+    order = np.argsort(codes[present], kind='stable')
+    values = values[present][order]
+    bounds = np.cumsum(np.bincount(codes[present], minlength=len(uniques)))[:-1]
+
+    for key, group in zip(uniques.tolist(), np.split(values, bounds)):
+        if len(group) == 0:
+            continue
+        start = totals.get(key, initial)
+        group = group.tolist()
+        totals[key] = reduce(function, group) if start is None else reduce(function, group, start)
+    return totals
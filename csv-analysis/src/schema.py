@@ -0,0 +1,145 @@
+"""
+Declared column types for loading sales CSV files compactly.
+
+A schema maps column names to a kind: 'category' for low-cardinality
+strings, 'integer' for 64-bit integers, 'float' for numbers stored as
+float32 when that loses nothing, and 'date' for ISO dates parsed while
+reading.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Column kinds of the sales CSV
+SALES_SCHEMA = {
+    'transaction_id': 'integer',
+    'date': 'date',
+    'product': 'category',
+    'category': 'category',
+    'region': 'category',
+    'quantity': 'integer',
+    'price': 'float'
+}
+
+# Column kinds a schema may use
+KINDS = ('category', 'integer', 'float', 'date')
+
+def read_csv(path, schema=None, usecols=None, chunksize=None):
+    """
+    Read a CSV file, typing its columns by a schema.
+
+    Categories and dates are handled by the parser in the same pass; float
+    columns are downcast after parsing, since their values are only known then.
+
+    Args:
+        path: Path of the CSV file
+        schema: Optional dictionary mapping column names to kinds; columns
+               not in the schema, or every column without one, are inferred
+        usecols: Optional collection of columns to read
+        chunksize: Optional number of rows per chunk
+
+    Returns:
+        DataFrame, or an iterator of DataFrame chunks with a chunksize
+
+    Raises:
+        ValueError: If the schema uses an unknown kind
+    """
+    schema = _checked(schema)
+    if usecols is not None:
+        schema = {column: kind for column, kind in schema.items() if column in usecols}
+
+    dtype = {column: 'category' for column, kind in schema.items() if kind == 'category'}
+    dates = [column for column, kind in schema.items() if kind == 'date']
+
+    reader = pd.read_csv(
+        path,
+        usecols=usecols,
+        dtype=dtype or None,
+        parse_dates=dates or None,
+        date_format='ISO8601' if dates else None,
+        chunksize=chunksize
+    )
+
+    if chunksize:
+        return (downcast(chunk, schema) for chunk in reader)
+    return downcast(reader, schema)
+
+def apply_schema(data, schema=None):
+    """
+    Type the columns of a DataFrame built in memory as read_csv would.
+
+    Args:
+        data: DataFrame to modify in place, such as rows built from dictionaries
+        schema: Optional dictionary mapping column names to kinds
+
+    Returns:
+        The same DataFrame
+
+    Raises:
+        ValueError: If the schema uses an unknown kind
+    """
+    schema = _checked(schema)
+    for column, kind in schema.items():
+        if column not in data:
+            continue
+        if kind == 'category':
+            data[column] = data[column].astype('category')
+        elif kind == 'date':
+            data[column] = pd.to_datetime(data[column], format='ISO8601')
+
+    return downcast(data, schema)
+
+def downcast(data, schema):
+    """
+    Store numeric schema columns in their compact lossless type.
+
+    Integers are kept at int64: narrower types would make arithmetic on the
+    column, such as col('quantity') * 100, wrap around silently. Floats move
+    to float32 only when every value survives the round trip exactly.
+
+    Args:
+        data: DataFrame to modify in place
+        schema: Dictionary mapping column names to kinds
+
+    Returns:
+        The same DataFrame
+    """
+    for column, kind in schema.items():
+        if column not in data:
+            continue
+
+        values = data[column]
+        if kind == 'integer' and pd.api.types.is_integer_dtype(values.dtype):
+            data[column] = values.astype(np.int64, copy=False)
+        elif kind == 'float' and values.dtype == np.float64:
+            narrow = values.astype(np.float32)
+            if np.array_equal(narrow.to_numpy(dtype=np.float64), values.to_numpy(), equal_nan=True):
+                data[column] = narrow
+
+    return data
+
+def memory_usage(data):
+    """
+    Get the memory used by each column of a DataFrame, including string data.
+
+    Args:
+        data: DataFrame to measure
+
+    Returns:
+        DataFrame indexed by column with 'dtype' and 'bytes', plus a 'total' row
+    """
+    usage = data.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        'dtype': [str(data[column].dtype) for column in usage.index],
+        'bytes': usage.to_numpy()
+    }, index=usage.index)
+    report.loc['total'] = ['', int(usage.sum())]
+    return report
+
+def _checked(schema):
+    """Copy a schema, rejecting unknown kinds."""
+    schema = dict(schema or {})
+    unknown = set(schema.values()) - set(KINDS)
+    if unknown:
+        raise ValueError(f"Unknown column kinds {sorted(unknown)}, expected one of {list(KINDS)}")
+    return schema
@@ -0,0 +1,119 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.aggregates import PartialAggregates
+from src.expressions import col
+
+class TestStreamingAnalyzer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+        cls.sales_csv = os.path.join(os.path.dirname(__file__), '..', 'data', 'sales_data.csv')
+
+    def setUp(self):
+        self.analyzer = SalesAnalyzer(self.test_csv)
+        self.streaming = SalesAnalyzer(self.test_csv, chunksize=3)
+
+    def test_streaming_mode_holds_no_rows(self):
+        self.assertTrue(self.streaming.streaming)
+        self.assertFalse(self.analyzer.streaming)
+        self.assertIsNone(self.streaming.data)
+        self.assertEqual(self.streaming.aggregates.transactions, 10)
+
+    def test_category_and_product_revenue(self):
+        pd.testing.assert_series_equal(
+            self.streaming.total_revenue_by_category().sort_index(),
+            self.analyzer.total_revenue_by_category().sort_index()
+        )
+        pd.testing.assert_series_equal(
+            self.streaming.top_products(10).sort_index(),
+            self.analyzer.top_products(10).sort_index()
+        )
+
+    def test_region_means_and_monthly_trend(self):
+        pd.testing.assert_series_equal(
+            self.streaming.average_by_region().sort_index(),
+            self.analyzer.average_by_region().sort_index()
+        )
+        pd.testing.assert_series_equal(self.streaming.monthly_trend(), self.analyzer.monthly_trend())
+
+    def test_summary_statistics(self):
+        streamed = self.streaming.summary_statistics()
+        expected = self.analyzer.summary_statistics()
+
+        self.assertEqual(streamed['total_transactions'], expected['total_transactions'])
+        self.assertAlmostEqual(streamed['total_revenue'], expected['total_revenue'])
+        self.assertAlmostEqual(streamed['average_revenue'], expected['average_revenue'])
+        self.assertEqual(streamed['categories'], expected['categories'])
+        self.assertEqual(streamed['regions'], expected['regions'])
+
+    def test_streaming_filters(self):
+        pd.testing.assert_frame_equal(
+            self.streaming.filter_high_quantity(2),
+            self.analyzer.filter_high_quantity(2)
+        )
+        pd.testing.assert_frame_equal(
+            self.streaming.filter_by(lambda row: row['region'] == 'North'),
+            self.analyzer.filter_by(lambda row: row['region'] == 'North')
+        )
+        self.assertEqual(len(self.streaming.filter_by(col('quantity') > 100)), 0)
+
+    def test_streaming_reduce_and_group(self):
+        self.assertAlmostEqual(
+            self.streaming.reduce_by_field('revenue', lambda acc, x: acc + x),
+            self.analyzer.reduce_by_field('revenue', lambda acc, x: acc + x)
+        )
+        pd.testing.assert_series_equal(
+            self.streaming.group_and_aggregate('region', 'quantity', lambda x: x.max()).sort_index(),
+            self.analyzer.group_and_aggregate('region', 'quantity', lambda x: x.max()).sort_index()
+        )
+        self.assertEqual(self.streaming.aggregate_with_reduce('category'),
+                         self.analyzer.aggregate_with_reduce('category'))
+
+    def test_streaming_top_n_by_metric(self):
+        metric = lambda row: row['quantity'] * 10 - row['price']
+        pd.testing.assert_frame_equal(
+            self.streaming.top_n_by_metric(3, metric),
+            self.analyzer.top_n_by_metric(3, metric)
+        )
+        self.assertEqual(len(self.streaming.map_field(lambda row: row['price'])), 10)
+
+    def test_merge_partials(self):
+        data = self.analyzer.data
+        merged = PartialAggregates.from_frame(data.iloc[:4]).merge(
+            PartialAggregates.from_frame(data.iloc[4:])
+        )
+        whole = PartialAggregates.from_frame(data)
+
+        pd.testing.assert_series_equal(merged.monthly_trend(), whole.monthly_trend())
+        pd.testing.assert_series_equal(
+            merged.total_revenue_by_category().sort_index(),
+            whole.total_revenue_by_category().sort_index()
+        )
+        self.assertEqual(merged.summary_statistics(), whole.summary_statistics())
+
+    def test_empty_partials(self):
+        partials = PartialAggregates()
+
+        self.assertEqual(len(partials.total_revenue_by_category()), 0)
+        self.assertEqual(len(partials.monthly_trend()), 0)
+        self.assertEqual(partials.summary_statistics()['total_transactions'], 0)
+
+    def test_larger_file_matches_in_memory(self):
+        streamed = SalesAnalyzer(self.sales_csv, chunksize=64)
+        loaded = SalesAnalyzer(self.sales_csv)
+
+        pd.testing.assert_series_equal(streamed.monthly_trend(), loaded.monthly_trend())
+        pd.testing.assert_series_equal(
+            streamed.average_by_region().sort_index(),
+            loaded.average_by_region().sort_index()
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+
+NEW_ROWS = [
+    {'transaction_id': 11, 'date': '2024-03-01', 'product': 'Laptop', 'category': 'Electronics',
+     'region': 'North', 'quantity': 1, 'price': 950.0},
+    {'transaction_id': 12, 'date': '2024-07-04', 'product': 'Kite', 'category': 'Toys',
+     'region': 'Coast', 'quantity': 4, 'price': 12.5}
+]
+
+class TestAppend(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.new_csv = os.path.join(self.tmp, 'new.csv')
+        self.combined_csv = os.path.join(self.tmp, 'combined.csv')
+        pd.DataFrame(NEW_ROWS).to_csv(self.new_csv, index=False)
+        pd.concat([pd.read_csv(self.test_csv), pd.DataFrame(NEW_ROWS)]).to_csv(self.combined_csv, index=False)
+        self.expected = SalesAnalyzer(self.combined_csv)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def assert_matches_combined(self, analyzer):
+        pd.testing.assert_series_equal(analyzer.total_revenue_by_category(),
+                                       self.expected.total_revenue_by_category())
+        pd.testing.assert_series_equal(analyzer.top_products(20), self.expected.top_products(20))
+        pd.testing.assert_series_equal(analyzer.average_by_region(), self.expected.average_by_region())
+        pd.testing.assert_series_equal(analyzer.monthly_trend(), self.expected.monthly_trend())
+        self.assertEqual(analyzer.summary_statistics()['total_transactions'], 12)
+        self.assertAlmostEqual(analyzer.summary_statistics()['total_revenue'],
+                               self.expected.summary_statistics()['total_revenue'])
+        self.assertEqual(analyzer.summary_statistics()['regions'], 6)
+
+    def test_append_rows(self):
+        analyzer = SalesAnalyzer(self.test_csv)
+
+        self.assertEqual(analyzer.append(NEW_ROWS), 2)
+        self.assert_matches_combined(analyzer)
+
+    def test_appended_rows_are_derived_and_typed(self):
+        analyzer = SalesAnalyzer(self.test_csv)
+        analyzer.append(pd.DataFrame(NEW_ROWS))
+
+        pd.testing.assert_frame_equal(analyzer.data, self.expected.data)
+        self.assertEqual(list(analyzer.data.index), list(range(12)))
+
+    def test_standard_analyses_do_not_join_rows(self):
+        analyzer = SalesAnalyzer(self.test_csv)
+        analyzer.append(NEW_ROWS[:1])
+        analyzer.append(NEW_ROWS[1:])
+        analyzer.summary_statistics()
+        analyzer.monthly_trend()
+
+        self.assertEqual(len(analyzer._pending), 2)
+        self.assertEqual(len(analyzer.filter_by_category('Toys')), 1)
+        self.assertEqual(len(analyzer._pending), 0)
+
+    def test_append_csv(self):
+        analyzer = SalesAnalyzer(self.test_csv)
+
+        self.assertEqual(analyzer.append_csv(self.new_csv), 2)
+        self.assert_matches_combined(analyzer)
+
+    def test_streaming_append(self):
+        analyzer = SalesAnalyzer(self.test_csv, chunksize=4)
+        analyzer.append(NEW_ROWS[:1])
+        analyzer.append_csv(self.new_csv)
+        expected = SalesAnalyzer(self.test_csv)
+        expected.append(NEW_ROWS[:1])
+        expected.append_csv(self.new_csv)
+
+        self.assertEqual(analyzer.aggregates.transactions, 13)
+        pd.testing.assert_series_equal(analyzer.monthly_trend(), expected.monthly_trend())
+        pd.testing.assert_frame_equal(analyzer.filter_high_quantity(0), expected.filter_high_quantity(0))
+
+    def test_append_invalidates_memoized_results(self):
+        analyzer = SalesAnalyzer(self.test_csv)
+        analyzer.index_dates()
+        version = analyzer.data_version
+        before = analyzer.summary_statistics()['total_transactions']
+
+        analyzer.append(NEW_ROWS)
+
+        self.assertGreater(analyzer.data_version, version)
+        self.assertIsNone(analyzer.date_index)
+        self.assertEqual(analyzer.summary_statistics()['total_transactions'], before + 2)
+
+    def test_replacing_data_drops_maintained_aggregates(self):
+        analyzer = SalesAnalyzer(self.test_csv)
+        analyzer.append(NEW_ROWS)
+        analyzer.data = analyzer.data.iloc[:3]
+
+        self.assertIsNone(analyzer.aggregates)
+        self.assertEqual(analyzer.summary_statistics()['total_transactions'], 3)
+
+    def test_columns_must_match(self):
+        analyzer = SalesAnalyzer(self.test_csv)
+
+        with self.assertRaises(ValueError):
+            analyzer.append([{key: value for key, value in NEW_ROWS[0].items() if key != 'price'}])
+        with self.assertRaises(ValueError):
+            analyzer.append([dict(NEW_ROWS[0], discount=0.1)])
+        self.assertEqual(len(analyzer.data), 10)
+
+    def test_empty_append_is_a_no_op(self):
+        analyzer = SalesAnalyzer(self.test_csv)
+        version = analyzer.data_version
+
+        self.assertEqual(analyzer.append([]), 0)
+        self.assertEqual(analyzer.append(pd.DataFrame()), 0)
+        self.assertEqual(analyzer.data_version, version)
+        self.assertIsNone(analyzer.aggregates)
+
+    def test_append_does_not_reread_source_header(self):
+        shutil.copy(self.test_csv, os.path.join(self.tmp, 'moved.csv'))
+        for options in ({}, {'chunksize': 4}):
+            with self.subTest(**options):
+                path = os.path.join(self.tmp, 'moved.csv')
+                analyzer = SalesAnalyzer(path, **options)
+                os.rename(path, path + '.old')
+                try:
+                    self.assertEqual(analyzer.append(NEW_ROWS), 2)
+                    self.assertIn('revenue', analyzer.columns())
+                finally:
+                    os.rename(path + '.old', path)
+
+    def test_append_with_inferred_types(self):
+        analyzer = SalesAnalyzer(self.test_csv, schema=None)
+        analyzer.append(NEW_ROWS)
+
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(analyzer.data['date']))
+        pd.testing.assert_series_equal(analyzer.monthly_trend(), self.expected.monthly_trend())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.cache import ColumnarCache
+
+class TestColumnarCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.csv = os.path.join(self.tmp, 'sales.csv')
+        shutil.copy(os.path.join(os.path.dirname(__file__), 'test_data.csv'), self.csv)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def rewrite(self, old, new, keep_mtime=False):
+        stat = os.stat(self.csv)
+        with open(self.csv) as file:
+            content = file.read()
+        with open(self.csv, 'w') as file:
+            file.write(content.replace(old, new))
+        if keep_mtime:
+            os.utime(self.csv, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def test_cold_start_writes_cache(self):
+        analyzer = SalesAnalyzer(self.csv, use_cache=True)
+
+        self.assertFalse(analyzer.cache_hit)
+        self.assertTrue(os.path.exists(os.path.join(self.csv + '.cache', 'manifest.json')))
+
+    def test_warm_start_matches_parsed_data(self):
+        cold = SalesAnalyzer(self.csv, use_cache=True)
+        warm = SalesAnalyzer(self.csv, use_cache=True)
+
+        self.assertTrue(warm.cache_hit)
+        pd.testing.assert_frame_equal(warm.data, cold.data)
+        pd.testing.assert_series_equal(warm.monthly_trend(), cold.monthly_trend())
+
+    def test_inferred_string_columns_round_trip(self):
+        cold = SalesAnalyzer(self.csv, schema=None, use_cache=True)
+        warm = SalesAnalyzer(self.csv, schema=None, use_cache=True)
+
+        self.assertTrue(warm.cache_hit)
+        pd.testing.assert_frame_equal(warm.data, cold.data)
+
+    def test_modified_file_invalidates_cache(self):
+        SalesAnalyzer(self.csv, use_cache=True)
+        self.rewrite('Laptop', 'Notebook')
+
+        analyzer = SalesAnalyzer(self.csv, use_cache=True)
+
+        self.assertFalse(analyzer.cache_hit)
+        self.assertIn('Notebook', list(analyzer.data['product']))
+
+    def test_content_hash_catches_same_size_and_mtime(self):
+        SalesAnalyzer(self.csv, use_cache=True)
+        self.rewrite('Laptop', 'Tablet', keep_mtime=True)
+
+        analyzer = SalesAnalyzer(self.csv, use_cache=True)
+
+        self.assertFalse(analyzer.cache_hit)
+        self.assertIn('Tablet', list(analyzer.data['product']))
+
+    def test_schema_change_invalidates_cache(self):
+        SalesAnalyzer(self.csv, use_cache=True)
+        analyzer = SalesAnalyzer(self.csv, schema=None, use_cache=True)
+
+        self.assertFalse(analyzer.cache_hit)
+        self.assertNotIsInstance(analyzer.data['region'].dtype, pd.CategoricalDtype)
+
+    def test_corrupt_manifest_is_a_miss(self):
+        SalesAnalyzer(self.csv, use_cache=True)
+        with open(os.path.join(self.csv + '.cache', 'manifest.json'), 'w') as file:
+            file.write('{not json')
+
+        analyzer = SalesAnalyzer(self.csv, use_cache=True)
+
+        self.assertFalse(analyzer.cache_hit)
+        self.assertTrue(SalesAnalyzer(self.csv, use_cache=True).cache_hit)
+
+    def test_custom_cache_dir_and_invalidate(self):
+        cache_dir = os.path.join(self.tmp, 'columns')
+        SalesAnalyzer(self.csv, use_cache=True, cache_dir=cache_dir)
+        cache = ColumnarCache(self.csv, cache_dir)
+
+        self.assertIsNotNone(cache.load(SalesAnalyzer(self.csv).schema))
+        cache.invalidate()
+        self.assertIsNone(cache.load(SalesAnalyzer(self.csv).schema))
+
+    def test_cache_disabled_by_default(self):
+        analyzer = SalesAnalyzer(self.csv)
+
+        self.assertIsNone(analyzer.cache)
+        self.assertFalse(os.path.exists(self.csv + '.cache'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+from unittest import mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.dataset import PartitionedDataset, MANIFEST_NAME
+from src.schema import read_csv
+
+class TestPartitionedDataset(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sales_csv = os.path.join(os.path.dirname(__file__), '..', 'data', 'sales_data.csv')
+        cls.single = SalesAnalyzer(cls.sales_csv)
+
+    def setUp(self):
+        # One file per month, in the order of the original file within each month
+        self.tmp = tempfile.mkdtemp()
+        raw = pd.read_csv(self.sales_csv)
+        raw = raw.assign(month=raw['date'].str[:7]).sort_values('month', kind='stable')
+        for month, rows in raw.groupby('month'):
+            rows.drop(columns='month').to_csv(os.path.join(self.tmp, f'sales-{month}.csv'), index=False)
+
+        # The same rows as a single file, named so that it is not a partition
+        self.ordered = os.path.join(self.tmp, 'ordered.txt')
+        raw.drop(columns='month').to_csv(self.ordered, index=False)
+
+        self.analyzer = SalesAnalyzer(self.tmp)
+        self.expected = SalesAnalyzer(self.ordered)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def read_paths(self, query):
+        with mock.patch('src.analyzer.read_csv', wraps=read_csv) as reader:
+            result = query()
+        return result, sorted(os.path.basename(call.args[0]) for call in reader.call_args_list)
+
+    def test_manifest_records_partition_statistics(self):
+        with open(os.path.join(self.tmp, MANIFEST_NAME)) as file:
+            partitions = json.load(file)['partitions']
+
+        self.assertEqual(len(partitions), 6)
+        march = partitions['sales-2024-03.csv']
+        self.assertEqual(march['min_date'][:10], '2024-03-01')
+        self.assertLessEqual(march['max_date'][:10], '2024-03-31')
+        self.assertIn('Electronics', march['categories'])
+        self.assertEqual(sum(stats['rows'] for stats in partitions.values()), 500)
+
+    def test_partitions_are_read_lazily(self):
+        self.assertTrue(self.analyzer.streaming)
+        self.assertIsNone(self.analyzer._aggregates)
+
+        self.assertEqual(self.analyzer.summary_statistics()['total_transactions'], 500)
+        self.assertIsNotNone(self.analyzer._aggregates)
+
+    def test_standard_analyses_match_single_file(self):
+        pd.testing.assert_series_equal(self.analyzer.monthly_trend(), self.single.monthly_trend())
+        pd.testing.assert_series_equal(
+            self.analyzer.total_revenue_by_category().sort_index(),
+            self.single.total_revenue_by_category().sort_index()
+        )
+        self.assertAlmostEqual(self.analyzer.summary_statistics()['total_revenue'],
+                               self.single.summary_statistics()['total_revenue'])
+
+    def test_date_range_skips_partitions(self):
+        result, paths = self.read_paths(lambda: self.analyzer.filter_date_range('2024-02-10', '2024-03-05'))
+
+        self.assertEqual(paths, ['sales-2024-02.csv', 'sales-2024-03.csv'])
+        pd.testing.assert_frame_equal(result, self.expected.filter_date_range('2024-02-10', '2024-03-05'))
+
+        total, paths = self.read_paths(lambda: self.analyzer.revenue_between('2024-06-01', '2024-06-30'))
+        self.assertEqual(paths, ['sales-2024-06.csv'])
+        self.assertAlmostEqual(total, self.single.revenue_between('2024-06-01', '2024-06-30'))
+
+    def test_category_skips_partitions(self):
+        path = os.path.join(self.tmp, 'sales-2024-07.csv')
+        pd.DataFrame([{'transaction_id': 501, 'date': '2024-07-01', 'product': 'Kite', 'category': 'Toys',
+                       'region': 'North', 'quantity': 1, 'price': 10.0}]).to_csv(path, index=False)
+        analyzer = SalesAnalyzer(self.tmp)
+
+        result, paths = self.read_paths(lambda: analyzer.filter_by_category('Toys'))
+        self.assertEqual(paths, ['sales-2024-07.csv'])
+        self.assertEqual(list(result.index), [500])
+
+    def test_no_matching_partition(self):
+        result, paths = self.read_paths(lambda: self.analyzer.filter_date_range('2030-01-01', '2030-12-31'))
+
+        self.assertEqual(paths, [])
+        self.assertEqual(len(result), 0)
+        self.assertEqual(list(result.columns), list(self.single.data.columns))
+
+    def test_manifest_refreshes_changed_partitions(self):
+        dataset = PartitionedDataset(self.tmp, self.analyzer.schema)
+        self.assertEqual(dataset.refresh(), 0)
+
+        path = os.path.join(self.tmp, 'sales-2024-01.csv')
+        rows = pd.read_csv(path)
+        rows.iloc[:5].to_csv(path, index=False)
+
+        self.assertEqual(dataset.refresh(), 1)
+        self.assertEqual(dataset.partitions[os.path.abspath(path)]['rows'], 5)
+        self.assertEqual(PartitionedDataset(self.tmp, self.analyzer.schema).refresh(), 0)
+
+    def test_glob_and_parallel_workers(self):
+        analyzer = SalesAnalyzer(os.path.join(self.tmp, 'sales-2024-0[1-3].csv'), workers=2)
+
+        self.assertEqual(len(analyzer.dataset.paths), 3)
+        self.assertEqual(analyzer.summary_statistics()['total_transactions'],
+                         len(self.single.filter_date_range('2024-01-01', '2024-03-31')))
+        pd.testing.assert_frame_equal(analyzer.filter_date_range('2024-02-01', '2024-02-29'),
+                                      self.expected.filter_date_range('2024-02-01', '2024-02-29'))
+        pd.testing.assert_frame_equal(analyzer.filter_high_quantity(4),
+                                      self.expected.filter_by(
+                                          lambda row: row['quantity'] > 4 and row['date'].month <= 3))
+
+    def test_broad_pattern_skips_manifest(self):
+        os.remove(self.ordered)
+        open(os.path.join(self.tmp, MANIFEST_NAME + '.tmp'), 'w').close()
+        pattern = os.path.join(self.tmp, '*')
+
+        SalesAnalyzer(pattern)
+        analyzer = SalesAnalyzer(pattern)
+
+        self.assertEqual(len(analyzer.dataset.paths), 6)
+        self.assertEqual(analyzer.summary_statistics()['total_transactions'], 500)
+
+    def test_no_partitions(self):
+        with self.assertRaises(ValueError):
+            SalesAnalyzer(os.path.join(self.tmp, 'missing-*.csv'))
+
+if __name__ == '__main__':
+    unittest.main()
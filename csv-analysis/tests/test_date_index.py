@@ -0,0 +1,97 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.date_index import DateIndex
+
+class TestDateIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+        cls.sales_csv = os.path.join(os.path.dirname(__file__), '..', 'data', 'sales_data.csv')
+
+    def setUp(self):
+        self.analyzer = SalesAnalyzer(self.sales_csv)
+        self.indexed = SalesAnalyzer(self.sales_csv)
+        self.index = self.indexed.index_dates()
+
+    def test_filter_matches_row_scan(self):
+        for start, end in (('2024-02-01', '2024-02-29'), ('2024-03-15', '2024-03-15'),
+                           ('2023-01-01', '2025-01-01'), ('2024-05-01', '2024-04-01')):
+            pd.testing.assert_frame_equal(self.indexed.filter_date_range(start, end),
+                                          self.analyzer.filter_date_range(start, end))
+
+    def test_revenue_and_quantity_between(self):
+        rows = self.analyzer.filter_date_range('2024-02-10', '2024-04-20')
+
+        self.assertAlmostEqual(self.indexed.revenue_between('2024-02-10', '2024-04-20'),
+                               rows['revenue'].sum())
+        self.assertEqual(self.indexed.quantity_between('2024-02-10', '2024-04-20'),
+                         rows['quantity'].sum())
+        self.assertEqual(self.index.count_between('2024-02-10', '2024-04-20'), len(rows))
+
+    def test_totals_without_index(self):
+        self.assertAlmostEqual(self.analyzer.revenue_between('2024-01-01', '2024-03-31'),
+                               self.indexed.revenue_between('2024-01-01', '2024-03-31'))
+        self.assertEqual(self.analyzer.quantity_between('2024-01-01', '2024-03-31'),
+                         self.indexed.quantity_between('2024-01-01', '2024-03-31'))
+
+    def test_streaming_totals(self):
+        streaming = SalesAnalyzer(self.sales_csv, chunksize=64)
+
+        self.assertAlmostEqual(streaming.revenue_between('2024-02-01', '2024-02-29'),
+                               self.indexed.revenue_between('2024-02-01', '2024-02-29'))
+        with self.assertRaises(ValueError):
+            streaming.index_dates()
+
+    def test_empty_and_reversed_ranges(self):
+        self.assertEqual(self.indexed.revenue_between('2030-01-01', '2030-12-31'), 0.0)
+        self.assertEqual(self.indexed.quantity_between('2024-05-01', '2024-04-01'), 0)
+        self.assertEqual(len(self.indexed.filter_date_range('2024-05-01', '2024-04-01')), 0)
+
+    def test_sorted_data_returns_slices(self):
+        data = self.analyzer.data.sort_values('date', kind='stable').reset_index(drop=True)
+        index = DateIndex(data)
+
+        self.assertTrue(index.monotonic)
+        self.assertFalse(self.index.monotonic)
+        rows = index.rows_between('2024-03-01', '2024-03-31')
+        self.assertIsInstance(rows, slice)
+        self.assertTrue((data.iloc[rows]['date'].dt.month == 3).all())
+
+    def test_missing_dates_are_not_indexed(self):
+        data = pd.DataFrame({
+            'date': pd.to_datetime(['2024-01-02', None, '2024-01-01']),
+            'revenue': [2.0, 100.0, 1.0]
+        })
+        index = DateIndex(data)
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.revenue_between('2000-01-01', '2100-01-01'), 3.0)
+        np.testing.assert_array_equal(index.rows_between('2024-01-01', '2024-01-02'), [0, 2])
+        with self.assertRaises(ValueError):
+            index.quantity_between('2024-01-01', '2024-01-02')
+
+    def test_changing_data_drops_index(self):
+        self.indexed.data = self.indexed.data.iloc[:10]
+        self.assertIsNone(self.indexed.date_index)
+
+        self.indexed.index_dates()
+        self.indexed.invalidate_results()
+        self.assertIsNone(self.indexed.date_index)
+
+    def test_inferred_schema(self):
+        inferred = SalesAnalyzer(self.sales_csv, schema=None)
+        inferred.index_dates()
+
+        self.assertAlmostEqual(inferred.revenue_between('2024-01-01', '2024-01-31'),
+                               self.indexed.revenue_between('2024-01-01', '2024-01-31'))
+
+if __name__ == '__main__':
+    unittest.main()
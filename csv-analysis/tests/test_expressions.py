@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.expressions import col, lit
+
+class TestExpressions(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+
+    def setUp(self):
+        self.analyzer = SalesAnalyzer(self.test_csv)
+        self.data = self.analyzer.data
+
+    def test_comparison_mask(self):
+        mask = (col('quantity') > 2).mask(self.data)
+        self.assertEqual(list(mask), list(self.data['quantity'] > 2))
+
+    def test_combined_predicate(self):
+        expr = (col('quantity') > 1) & col('region').isin(['North', 'East'])
+        filtered = self.analyzer.filter_by(expr)
+        expected = self.analyzer.filter_by(
+            lambda row: row['quantity'] > 1 and row['region'] in ('North', 'East')
+        )
+        pd.testing.assert_frame_equal(filtered, expected)
+
+    def test_or_and_not(self):
+        expr = ~((col('category') == 'Electronics') | (col('category') == 'Furniture'))
+        filtered = self.analyzer.filter_by(expr)
+        self.assertTrue(all(filtered['category'] == 'Clothing'))
+
+    def test_arithmetic_expression(self):
+        expr = col('quantity') * col('price') == col('revenue')
+        self.assertTrue(expr.mask(self.data).all())
+
+        expensive = self.analyzer.filter_by(col('price') * 2 > 1000)
+        self.assertTrue(all(expensive['price'] > 500))
+
+    def test_between_dates(self):
+        filtered = self.analyzer.filter_by(col('date').between('2024-01-01', '2024-01-31'))
+        self.assertTrue(all(filtered['date'].dt.month == 1))
+        self.assertGreater(len(filtered), 0)
+
+    def test_null_checks(self):
+        data = pd.DataFrame({'value': [1.0, None, 3.0]})
+        self.assertEqual(list(col('value').isnull().mask(data)), [False, True, False])
+        self.assertEqual(list(col('value').notnull().mask(data)), [True, False, True])
+        self.assertEqual(list((col('value') > 0).mask(data)), [True, False, True])
+
+    def test_columns_referenced(self):
+        expr = (col('quantity') > 1) & (col('price') * col('quantity') < lit(500))
+        self.assertEqual(expr.columns(), {'quantity', 'price'})
+
+    def test_repr(self):
+        expr = (col('quantity') > 5) & ~col('region').isin(['North'])
+        self.assertEqual(repr(expr), "((col('quantity') > 5) & ~col('region').isin(['North']))")
+
+    def test_non_predicate_rejected(self):
+        with self.assertRaises(TypeError):
+            (col('quantity') + 1).mask(self.data)
+
+    def test_unparenthesized_comparison_rejected(self):
+        with self.assertRaises(TypeError):
+            col('quantity') > 5 & col('region').isin(['North'])
+
+        with self.assertRaises(TypeError):
+            if col('quantity') > 5:
+                pass
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.memo import ResultCache
+
+class TestMemoizedResults(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+
+    def setUp(self):
+        self.analyzer = SalesAnalyzer(self.test_csv)
+
+    def test_repeated_call_is_a_hit(self):
+        first = self.analyzer.total_revenue_by_category()
+        second = self.analyzer.total_revenue_by_category()
+
+        pd.testing.assert_series_equal(first, second)
+        info = self.analyzer.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_arguments_are_part_of_the_key(self):
+        self.assertEqual(len(self.analyzer.top_products(2)), 2)
+        self.assertEqual(len(self.analyzer.top_products(3)), 3)
+        self.analyzer.top_products(2)
+
+        info = self.analyzer.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_equivalent_calls_share_an_entry(self):
+        self.analyzer.top_products()
+        self.analyzer.top_products(5)
+        self.analyzer.top_products(n=5)
+
+        info = self.analyzer.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+        with self.assertRaises(TypeError):
+            self.analyzer.top_products(m=5)
+
+    def test_returned_results_are_copies(self):
+        trend = self.analyzer.monthly_trend()
+        trend[:] = 0
+        self.analyzer.summary_statistics()['total_revenue'] = -1
+
+        self.assertGreater(self.analyzer.monthly_trend().sum(), 0)
+        self.assertGreater(self.analyzer.summary_statistics()['total_revenue'], 0)
+
+    def test_replacing_data_invalidates(self):
+        before = self.analyzer.summary_statistics()
+        version = self.analyzer.data_version
+
+        self.analyzer.data = self.analyzer.data.iloc[:4]
+
+        self.assertEqual(self.analyzer.data_version, version + 1)
+        self.assertEqual(self.analyzer.cache_info().currsize, 0)
+        self.assertEqual(self.analyzer.summary_statistics()['total_transactions'], 4)
+        self.assertNotEqual(before['total_transactions'], 4)
+
+    def test_in_place_change_needs_explicit_invalidation(self):
+        total = self.analyzer.summary_statistics()['total_revenue']
+        self.analyzer.data['revenue'] *= 2
+
+        self.assertEqual(self.analyzer.summary_statistics()['total_revenue'], total)
+        self.analyzer.invalidate_results()
+        self.assertAlmostEqual(self.analyzer.summary_statistics()['total_revenue'], total * 2)
+
+    def test_lru_eviction(self):
+        analyzer = SalesAnalyzer(self.test_csv, result_cache_size=2)
+        analyzer.top_products(1)
+        analyzer.top_products(2)
+        analyzer.top_products(1)
+        analyzer.top_products(3)
+
+        analyzer.top_products(1)
+        analyzer.top_products(2)
+        info = analyzer.cache_info()
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual((info.hits, info.misses), (2, 4))
+
+    def test_byte_budget(self):
+        cache = ResultCache(maxsize=10, max_bytes=1000)
+        cache.put('small', pd.Series(range(10)))
+        cache.put('large', pd.Series(range(1000)))
+
+        self.assertEqual(cache.info().currsize, 1)
+        self.assertLessEqual(cache.info().bytes, 1000)
+        self.assertTrue(cache.get('small')[0])
+        self.assertFalse(cache.get('large')[0])
+
+    def test_memoization_can_be_disabled(self):
+        analyzer = SalesAnalyzer(self.test_csv, result_cache_size=0)
+        analyzer.average_by_region()
+        analyzer.average_by_region()
+
+        info = analyzer.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 2, 0))
+
+    def test_streaming_results_are_memoized(self):
+        analyzer = SalesAnalyzer(self.test_csv, chunksize=3)
+        pd.testing.assert_series_equal(analyzer.monthly_trend(), analyzer.monthly_trend())
+
+        self.assertEqual(analyzer.cache_info().hits, 1)
+
+if __name__ == '__main__':
+    unittest.main()
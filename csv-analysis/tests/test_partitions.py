@@ -0,0 +1,120 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.partitions import byte_ranges, read_range, _RangeReader
+
+class TestParallelParsing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+        cls.sales_csv = os.path.join(os.path.dirname(__file__), '..', 'data', 'sales_data.csv')
+        cls.serial = SalesAnalyzer(cls.sales_csv)
+
+    def test_ranges_cover_rows_at_line_starts(self):
+        with open(self.sales_csv, 'rb') as file:
+            content = file.read()
+        ranges = byte_ranges(self.sales_csv, 7)
+
+        self.assertEqual(len(ranges), 7)
+        self.assertEqual(ranges[0][0], content.index(b'\n') + 1)
+        self.assertEqual(ranges[-1][1], len(content))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(content[start - 1:start], b'\n')
+
+    def test_partitions_parse_to_the_whole_file(self):
+        frames = [read_range(self.sales_csv, start, end, self.serial.schema)
+                  for start, end in byte_ranges(self.sales_csv, 4)]
+
+        self.assertEqual(sum(len(frame) for frame in frames), len(self.serial.data))
+        self.assertEqual(list(frames[-1].columns), list(pd.read_csv(self.sales_csv, nrows=0).columns))
+
+    def test_chunked_range_streams_rows(self):
+        start, end = byte_ranges(self.sales_csv, 3)[1]
+        # Without a schema, so chunks do not differ in categories or float width
+        whole = read_range(self.sales_csv, start, end)
+        chunks = list(read_range(self.sales_csv, start, end, chunksize=40))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 40 for chunk in chunks))
+        pd.testing.assert_frame_equal(pd.concat(chunks), whole)
+
+        with open(self.sales_csv, 'rb') as file:
+            header = file.readline()
+            file.seek(start)
+            stream = _RangeReader(file, header, end - start)
+            content = b''.join(iter(lambda: stream.read(100), b''))
+            file.seek(start)
+            self.assertEqual(content, header + file.read(end - start))
+
+    def test_more_partitions_than_rows(self):
+        ranges = byte_ranges(self.test_csv, 50)
+
+        self.assertEqual(len(ranges), 10)
+        self.assertEqual(len(SalesAnalyzer(self.test_csv, workers=50).data), 10)
+
+    def test_parallel_load_matches_serial(self):
+        parallel = SalesAnalyzer(self.sales_csv, workers=3)
+
+        pd.testing.assert_frame_equal(parallel.data, self.serial.data)
+        pd.testing.assert_series_equal(parallel.monthly_trend(), self.serial.monthly_trend())
+
+    def test_parallel_load_with_inferred_types(self):
+        parallel = SalesAnalyzer(self.sales_csv, schema=None, workers=2)
+        serial = SalesAnalyzer(self.sales_csv, schema=None)
+
+        pd.testing.assert_frame_equal(parallel.data, serial.data)
+
+    def test_parallel_aggregates_match_serial(self):
+        parallel = SalesAnalyzer(self.sales_csv, chunksize=50, workers=3)
+
+        self.assertTrue(parallel.streaming)
+        pd.testing.assert_series_equal(
+            parallel.total_revenue_by_category().sort_index(),
+            self.serial.total_revenue_by_category().sort_index()
+        )
+        pd.testing.assert_series_equal(parallel.monthly_trend(), self.serial.monthly_trend())
+        self.assertEqual(parallel.summary_statistics()['total_transactions'], len(self.serial.data))
+        self.assertAlmostEqual(parallel.summary_statistics()['total_revenue'],
+                               self.serial.summary_statistics()['total_revenue'])
+
+    def test_single_worker_is_serial(self):
+        analyzer = SalesAnalyzer(self.test_csv, workers=1)
+
+        self.assertEqual(len(analyzer.data), 10)
+
+    def test_empty_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'empty.csv')
+            with open(self.test_csv) as source, open(path, 'w') as target:
+                target.write(source.readline())
+
+            self.assertEqual(len(byte_ranges(path, 4)), 1)
+            self.assertEqual(len(SalesAnalyzer(path, workers=4).data), 0)
+            self.assertEqual(SalesAnalyzer(path, chunksize=10, workers=4).aggregates.transactions, 0)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_missing_trailing_newline(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'sales.csv')
+            with open(self.test_csv) as source, open(path, 'w') as target:
+                target.write(source.read().rstrip('\n'))
+
+            parallel = SalesAnalyzer(path, workers=3)
+            pd.testing.assert_frame_equal(parallel.data, SalesAnalyzer(path).data)
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from unittest import mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.expressions import col
+from src.query import Filter, WithColumn, prune_arguments
+from src.schema import read_csv
+
+class TestQuery(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+        cls.sales_csv = os.path.join(os.path.dirname(__file__), '..', 'data', 'sales_data.csv')
+
+    def setUp(self):
+        self.analyzer = SalesAnalyzer(self.sales_csv)
+        self.data = self.analyzer.data
+
+    def test_filters_are_fused_and_pushed_to_the_scan(self):
+        query = (self.analyzer.query()
+                 .with_column('net', col('revenue') * 0.9)
+                 .filter(col('region') == 'North')
+                 .filter(col('quantity') > 2)
+                 .group_by('category', 'net'))
+        plan = query.optimize()
+
+        self.assertEqual(repr(plan.scan.predicate), "((col('region') == 'North') & (col('quantity') > 2))")
+        self.assertEqual([type(step) for step in plan.steps[:1]], [WithColumn])
+        self.assertFalse(any(isinstance(step, Filter) for step in plan.steps))
+        self.assertEqual(plan.scan.columns, {'category', 'region', 'quantity', 'revenue'})
+
+    def test_grouped_result_matches_eager_chain(self):
+        result = (self.analyzer.query()
+                  .filter(col('category') == 'Electronics')
+                  .group_by('region')
+                  .top(3)
+                  .collect())
+
+        eager = self.analyzer.filter_by_category('Electronics').groupby('region', observed=True)['revenue'].sum()
+        pd.testing.assert_series_equal(result, eager.nlargest(3))
+
+    def test_unused_computed_columns_are_dropped(self):
+        query = (self.analyzer.query()
+                 .with_column('unused', col('price') * 2)
+                 .with_column('net', col('revenue') - 1)
+                 .select('product', 'net'))
+        plan = query.optimize()
+
+        self.assertEqual([step.name for step in plan.steps if isinstance(step, WithColumn)], ['net'])
+        self.assertEqual(plan.scan.columns, {'product', 'revenue'})
+        self.assertEqual(list(query.collect().columns), ['product', 'net'])
+
+    def test_filter_on_computed_column_stays_above_it(self):
+        query = (self.analyzer.query()
+                 .with_column('big', col('revenue') > 1000)
+                 .filter(col('big'))
+                 .select('transaction_id'))
+        plan = query.optimize()
+
+        self.assertIsNone(plan.scan.predicate)
+        self.assertEqual(len(query.collect()), int((self.data['revenue'] > 1000).sum()))
+
+    def test_top_rows_keeps_filter_order(self):
+        # Filtering after top() must not move below it
+        query = self.analyzer.query().top(10, 'revenue').filter(col('region') == 'North')
+
+        expected = self.data.nlargest(10, 'revenue')
+        pd.testing.assert_frame_equal(query.collect(), expected[expected['region'] == 'North'])
+
+    def test_result_does_not_alias_analyzer_data(self):
+        result = self.analyzer.query().collect()
+        result.loc[result.index[0], 'quantity'] = 99
+
+        self.assertNotEqual(self.analyzer.data['quantity'].iloc[0], 99)
+
+    def test_streaming_reads_only_needed_columns(self):
+        streaming = SalesAnalyzer(self.sales_csv, chunksize=64)
+        query = streaming.query().filter(col('quantity') >= 4).group_by('region', 'price', 'max')
+
+        with mock.patch('src.analyzer.read_csv', wraps=read_csv) as reader:
+            result = query.collect()
+
+        self.assertEqual(set(reader.call_args.kwargs['usecols']), {'quantity', 'region', 'price'})
+        expected = self.data[self.data['quantity'] >= 4].groupby('region', observed=True)['price'].max()
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_partitions_pruned_from_predicate(self):
+        directory = tempfile.mkdtemp()
+        try:
+            raw = pd.read_csv(self.sales_csv)
+            for month, rows in raw.groupby(raw['date'].str[:7]):
+                rows.to_csv(os.path.join(directory, f'{month}.csv'), index=False)
+            dataset = SalesAnalyzer(directory)
+
+            query = dataset.query().filter(col('date').between('2024-04-03', '2024-04-20')).select('revenue')
+            with mock.patch('src.analyzer.read_csv', wraps=read_csv) as reader:
+                result = query.collect()
+
+            self.assertEqual([os.path.basename(call.args[0]) for call in reader.call_args_list], ['2024-04.csv'])
+            self.assertAlmostEqual(result['revenue'].sum(),
+                                   self.analyzer.revenue_between('2024-04-03', '2024-04-20'))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_prune_arguments(self):
+        predicate = ((col('date') >= '2024-02-01') & ('2024-03-01' > col('date'))
+                     & (col('category') == 'Furniture') & (col('quantity') > 1))
+
+        self.assertEqual(prune_arguments(predicate), {
+            'start_date': pd.Timestamp('2024-02-01'),
+            'end_date': pd.Timestamp('2024-03-01'),
+            'category': 'Furniture'
+        })
+        self.assertEqual(prune_arguments((col('date') >= '2024-02-01') | (col('quantity') > 1)), {})
+
+    def test_invalid_queries(self):
+        query = self.analyzer.query()
+
+        with self.assertRaises(TypeError):
+            query.filter(lambda row: row['quantity'] > 1)
+        with self.assertRaises(ValueError):
+            query.select('discount')
+        with self.assertRaises(ValueError):
+            query.select('product').filter(col('region') == 'North')
+        with self.assertRaises(ValueError):
+            query.group_by('region').filter(col('quantity') > 1)
+        with self.assertRaises(ValueError):
+            query.group_by('region', how='median')
+        with self.assertRaises(ValueError):
+            query.top(3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+import sys
+import os
+import math
+import operator
+from functools import reduce
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.reducers import grouped_reduce, kernel
+
+def reference(data, group_field, field, reducer, initial=None):
+    # Row-by-row reduction in file order, as the original implementation did
+    groups = {}
+    for key, value in zip(data[group_field], data[field]):
+        if not pd.isna(key):
+            groups.setdefault(key, []).append(value)
+    if initial is None:
+        return {key: reduce(reducer, values) for key, values in groups.items()}
+    return {key: reduce(reducer, values, initial) for key, values in groups.items()}
+
+class TestGroupedReduce(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+        cls.sales_csv = os.path.join(os.path.dirname(__file__), '..', 'data', 'sales_data.csv')
+
+    def setUp(self):
+        self.analyzer = SalesAnalyzer(self.sales_csv)
+        self.data = self.analyzer.data
+
+    def assert_close(self, result, expected):
+        self.assertEqual(result.keys(), expected.keys())
+        for key, value in expected.items():
+            self.assertTrue(math.isclose(result[key], value, rel_tol=1e-9), key)
+
+    def test_default_sum_matches_row_reduction(self):
+        self.assert_close(self.analyzer.aggregate_with_reduce('category'),
+                          reference(self.data, 'category', 'revenue', operator.add))
+
+    def test_known_reducers_use_kernels(self):
+        self.assertEqual(kernel('sum'), 'sum')
+        self.assertEqual(kernel(operator.mul), 'prod')
+        self.assertEqual(kernel(min), 'min')
+        self.assertEqual(kernel(np.maximum), 'max')
+        self.assertIsNone(kernel(lambda acc, x: acc + x))
+
+    def test_named_and_builtin_reducers(self):
+        for reducer, function in (('min', min), (max, max), ('prod', operator.mul)):
+            self.assertEqual(
+                self.analyzer.aggregate_with_reduce('region', reducer, field='quantity'),
+                reference(self.data, 'region', 'quantity', function)
+            )
+
+    def test_arbitrary_reducer_keeps_row_order(self):
+        # Not associative, so the result depends on the order values are folded in
+        decay = lambda acc, x: acc * 0.5 + x
+        self.assert_close(self.analyzer.aggregate_with_reduce('product', decay, initial=0),
+                          reference(self.data, 'product', 'revenue', decay, 0))
+
+    def test_initial_value(self):
+        self.assertEqual(
+            self.analyzer.aggregate_with_reduce('region', 'max', field='quantity', initial=100),
+            {key: 100 for key in self.data['region'].unique()}
+        )
+        self.assertEqual(
+            self.analyzer.aggregate_with_reduce('region', lambda acc, x: acc + [x], field='quantity',
+                                                initial=[])['North'],
+            self.data.loc[self.data['region'] == 'North', 'quantity'].tolist()
+        )
+
+    def test_streaming_matches_in_memory(self):
+        streaming = SalesAnalyzer(self.sales_csv, chunksize=64)
+        decay = lambda acc, x: acc * 0.5 + x
+
+        self.assert_close(streaming.aggregate_with_reduce('category'),
+                          self.analyzer.aggregate_with_reduce('category'))
+        self.assert_close(streaming.aggregate_with_reduce('region', decay, initial=0),
+                          self.analyzer.aggregate_with_reduce('region', decay, initial=0))
+
+    def test_missing_keys_and_values(self):
+        data = pd.DataFrame({'key': ['a', None, 'a', 'b'], 'value': [1.0, 2.0, np.nan, 3.0]})
+
+        result = grouped_reduce(data, 'key', 'value', 'sum')
+        self.assertEqual(set(result), {'a', 'b'})
+        self.assertTrue(math.isnan(result['a']))
+        self.assertEqual(result['b'], 3.0)
+        self.assertTrue(math.isnan(grouped_reduce(data, 'key', 'value', 'max')['a']))
+        self.assertEqual(grouped_reduce(data, 'key', 'value', lambda acc, x: acc + 1, initial=0),
+                         {'a': 2, 'b': 1})
+
+    def test_totals_are_continued(self):
+        first = pd.DataFrame({'key': ['a', 'b'], 'value': [1, 2]})
+        second = pd.DataFrame({'key': ['a', 'c'], 'value': [3, 4]})
+        totals = grouped_reduce(first, 'key', 'value', 'sum')
+
+        self.assertIs(grouped_reduce(second, 'key', 'value', 'sum', totals=totals), totals)
+        self.assertEqual(totals, {'a': 4, 'b': 2, 'c': 4})
+
+    def test_unknown_reducer_name(self):
+        with self.assertRaises(ValueError):
+            self.analyzer.aggregate_with_reduce('region', 'median')
+
+if __name__ == '__main__':
+    unittest.main()
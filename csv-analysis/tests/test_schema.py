@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pandas as pd
+
+from src.analyzer import SalesAnalyzer
+from src.expressions import col
+from src.schema import SALES_SCHEMA, read_csv, downcast
+
+class TestSchema(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_csv = os.path.join(os.path.dirname(__file__), 'test_data.csv')
+        cls.sales_csv = os.path.join(os.path.dirname(__file__), '..', 'data', 'sales_data.csv')
+
+    def setUp(self):
+        self.analyzer = SalesAnalyzer(self.sales_csv)
+        self.inferred = SalesAnalyzer(self.sales_csv, schema=None)
+
+    def test_strings_load_as_categoricals(self):
+        for column in ('product', 'category', 'region'):
+            self.assertIsInstance(self.analyzer.data[column].dtype, pd.CategoricalDtype)
+
+    def test_integers_stay_64_bit(self):
+        self.assertEqual(self.analyzer.data['quantity'].dtype, np.int64)
+        self.assertEqual(self.analyzer.data['transaction_id'].dtype, np.int64)
+
+    def test_expression_arithmetic_matches_inferred_types(self):
+        # Narrow integer columns would wrap around in these products
+        predicate = col('quantity') * 100 > 500
+        pd.testing.assert_frame_equal(self.analyzer.filter_by(predicate)[['transaction_id', 'quantity']],
+                                      self.inferred.filter_by(predicate)[['transaction_id', 'quantity']])
+
+        query = lambda analyzer: (analyzer.query().with_column('q', col('transaction_id') * 1000)
+                                  .top(3, 'q').select('q').collect())
+        pd.testing.assert_frame_equal(query(self.analyzer), query(self.inferred))
+        self.assertEqual(query(self.analyzer)['q'].iloc[0], 500000)
+
+    def test_floats_downcast_only_without_loss(self):
+        exact = downcast(pd.DataFrame({'price': [1.5, 2.25]}), {'price': 'float'})
+        lossy = downcast(pd.DataFrame({'price': [25.99, 1.0]}), {'price': 'float'})
+
+        self.assertEqual(exact['price'].dtype, np.float32)
+        self.assertEqual(lossy['price'].dtype, np.float64)
+
+    def test_dates_parsed_while_reading(self):
+        data = read_csv(self.test_csv, SALES_SCHEMA)
+
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(data['date']))
+        self.assertEqual(data['date'].iloc[0], pd.Timestamp('2024-01-15'))
+
+    def test_results_match_inferred_types(self):
+        pd.testing.assert_series_equal(
+            self.analyzer.total_revenue_by_category(),
+            self.inferred.total_revenue_by_category(),
+            check_index_type=False, check_categorical=False
+        )
+        pd.testing.assert_series_equal(self.analyzer.monthly_trend(), self.inferred.monthly_trend())
+        self.assertAlmostEqual(self.analyzer.summary_statistics()['total_revenue'],
+                               self.inferred.summary_statistics()['total_revenue'])
+        self.assertEqual(len(self.analyzer.filter_by_category('Electronics')),
+                         len(self.inferred.filter_by_category('Electronics')))
+
+    def test_memory_report(self):
+        report = self.analyzer.memory_report(baseline=True)
+
+        self.assertIn('total', report.index)
+        self.assertEqual(report.loc['region', 'dtype'], 'category')
+        self.assertLess(report.loc['total', 'ratio'], 0.5)
+
+    def test_memory_report_requires_loaded_data(self):
+        streaming = SalesAnalyzer(self.test_csv, chunksize=4)
+        with self.assertRaises(ValueError):
+            streaming.memory_report()
+
+    def test_unknown_kind_rejected(self):
+        with self.assertRaises(ValueError):
+            read_csv(self.test_csv, {'price': 'decimal'})
+
+    def test_schema_none_infers_types(self):
+        self.assertEqual(self.inferred.data['quantity'].dtype, np.int64)
+        self.assertNotIsInstance(self.inferred.data['region'].dtype, pd.CategoricalDtype)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Serialization cost benchmark for the transport serializers.
+
+Each serializer round-trips a set of representative items: a small record
+dict, a list of integers, a 1 MiB bytes payload, a 1 MiB bytearray and,
+when numpy is installed, a 1 MiB float array. For every pair the benchmark
+reports serialize and deserialize time per item, the encoded size and how
+many frames the item was split into (more than one means large buffers went
+out of band instead of being copied into the stream). Serializers that do
+not support an item type are reported as unsupported.
+
+Usage:
+    python benchmarks/serializers.py [--repeat 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.serializers import SERIALIZERS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def representative_items():
+    """Build the named items to round-trip"""
+    items = {
+        'small dict': {'id': 42, 'name': 'widget', 'price': 9.99, 'tags': ['a', 'b']},
+        'ints list': list(range(10000)),
+        '1 MiB bytes': os.urandom(1 << 20),
+        '1 MiB bytearray': bytearray(os.urandom(1 << 20))
+    }
+    if numpy is not None:
+        items['1 MiB ndarray'] = numpy.random.default_rng(0).random((1 << 20) // 8)
+    return items
+
+
+def run_pair(serializer, item, repeat):
+    """Round-trip one item repeatedly and return timing and size figures"""
+    frames = serializer.dumps(item)
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        frames = serializer.dumps(item)
+    serialize = (time.perf_counter() - started) / repeat
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        serializer.loads(frames)
+    deserialize = (time.perf_counter() - started) / repeat
+
+    return {
+        'serialize_us': serialize * 1e6,
+        'deserialize_us': deserialize * 1e6,
+        'size': sum(memoryview(frame).nbytes for frame in frames),
+        'frames': len(frames)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    items = representative_items()
+
+    print(f"Round trips per item: {args.repeat}  |  numpy: {'yes' if numpy else 'no'}")
+    print("-" * 78)
+    print(f"{'Item':<18}{'Serializer':<12}{'dumps (us)':>12}{'loads (us)':>12}"
+          f"{'Size (bytes)':>15}{'Frames':>9}")
+    print("-" * 78)
+
+    for item_name, item in items.items():
+        for name, serializer_class in SERIALIZERS.items():
+            try:
+                result = run_pair(serializer_class(), item, args.repeat)
+            except (TypeError, ValueError):
+                print(f"{item_name:<18}{name:<12}{'unsupported':>12}")
+                continue
+
+            print(f"{item_name:<18}{name:<12}{result['serialize_us']:>12.1f}"
+                  f"{result['deserialize_us']:>12.1f}{result['size']:>15}{result['frames']:>9}")
+
+    print("-" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Handoff latency benchmark for SharedBuffer wait strategies.
+
+A producer thread puts timestamped items into the buffer with a fixed gap
+between them, and a consumer thread records how long each item took from
+put to get. For every wait strategy the benchmark reports p50 and p99
+handoff latency next to the CPU spent by the waiting consumer thread, so
+latency can be weighed against CPU cost. Results are most meaningful with
+at least two free cores; on a single core spinning competes with the producer.
+
+Usage:
+    python benchmarks/wait_strategies.py [--items 5000] [--gap-us 200]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.buffer import SharedBuffer
+from src.wait_strategy import WAIT_STRATEGIES
+
+
+def percentile(sorted_values, pct):
+    """Return the pct-th percentile of an already sorted list"""
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))
+    return sorted_values[index]
+
+
+def run_strategy(name, items, gap):
+    """Run one handoff benchmark and return latency and CPU figures"""
+    buffer = SharedBuffer(capacity=64, wait_strategy=name)
+    latencies = []
+    consumer_cpu = [0.0]
+
+    def producer():
+        for _ in range(items):
+            # Pace the producer without sleeping, to keep the gap precise
+            until = time.perf_counter() + gap
+            while time.perf_counter() < until:
+                pass
+            buffer.put(time.perf_counter())
+        buffer.mark_complete()
+
+    def consumer():
+        cpu_start = time.thread_time()
+        while True:
+            stamp = buffer.get()
+            if stamp is None:
+                break
+            latencies.append(time.perf_counter() - stamp)
+        consumer_cpu[0] = time.thread_time() - cpu_start
+
+    producer_thread = threading.Thread(target=producer)
+    consumer_thread = threading.Thread(target=consumer)
+
+    wall_start = time.perf_counter()
+    consumer_thread.start()
+    producer_thread.start()
+    producer_thread.join()
+    consumer_thread.join()
+    wall = time.perf_counter() - wall_start
+    cpu = consumer_cpu[0]
+
+    latencies.sort()
+    return {
+        'p50_us': percentile(latencies, 50) * 1e6,
+        'p99_us': percentile(latencies, 99) * 1e6,
+        'cpu_pct': cpu / wall * 100,
+        'cpu_us_per_item': cpu / items * 1e6
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--gap-us', type=float, default=200)
+    args = parser.parse_args()
+
+    print(f"Handoffs: {args.items}  |  Producer gap: {args.gap_us:.0f} us  |  CPUs: {os.cpu_count()}")
+    print("-" * 68)
+    print(f"{'Strategy':<12}{'p50 (us)':>12}{'p99 (us)':>12}{'Consumer CPU (%)':>18}{'CPU us/item':>14}")
+    print("-" * 68)
+
+    for name in WAIT_STRATEGIES:
+        result = run_strategy(name, args.items, args.gap_us / 1e6)
+        print(f"{name:<12}{result['p50_us']:>12.1f}{result['p99_us']:>12.1f}"
+              f"{result['cpu_pct']:>18.1f}{result['cpu_us_per_item']:>14.1f}")
+
+    print("-" * 68)
+
+
+if __name__ == "__main__":
+    main()
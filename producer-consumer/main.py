@@ -8,6 +8,17 @@ pattern using Python's threading primitives. It includes:
 - SharedBuffer: Thread-safe buffer with blocking operations
 - Producer: Component that produces items into the buffer
 - Consumer: Component that consumes items from the buffer
+- BatchConsumer: Consumer that processes items in size/linger-bounded batches
+- Wait strategies: Blocking, spin-then-park and busy-spin buffer handoff
+- BroadcastRing: Ring buffer delivering every item to several consumer groups
+- CoalescingBuffer: Buffer keeping only the newest pending value per key
+- BufferServer / RemoteBuffer: Socket transport for producers and consumers in other processes
+- FileLineSource / CSVRecordSource: Chunked streaming sources for large files
+- JsonLinesSink / BinaryRecordSink: Buffered file sinks with group-commit fsync
+- LockProfiler: Opt-in lock-contention profiling for buffers
+- TraceRecorder / Trace: Workload recording and reproducible replay
+- WindowAggregator / WindowConsumer: Tumbling and sliding window aggregation
+- Serializers: Pickle (with out-of-band buffers), marshal and raw bytes item encoding
 
 Usage:
     from main import ProducerConsumerPipeline
@@ -19,12 +30,53 @@ Usage:
 
 from src.pipeline import ProducerConsumerPipeline
 from src.buffer import SharedBuffer
+from src.coalescing_buffer import CoalescingBuffer
 from src.producer import Producer
 from src.consumer import Consumer
+from src.batch_consumer import BatchConsumer
+from src.broadcast_ring import BroadcastRing, BroadcastGroup
+from src.transport import BufferServer, RemoteBuffer
+from src.sources import FileLineSource, CSVRecordSource
+from src.sinks import JsonLinesSink, BinaryRecordSink
+from src.profiling import LockProfiler, ProfiledCondition
+from src.trace import Trace, TraceEvent, TraceRecorder, TraceReplayer
+from src.windowing import TumblingWindows, SlidingWindows, WindowAggregator, WindowConsumer
+from src.serializers import PickleSerializer, MarshalSerializer, BytesSerializer
+from src.wait_strategy import (
+    BlockingWaitStrategy,
+    SpinYieldParkWaitStrategy,
+    BusySpinWaitStrategy
+)
 
 __all__ = [
     'ProducerConsumerPipeline',
     'SharedBuffer',
+    'CoalescingBuffer',
     'Producer',
-    'Consumer'
+    'Consumer',
+    'BatchConsumer',
+    'BroadcastRing',
+    'BroadcastGroup',
+    'BufferServer',
+    'RemoteBuffer',
+    'FileLineSource',
+    'CSVRecordSource',
+    'JsonLinesSink',
+    'BinaryRecordSink',
+    'LockProfiler',
+    'ProfiledCondition',
+    'Trace',
+    'TraceEvent',
+    'TraceRecorder',
+    'TraceReplayer',
+    'TumblingWindows',
+    'SlidingWindows',
+    'WindowAggregator',
+    'WindowConsumer',
+    'PickleSerializer',
+    'MarshalSerializer',
+    'BytesSerializer',
+    'BlockingWaitStrategy',
+    'SpinYieldParkWaitStrategy',
+    'BusySpinWaitStrategy'
 ]
\ No newline at end of file
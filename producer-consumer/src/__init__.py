@@ -1,4 +1,19 @@
 from .buffer import SharedBuffer
+from .coalescing_buffer import CoalescingBuffer
 from .producer import Producer
 from .consumer import Consumer
-from .pipeline import ProducerConsumerPipeline
\ No newline at end of file
+from .batch_consumer import BatchConsumer
+from .pipeline import ProducerConsumerPipeline
+from .broadcast_ring import BroadcastRing, BroadcastGroup
+from .transport import BufferServer, RemoteBuffer
+from .sources import FileLineSource, CSVRecordSource
+from .sinks import JsonLinesSink, BinaryRecordSink
+from .profiling import LockProfiler, ProfiledCondition
+from .trace import Trace, TraceEvent, TraceRecorder, TraceReplayer
+from .windowing import TumblingWindows, SlidingWindows, WindowAggregator, WindowConsumer
+from .serializers import PickleSerializer, MarshalSerializer, BytesSerializer
+from .wait_strategy import (
+    BlockingWaitStrategy,
+    SpinYieldParkWaitStrategy,
+    BusySpinWaitStrategy
+)
\ No newline at end of file
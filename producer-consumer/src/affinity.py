@@ -0,0 +1,180 @@
+import os
+
+# Where Linux exposes each CPU's core and package
+SYS_CPU_PATH = '/sys/devices/system/cpu'
+
+
+def affinity_supported():
+    """
+    Check whether threads can be pinned to CPUs on this platform.
+
+    Returns:
+        True if os.sched_setaffinity is available
+    """
+    return hasattr(os, 'sched_setaffinity')
+
+
+def available_cpus():
+    """
+    Get the CPUs the current process may run on.
+
+    Returns:
+        Sorted list of CPU numbers
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def pin_current_thread(cpus):
+    """
+    Restrict the calling thread to a set of CPUs.
+
+    On Linux, affinity is per thread, so this only moves the caller.
+
+    Args:
+        cpus: Iterable of CPU numbers
+    """
+    os.sched_setaffinity(0, set(cpus))
+
+
+class CpuTopology:
+    """
+    Physical layout of the CPUs available to the process.
+
+    Each CPU belongs to a physical core, and each core to a package (socket).
+    CPUs of the same core are hardware threads that share the core's caches;
+    cores of the same package share its last-level cache.
+    """
+
+    def __init__(self, cores):
+        """
+        Initialize the topology from its cores.
+
+        Args:
+            cores: Dictionary mapping (package, core) to the sorted list of
+                  available CPUs on that core
+        """
+        self.cores = cores
+
+    @classmethod
+    def detect(cls, sys_path=SYS_CPU_PATH):
+        """
+        Read the topology of the available CPUs from sysfs.
+
+        CPUs without topology information are treated as separate cores of
+        package 0, which is also the result on platforms without sysfs.
+
+        Args:
+            sys_path: Root of the sysfs CPU directory (default: Linux path)
+
+        Returns:
+            CpuTopology instance
+        """
+        cores = {}
+
+        for cpu in available_cpus():
+            topology = os.path.join(sys_path, f'cpu{cpu}', 'topology')
+            try:
+                package = _read_int(os.path.join(topology, 'physical_package_id'))
+                core = _read_int(os.path.join(topology, 'core_id'))
+            except (OSError, ValueError):
+                package, core = 0, ('cpu', cpu)
+
+            cores.setdefault((package, core), []).append(cpu)
+
+        return cls({key: sorted(cpus) for key, cpus in cores.items()})
+
+    @property
+    def cpus(self):
+        """Sorted list of every available CPU."""
+        return sorted(cpu for cpus in self.cores.values() for cpu in cpus)
+
+    def spread_order(self):
+        """
+        Order CPUs so consecutive picks land on different cores and packages.
+
+        The first hardware thread of every core comes first, alternating
+        between packages, followed by the second threads, and so on.
+
+        Returns:
+            List of CPU numbers
+        """
+        packages = {}
+        for (package, _), cpus in sorted(self.cores.items(), key=lambda entry: entry[1][0]):
+            packages.setdefault(package, []).append(cpus)
+
+        # Alternate between packages when taking cores, then between cores
+        cores = _interleave(list(packages.values()))
+        return _interleave(cores)
+
+    def compact_order(self):
+        """
+        Order CPUs so consecutive picks share a core, then a package.
+
+        All hardware threads of a core come together, and the cores of a
+        package come before the next package.
+
+        Returns:
+            List of CPU numbers
+        """
+        order = []
+        for _, cpus in sorted(self.cores.items(), key=lambda entry: (entry[0][0], entry[1][0])):
+            order.extend(cpus)
+        return order
+
+
+# Placement strategies and how each orders the CPUs it assigns
+PLACEMENTS = {
+    'spread': CpuTopology.spread_order,
+    'pairs': CpuTopology.compact_order
+}
+
+
+def plan_placement(placement, workers, topology=None):
+    """
+    Assign each worker a CPU according to a placement strategy.
+
+    'spread' gives workers separate cores, spread across packages, before
+    doubling up on hardware threads. 'pairs' keeps the producer and the first
+    consumer on sibling hardware threads of one core (or neighbouring cores of
+    one package without SMT) so handoffs stay in shared cache, and packs
+    further workers next to them. When there are more workers than CPUs,
+    assignment wraps around.
+
+    Args:
+        placement: 'spread', 'pairs', or None for no pinning
+        workers: List of worker names, the producer first
+        topology: Optional CpuTopology (default: detected)
+
+    Returns:
+        Dictionary mapping worker names to a one-CPU list; empty when
+        placement is None
+
+    Raises:
+        ValueError: If the placement strategy is unknown
+    """
+    if placement is None:
+        return {}
+
+    if placement not in PLACEMENTS:
+        raise ValueError(
+            f"Unknown placement '{placement}', expected one of {sorted(PLACEMENTS)}"
+        )
+
+    topology = topology or CpuTopology.detect()
+    order = PLACEMENTS[placement](topology)
+
+    return {worker: [order[index % len(order)]] for index, worker in enumerate(workers)}
+
+
+def _read_int(path):
+    """Read an integer from a sysfs file."""
+    with open(path) as file:
+        return int(file.read())
+
+
+def _interleave(lists):
+    """Take one element from each list in turn until all are exhausted."""
+    longest = max((len(items) for items in lists), default=0)
+    return [items[index] for index in range(longest) for items in lists if index < len(items)]
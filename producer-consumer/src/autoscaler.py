@@ -0,0 +1,191 @@
+import threading
+import time
+
+
+class ConsumerAutoscaler:
+    """
+    Controller that grows and shrinks a pool of consumer threads with load.
+
+    A controller thread samples the shared buffer depth and consumer utilization
+    at a fixed interval. When the backlog persists for several samples while the
+    consumers are busy, it spawns another consumer (up to max_consumers). When a
+    consumer has been idle for the cool-down period, it retires one (down to
+    min_consumers). Every scaling decision is recorded as an event.
+    """
+
+    def __init__(self, shared_buffer, consumer_factory, min_consumers=1,
+                 max_consumers=4, scale_up_depth=None, scale_up_samples=3,
+                 busy_threshold=0.5, idle_cooldown=1.0, interval=0.05,
+                 on_scale=None):
+        """
+        Initialize the autoscaler with pool limits and scaling thresholds.
+
+        Args:
+            shared_buffer: The SharedBuffer whose depth drives scaling
+            consumer_factory: Function() returning a new Consumer; consumers
+                             should have a poll_interval so they can be retired
+            min_consumers: Minimum number of active consumers (default: 1)
+            max_consumers: Maximum number of active consumers (default: 4)
+            scale_up_depth: Buffer depth counted as backlog (default: half the
+                           buffer capacity, at least 1)
+            scale_up_samples: Consecutive backlog samples before scaling up
+                             (default: 3)
+            busy_threshold: Minimum average consumer utilization, between 0
+                           and 1, required to scale up (default: 0.5)
+            idle_cooldown: Seconds a consumer must be idle before it is
+                          retired (default: 1.0)
+            interval: Seconds between controller samples (default: 0.05)
+            on_scale: Optional callback function(event) called on each
+                     scaling event
+
+        Raises:
+            ValueError: If the consumer limits are inconsistent
+        """
+        if min_consumers < 1 or max_consumers < min_consumers:
+            raise ValueError("Require 1 <= min_consumers <= max_consumers")
+
+        self.shared_buffer = shared_buffer
+        self.consumer_factory = consumer_factory
+        self.min_consumers = min_consumers
+        self.max_consumers = max_consumers
+        self.scale_up_depth = scale_up_depth or max(1, shared_buffer.capacity // 2)
+        self.scale_up_samples = scale_up_samples
+        self.busy_threshold = busy_threshold
+        self.idle_cooldown = idle_cooldown
+        self.interval = interval
+        self.on_scale = on_scale
+
+        # Every consumer ever started, in start order, with its thread
+        self.consumers = []
+        self.threads = []
+
+        # Scaling events and the largest pool size reached
+        self.events = []
+        self.peak_consumers = 0
+
+        self.controller_thread = None
+        self.started_at = None
+
+    def start(self):
+        """
+        Start the minimum number of consumers and the controller thread.
+        """
+        self.started_at = time.monotonic()
+
+        for _ in range(self.min_consumers):
+            self._spawn()
+
+        self.controller_thread = threading.Thread(target=self._control_loop)
+        self.controller_thread.start()
+
+    def join(self):
+        """
+        Wait for the controller and every consumer thread to finish.
+        """
+        self.controller_thread.join()
+        for thread in self.threads:
+            thread.join()
+
+    def active_consumers(self):
+        """
+        Get consumers that are running and have not been asked to retire.
+
+        Returns:
+            List of active Consumer instances
+        """
+        return [
+            consumer for consumer, thread in zip(self.consumers, self.threads)
+            if thread.is_alive() and not consumer.retire_requested
+        ]
+
+    def get_stats(self):
+        """
+        Get pool limits, peak size and scaling events.
+
+        Returns:
+            Dictionary with 'min_consumers', 'max_consumers', 'peak_consumers',
+            'total_consumers' and the list of 'events'
+        """
+        return {
+            'min_consumers': self.min_consumers,
+            'max_consumers': self.max_consumers,
+            'peak_consumers': self.peak_consumers,
+            'total_consumers': len(self.consumers),
+            'events': list(self.events)
+        }
+
+    def _control_loop(self):
+        """
+        Sample depth and utilization and scale until the buffer is drained.
+        """
+        backlog_samples = 0
+        last_sample = time.monotonic()
+        last_busy = {id(c): c.busy_time for c in self.consumers}
+
+        while not self.shared_buffer.is_drained():
+            time.sleep(self.interval)
+
+            now = time.monotonic()
+            elapsed = now - last_sample
+            last_sample = now
+
+            active = self.active_consumers()
+            depth = self.shared_buffer.size()
+
+            # Average fraction of the interval the active consumers spent working
+            busy = sum(c.busy_time - last_busy.get(id(c), 0.0) for c in active)
+            last_busy = {id(c): c.busy_time for c in self.consumers}
+            utilization = min(1.0, busy / (elapsed * len(active))) if active else 0.0
+
+            # Count consecutive samples with a persistent backlog
+            backlog_samples = backlog_samples + 1 if depth >= self.scale_up_depth else 0
+
+            if (backlog_samples >= self.scale_up_samples and
+                    utilization >= self.busy_threshold and
+                    len(active) < self.max_consumers):
+                self._spawn()
+                self._record('scale_up', len(active) + 1, depth, utilization)
+                backlog_samples = 0
+                continue
+
+            # Retire the longest-idle consumer once it has cooled down
+            if len(active) > self.min_consumers and depth == 0:
+                idlest = min(active, key=lambda c: c.last_active)
+                if now - idlest.last_active >= self.idle_cooldown:
+                    idlest.retire()
+                    self._record('scale_down', len(active) - 1, depth, utilization)
+
+    def _spawn(self):
+        """
+        Create and start a new consumer thread.
+        """
+        consumer = self.consumer_factory()
+        thread = threading.Thread(target=consumer.run)
+
+        self.consumers.append(consumer)
+        self.threads.append(thread)
+        thread.start()
+
+        self.peak_consumers = max(self.peak_consumers, len(self.active_consumers()))
+
+    def _record(self, action, consumers, depth, utilization):
+        """
+        Record a scaling event and report it to the callback.
+
+        Args:
+            action: 'scale_up' or 'scale_down'
+            consumers: Number of active consumers after the event
+            depth: Buffer depth when the decision was made
+            utilization: Average consumer utilization when the decision was made
+        """
+        event = {
+            'time': time.monotonic() - self.started_at,
+            'action': action,
+            'consumers': consumers,
+            'depth': depth,
+            'utilization': utilization
+        }
+        self.events.append(event)
+
+        if self.on_scale:
+            self.on_scale(event)
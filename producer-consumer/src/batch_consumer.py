@@ -0,0 +1,208 @@
+import time
+from .consumer import Consumer
+from .affinity import pin_current_thread
+
+
+class BatchConsumer(Consumer):
+    """
+    Consumer that hands items to a processing function in micro-batches.
+
+    A batch is flushed when it reaches batch_size items or when its oldest item
+    has waited linger_ms milliseconds, whichever comes first. Any partial batch
+    left when production completes is flushed before the consumer exits.
+    Batch-size and linger metrics are kept so the trade-off can be tuned.
+    """
+
+    __slots__ = (
+        'batch_size', 'linger', 'process_fn', 'batches_flushed', 'max_batch_size',
+        'total_linger', 'max_linger', 'flush_reasons'
+    )
+
+    def __init__(self, shared_buffer, batch_size, linger_ms=0, process_fn=None,
+                 delay=0, on_consume=None, poll_interval=None, sink=None,
+                 cpus=None, retain=True):
+        """
+        Initialize the batch consumer with buffer reference and batching limits.
+
+        Args:
+            shared_buffer: The SharedBuffer instance to consume from
+            batch_size: Maximum number of items per batch
+            linger_ms: Maximum time in milliseconds the oldest item of a batch
+                      may wait before the batch is flushed (default: 0, flush
+                      whatever is immediately available)
+            process_fn: Optional function(batch) called with each flushed batch
+            delay: Optional delay in seconds between batches (default: 0)
+            on_consume: Optional callback function(item, count, buffer_size)
+                       called for each item after its batch is processed
+            poll_interval: Optional time in seconds to wait for the first item
+                          of a batch before checking whether the consumer was
+                          asked to retire (default: None, block)
+            sink: Optional FileSink each flushed batch is written to
+            cpus: Optional CPUs to pin the consumer's thread to when it starts
+            retain: Which consumed items to keep: True for all, an integer n
+                   for the last n, or False for none (default: True)
+        """
+        super().__init__(shared_buffer, delay=delay, on_consume=on_consume,
+                         poll_interval=poll_interval, sink=sink, cpus=cpus,
+                         retain=retain)
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.batch_size = batch_size
+        self.linger = linger_ms / 1000.0
+        self.process_fn = process_fn
+
+        # Batch metrics for tuning size against linger time
+        self.batches_flushed = 0
+        self.max_batch_size = 0
+        self.total_linger = 0.0
+        self.max_linger = 0.0
+        self.flush_reasons = {'size': 0, 'linger': 0, 'complete': 0}
+
+    def run(self):
+        """
+        Execute the batching consumer loop.
+
+        Blocks for the first item of each batch, then keeps collecting until the
+        batch is full, the linger deadline passes, or production completes.
+        Exits once production is complete and the buffer is empty.
+        """
+        # Pin the running thread first if a placement was given
+        if self.cpus:
+            pin_current_thread(self.cpus)
+
+        while True:
+            # Block until the first item of the next batch arrives
+            batch = self._next_batch()
+
+            # Empty batch signals end of production
+            if not batch:
+                break
+
+            started = time.monotonic()
+            deadline = started + self.linger
+            reason = 'size'
+
+            # Keep filling until full, lingered out, or production is done
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    reason = 'linger'
+                    break
+
+                more = self.shared_buffer.get_batch(
+                    self.batch_size - len(batch), timeout=remaining
+                )
+                if not more and self.shared_buffer.is_drained():
+                    reason = 'complete'
+                    break
+                batch.extend(more)
+
+            self._flush(batch, reason, time.monotonic() - started)
+
+        # Push buffered sink output to the file before exiting
+        if self.sink:
+            self.sink.flush()
+
+    def _next_batch(self):
+        """
+        Get the first items of the next batch, polling for retire requests.
+
+        Returns:
+            List of items, empty if production is complete or the consumer
+            was retired
+        """
+        if self.poll_interval is None:
+            return self.shared_buffer.get_batch(self.batch_size)
+
+        while not self.retire_requested:
+            batch = self.shared_buffer.get_batch(self.batch_size, timeout=self.poll_interval)
+            if batch or self.shared_buffer.is_drained():
+                return batch
+
+        return []
+
+    def _flush(self, batch, reason, linger):
+        """
+        Process a batch and update item counters and batch metrics.
+
+        Args:
+            batch: List of items to process
+            reason: Why the batch was flushed ('size', 'linger' or 'complete')
+            linger: Seconds between taking the first item and flushing
+        """
+        started = time.perf_counter()
+
+        # Hand the whole batch to the user-provided sink first
+        if self.process_fn:
+            self.process_fn(batch)
+
+        # Write the whole batch to the sink in one step
+        if self.sink:
+            self.sink.write_many(batch)
+
+        # Update batch metrics
+        self.batches_flushed += 1
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        self.total_linger += linger
+        self.max_linger = max(self.max_linger, linger)
+        self.flush_reasons[reason] += 1
+
+        # Store items in one step, then count them and call the per-item callback
+        if self._retain_item:
+            self.consumed_items.extend(batch)
+
+        if self.on_consume:
+            for item in batch:
+                self.items_consumed += 1
+                self.on_consume(item, self.items_consumed, self.shared_buffer.size())
+        else:
+            self.items_consumed += len(batch)
+
+        # Apply delay between batches if configured
+        if self.delay > 0:
+            time.sleep(self.delay)
+
+        self.busy_time += time.perf_counter() - started
+        self.last_active = time.monotonic()
+
+    def get_batch_stats(self):
+        """
+        Get batch-size and linger metrics for the consumer.
+
+        Returns:
+            Dictionary with batch count, average and maximum batch size,
+            average and maximum linger in milliseconds, and flush counts
+            per reason
+        """
+        return BatchConsumer.combined_stats([self])
+
+    @staticmethod
+    def combined_stats(consumers):
+        """
+        Get batch-size and linger metrics across several batch consumers.
+
+        Args:
+            consumers: List of BatchConsumer instances
+
+        Returns:
+            Dictionary in the same shape as get_batch_stats
+        """
+        batches = sum(c.batches_flushed for c in consumers)
+        items = sum(c.items_consumed for c in consumers)
+        total_linger = sum(c.total_linger for c in consumers)
+
+        flush_reasons = {'size': 0, 'linger': 0, 'complete': 0}
+        for consumer in consumers:
+            for reason, count in consumer.flush_reasons.items():
+                flush_reasons[reason] += count
+
+        return {
+            'batches': batches,
+            'avg_batch_size': items / batches if batches else 0,
+            'max_batch_size': max((c.max_batch_size for c in consumers), default=0),
+            'avg_linger_ms': total_linger * 1000 / batches if batches else 0,
+            'max_linger_ms': max((c.max_linger for c in consumers), default=0) * 1000,
+            'flush_reasons': flush_reasons
+        }
@@ -0,0 +1,215 @@
+import threading
+from .wait_strategy import resolve_wait_strategy, wait_until
+
+
+class BroadcastRing:
+    """
+    Preallocated ring buffer that delivers every item to several consumer groups.
+
+    A single producer sequence numbers the items and writes each one into a
+    fixed slot exactly once. Every consumer group keeps its own read cursor and
+    reads at its own pace. The slowest group gates the producer: a slot is only
+    reused after every group has read it, so the ring never holds more than
+    capacity unread items for any group.
+    """
+
+    def __init__(self, capacity, groups, wait_strategy=None):
+        """
+        Initialize the ring with a fixed capacity and named consumer groups.
+
+        Args:
+            capacity: Number of preallocated slots in the ring
+            groups: Iterable of consumer group names
+            wait_strategy: Optional wait strategy instance or name
+                          ('blocking', 'spin', 'busy_spin')
+
+        Raises:
+            ValueError: If no consumer groups are given
+        """
+        self.capacity = capacity
+        self.slots = [None] * capacity
+
+        # Next sequence the producer writes, and next sequence each group reads
+        self.cursor = 0
+        self.group_cursors = {name: 0 for name in groups}
+
+        if not self.group_cursors:
+            raise ValueError("BroadcastRing needs at least one consumer group")
+
+        # Condition variable for thread synchronization
+        self.condition = threading.Condition()
+        self.wait_strategy = resolve_wait_strategy(wait_strategy)
+
+        # Flag to signal when production is complete
+        self.production_complete = False
+
+    def put(self, item):
+        """
+        Publish an item to every group. Blocks while the slowest group is a full ring behind.
+
+        Args:
+            item: The item to publish
+        """
+        with self.condition:
+            # Wait until the slowest group has freed the next slot
+            wait_until(self.wait_strategy, self.condition, self._has_space)
+
+            self.slots[self.cursor % self.capacity] = item
+            self.cursor += 1
+
+            # Every group may be waiting for this item
+            self.condition.notify_all()
+
+    def get(self, group):
+        """
+        Return the next item for a consumer group. Blocks if the group is caught up.
+
+        Args:
+            group: Name of the consumer group reading
+
+        Returns:
+            The group's next item, or None if production is complete and the
+            group has read everything
+        """
+        with self.condition:
+            def ready():
+                return self.group_cursors[group] < self.cursor or self.production_complete
+
+            wait_until(self.wait_strategy, self.condition, ready)
+
+            sequence = self.group_cursors[group]
+
+            # Return None if the group has read everything and production is done
+            if sequence == self.cursor:
+                return None
+
+            item = self.slots[sequence % self.capacity]
+            was_slowest = sequence == self._slowest_cursor()
+            self.group_cursors[group] = sequence + 1
+
+            if was_slowest:
+                # Release the slot once every group is past it
+                if sequence < self._slowest_cursor():
+                    self.slots[sequence % self.capacity] = None
+
+                # The producer may be gated on this group
+                self.condition.notify_all()
+
+            return item
+
+    def group(self, name):
+        """
+        Get a buffer-like view of the ring for one consumer group.
+
+        Args:
+            name: Name of the consumer group
+
+        Returns:
+            BroadcastGroup that can be passed to a Consumer
+
+        Raises:
+            KeyError: If the group is not registered with the ring
+        """
+        if name not in self.group_cursors:
+            raise KeyError(f"Unknown consumer group '{name}'")
+        return BroadcastGroup(self, name)
+
+    def mark_complete(self):
+        """
+        Signal that production is complete and wake every consumer group.
+        """
+        with self.condition:
+            self.production_complete = True
+            self.condition.notify_all()
+
+    def size(self):
+        """
+        Get the number of items not yet read by the slowest group.
+
+        Returns:
+            Number of occupied slots in the ring
+        """
+        with self.condition:
+            return self.cursor - self._slowest_cursor()
+
+    def lag(self, group):
+        """
+        Get how many published items a consumer group has not read yet.
+
+        Args:
+            group: Name of the consumer group
+
+        Returns:
+            Number of items the group is behind the producer
+        """
+        with self.condition:
+            return self.cursor - self.group_cursors[group]
+
+    def stats(self):
+        """
+        Get producer sequence and per-group read progress.
+
+        Returns:
+            Dictionary with 'capacity', 'produced', 'max_lag' and 'groups',
+            where 'groups' maps each group name to its 'consumed' count and 'lag'
+        """
+        with self.condition:
+            groups = {
+                name: {'consumed': cursor, 'lag': self.cursor - cursor}
+                for name, cursor in self.group_cursors.items()
+            }
+
+            return {
+                'capacity': self.capacity,
+                'produced': self.cursor,
+                'max_lag': self.cursor - self._slowest_cursor(),
+                'groups': groups
+            }
+
+    def _has_space(self):
+        """Check whether the producer can write the next slot."""
+        return self.cursor - self._slowest_cursor() < self.capacity
+
+    def _slowest_cursor(self):
+        """Get the read cursor of the slowest consumer group."""
+        return min(self.group_cursors.values())
+
+
+class BroadcastGroup:
+    """
+    Buffer-like view of a BroadcastRing for a single consumer group.
+
+    Exposes the get/size interface a Consumer expects, so existing consumers
+    can read one group's stream without changes.
+    """
+
+    def __init__(self, ring, name):
+        """
+        Initialize the view for a consumer group.
+
+        Args:
+            ring: The BroadcastRing to read from
+            name: Name of the consumer group
+        """
+        self.ring = ring
+        self.name = name
+
+    def get(self):
+        """
+        Return the group's next item, or None once it has read everything.
+        """
+        return self.ring.get(self.name)
+
+    def size(self):
+        """
+        Get the number of items the group has not read yet.
+        """
+        return self.ring.lag(self.name)
+
+    def is_drained(self):
+        """
+        Check whether production is complete and the group has read everything.
+        """
+        with self.ring.condition:
+            return (self.ring.production_complete and
+                    self.ring.group_cursors[self.name] == self.ring.cursor)
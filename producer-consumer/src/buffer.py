@@ -1,4 +1,6 @@
 import threading
+import time
+from .wait_strategy import resolve_wait_strategy, wait_until
 
 
 class SharedBuffer:
@@ -8,20 +10,32 @@ class SharedBuffer:
     This buffer uses a Condition variable to coordinate access between
     multiple producer and consumer threads. It blocks producers when full
     and consumers when empty, implementing classic wait/notify patterns.
+    How a thread waits is delegated to a pluggable wait strategy. With a lock
+    profiler, the condition is replaced by a profiled one that records lock
+    contention; without one, no profiling code runs.
     """
 
-    def __init__(self, capacity):
+    def __init__(self, capacity, wait_strategy=None, profiler=None):
         """
         Initialize the shared buffer with a fixed capacity.
 
         Args:
             capacity: Maximum number of items the buffer can hold
+            wait_strategy: Optional wait strategy instance or name
+                          ('blocking', 'spin', 'busy_spin'); defaults to
+                          blocking on the condition variable
+            profiler: Optional LockProfiler recording lock acquire, hold and
+                     wait times and wakeups for this buffer
         """
         self.capacity = capacity
         self.buffer = []
 
-        # Condition variable for thread synchronization
-        self.condition = threading.Condition()
+        # Condition variable for thread synchronization, profiled if requested
+        self.profiler = profiler
+        self.condition = profiler.condition() if profiler else threading.Condition()
+
+        # How threads wait for space or items
+        self.wait_strategy = resolve_wait_strategy(wait_strategy)
 
         # Flag to signal when production is complete
         self.production_complete = False
@@ -38,37 +52,104 @@ class SharedBuffer:
         """
         with self.condition:
             # Wait while buffer is full
-            while len(self.buffer) >= self.capacity:
-                self.condition.wait()
+            self._wait_until(self._has_space)
 
             # Add item and notify any waiting consumers
             self.buffer.append(item)
             self.condition.notify()
 
-    def get(self):
+    def get(self, timeout=None):
         """
         Remove and return an item from the buffer. Blocks if buffer is empty.
 
         This method waits until an item is available or production is complete.
         Returns None if buffer is empty and production has finished.
 
+        Args:
+            timeout: Optional maximum time in seconds to wait for an item
+                    (default: None, wait indefinitely)
+
         Returns:
             The next item from the buffer, or None if production is complete
+            or the timeout expired (use is_drained() to tell them apart)
         """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
         with self.condition:
             # Wait while buffer is empty and production is ongoing
-            while len(self.buffer) == 0 and not self.production_complete:
-                self.condition.wait()
+            self._wait_until(self._has_item_or_complete, deadline)
 
             # Return None if buffer is empty and production is done
             if len(self.buffer) == 0:
                 return None
 
             # Remove item from front and notify any waiting producers
-            item = self.buffer.pop(0)
+            item = self._take_one()
             self.condition.notify()
             return item
 
+    def get_batch(self, max_items, timeout=None):
+        """
+        Remove and return up to max_items items from the buffer in one step.
+
+        Waits until at least one item is available, production is complete,
+        or the timeout expires. Whatever is available (up to max_items) is
+        taken under a single lock acquisition.
+
+        Args:
+            max_items: Maximum number of items to return
+            timeout: Optional maximum time in seconds to wait for the first item
+                    (default: None, wait indefinitely)
+
+        Returns:
+            List of items in FIFO order; empty if the timeout expired or
+            production is complete and the buffer is empty
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.condition:
+            # Wait while buffer is empty and production is ongoing
+            self._wait_until(self._has_item_or_complete, deadline)
+
+            # Take everything available up to max_items
+            items = self._take(max_items)
+
+            # Several slots may have been freed, wake that many producers
+            if items:
+                self.condition.notify(len(items))
+            return items
+
+    def wait_for_space(self, timeout=None):
+        """
+        Wait until the buffer has room for at least one item.
+
+        Used to hand out put credits to remote producers, so they never send
+        more items than the buffer can currently accept.
+
+        Args:
+            timeout: Optional maximum time in seconds to wait
+                    (default: None, wait indefinitely)
+
+        Returns:
+            Number of free slots, or 0 if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.condition:
+            if not self._wait_until(self._has_space, deadline):
+                return 0
+            return self.capacity - len(self.buffer)
+
+    def is_drained(self):
+        """
+        Check whether production is complete and every item has been taken.
+
+        Returns:
+            True if no more items will ever be returned by the buffer
+        """
+        with self.condition:
+            return self.production_complete and len(self.buffer) == 0
+
     def mark_complete(self):
         """
         Signal that production is complete.
@@ -78,7 +159,46 @@ class SharedBuffer:
         """
         with self.condition:
             self.production_complete = True
-            self.condition.notify()
+
+            # Wake every waiting consumer, not just one, so all of them can exit
+            self.condition.notify_all()
+
+    def _take_one(self):
+        """Remove and return the item at the front. Must hold the lock."""
+        return self.buffer.pop(0)
+
+    def _take(self, max_items):
+        """Remove and return up to max_items items from the front. Must hold the lock."""
+        items = self.buffer[:max_items]
+        del self.buffer[:max_items]
+        return items
+
+    def _has_space(self):
+        """Check whether a producer can add an item."""
+        return len(self.buffer) < self.capacity
+
+    def _has_item_or_complete(self):
+        """Check whether a consumer can take an item or stop waiting."""
+        return len(self.buffer) > 0 or self.production_complete
+
+    def _wait_until(self, ready, deadline=None):
+        """
+        Wait using the wait strategy until ready() is true or the deadline passes.
+
+        Must be called with the condition's lock held.
+
+        Args:
+            ready: Callable returning True once the waiter can proceed
+            deadline: Optional time.monotonic() value after which to stop waiting
+
+        Returns:
+            True if ready() holds, False if the deadline passed first
+        """
+        if self.profiler is None:
+            return wait_until(self.wait_strategy, self.condition, ready, deadline)
+
+        return wait_until(self.wait_strategy, self.condition, ready, deadline,
+                          on_spurious_wakeup=self.profiler.record_spurious_wakeup)
 
     def size(self):
         """
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from .buffer import SharedBuffer
+
+
+class CoalescingBuffer(SharedBuffer):
+    """
+    Shared buffer with latest-value-wins semantics per key.
+
+    Items are queued in FIFO order of their key's first arrival. A put for a key
+    that is already queued replaces the pending value in place, keeping its
+    queue position, so consumers only ever see the newest value per key and
+    their work stays proportional to distinct keys rather than the raw update
+    rate. Replacing a queued value never blocks, since it takes no new slot.
+    """
+
+    def __init__(self, capacity, key_fn, wait_strategy=None, profiler=None):
+        """
+        Initialize the coalescing buffer.
+
+        Args:
+            capacity: Maximum number of distinct keys the buffer can hold
+            key_fn: Function(item) returning the key items are coalesced by
+            wait_strategy: Optional wait strategy instance or name
+                          ('blocking', 'spin', 'busy_spin')
+            profiler: Optional LockProfiler recording lock contention
+        """
+        super().__init__(capacity, wait_strategy=wait_strategy, profiler=profiler)
+        self.key_fn = key_fn
+
+        # Pending values keyed by item key, in queue order
+        self.buffer = OrderedDict()
+
+        # Number of puts that replaced a pending value
+        self.coalesced_count = 0
+
+    def put(self, item):
+        """
+        Queue an item, or replace the pending value for its key in place.
+
+        Blocks only when the item's key is not queued and the buffer is full.
+
+        Args:
+            item: The item to add to the buffer
+        """
+        key = self.key_fn(item)
+
+        with self.condition:
+            # Replace a pending value without waiting for space
+            if key in self.buffer:
+                self.buffer[key] = item
+                self.coalesced_count += 1
+                return
+
+            # Wait while buffer is full
+            self._wait_until(self._has_space)
+
+            # The key may have been queued by another producer while waiting
+            if key in self.buffer:
+                self.buffer[key] = item
+                self.coalesced_count += 1
+                return
+
+            # Add item and notify any waiting consumers
+            self.buffer[key] = item
+            self.condition.notify()
+
+    def _take_one(self):
+        """Remove and return the oldest pending value. Must hold the lock."""
+        return self.buffer.popitem(last=False)[1]
+
+    def _take(self, max_items):
+        """Remove and return up to max_items oldest pending values. Must hold the lock."""
+        count = min(max_items, len(self.buffer))
+        return [self.buffer.popitem(last=False)[1] for _ in range(count)]
@@ -1,4 +1,6 @@
 import time
+from collections import deque
+from .affinity import pin_current_thread
 
 
 class Consumer:
@@ -6,11 +8,20 @@ class Consumer:
     Consumer that retrieves items from a shared buffer and processes them.
 
     The consumer continuously reads items from the buffer until production is complete
-    and the buffer is empty. It stores all consumed items and can optionally invoke
-    a callback after each consumption.
+    and the buffer is empty. It stores consumed items and can optionally invoke
+    a callback after each consumption. For long runs, retention can be capped to
+    the most recent items or turned off, so memory stays flat; items can still be
+    written to a file sink, which is flushed when the consumer exits.
     """
 
-    def __init__(self, shared_buffer, delay=0, on_consume=None):
+    __slots__ = (
+        'shared_buffer', 'delay', 'on_consume', 'poll_interval', 'sink', 'cpus',
+        'retain', 'consumed_items', '_retain_item', 'items_consumed', 'busy_time',
+        'last_active', 'retire_requested'
+    )
+
+    def __init__(self, shared_buffer, delay=0, on_consume=None, poll_interval=None,
+                 sink=None, cpus=None, retain=True):
         """
         Initialize the consumer with buffer reference and configuration.
 
@@ -19,17 +30,40 @@ class Consumer:
             delay: Optional delay in seconds between consuming items (default: 0)
             on_consume: Optional callback function(item, count, buffer_size)
                        called after each item is consumed
+            poll_interval: Optional time in seconds to wait for an item before
+                          checking whether the consumer was asked to retire
+                          (default: None, block until an item arrives)
+            sink: Optional FileSink every consumed item is written to; it may
+                 be shared with other consumers
+            cpus: Optional CPUs to pin the consumer's thread to when it starts
+            retain: Which consumed items to keep in consumed_items: True for
+                   all of them, an integer n for only the last n, or False
+                   for none (default: True)
+
+        Raises:
+            ValueError: If retain is a negative integer
         """
         self.shared_buffer = shared_buffer
         self.delay = delay
         self.on_consume = on_consume
+        self.poll_interval = poll_interval
+        self.sink = sink
+        self.cpus = cpus
+        self.retain = retain
 
-        # Store all consumed items in order
-        self.consumed_items = []
+        # Store consumed items in order, all of them or a bounded tail
+        self.consumed_items, self._retain_item = _retention(retain)
 
         # Track how many items have been consumed
         self.items_consumed = 0
 
+        # Utilization tracking, used to scale consumer pools
+        self.busy_time = 0.0
+        self.last_active = time.monotonic()
+
+        # Set by retire() to stop the consumer at its next poll
+        self.retire_requested = False
+
     def run(self):
         """
         Execute the consumer loop.
@@ -37,23 +71,97 @@ class Consumer:
         Continuously retrieves items from the buffer until None is returned,
         which signals that production is complete and buffer is empty.
         Calls the callback if provided and applies delay if configured.
+        Flushes the sink, if any, before returning.
         """
+        # Pin the running thread first if a placement was given
+        if self.cpus:
+            pin_current_thread(self.cpus)
+
         while True:
             # Get next item from buffer, blocks if empty
-            item = self.shared_buffer.get()
+            item = self._next_item()
 
             # None signals end of production
             if item is None:
                 break
 
+            started = time.perf_counter()
+
             # Store item and update counter
-            self.consumed_items.append(item)
+            if self._retain_item:
+                self._retain_item(item)
             self.items_consumed += 1
 
+            # Write the item to the sink, which buffers and group-commits it
+            if self.sink:
+                self.sink.write(item)
+
             # Call user-provided callback if present
             if self.on_consume:
                 self.on_consume(item, self.items_consumed, self.shared_buffer.size())
 
             # Apply delay between items if configured
             if self.delay > 0:
-                time.sleep(self.delay)
\ No newline at end of file
+                time.sleep(self.delay)
+
+            self.busy_time += time.perf_counter() - started
+            self.last_active = time.monotonic()
+
+        # Push buffered sink output to the file before exiting
+        if self.sink:
+            self.sink.flush()
+
+    def retire(self):
+        """
+        Ask the consumer to exit.
+
+        A consumer with a poll_interval exits within one poll interval once it
+        is idle; an item it is already processing is finished first.
+        """
+        self.retire_requested = True
+
+    def _next_item(self):
+        """
+        Get the next item, polling so a retire request can be noticed.
+
+        Returns:
+            The next item, or None if production is complete or the
+            consumer was retired
+        """
+        if self.poll_interval is None:
+            return self.shared_buffer.get()
+
+        while not self.retire_requested:
+            item = self.shared_buffer.get(timeout=self.poll_interval)
+            if item is not None or self.shared_buffer.is_drained():
+                return item
+
+        return None
+
+
+def _retention(retain):
+    """
+    Create the consumed_items container for a retain setting.
+
+    Args:
+        retain: True, False, or the number of most recent items to keep
+
+    Returns:
+        Tuple of the container and its append method, or None as the append
+        method when nothing is retained
+
+    Raises:
+        ValueError: If retain is a negative integer
+    """
+    if retain is True:
+        items = []
+        return items, items.append
+
+    if retain is False or retain is None:
+        return [], None
+
+    if isinstance(retain, int) and retain >= 0:
+        items = deque(maxlen=retain)
+        return items, items.append
+
+    raise ValueError("retain must be True, False or a non-negative integer")
@@ -1,7 +1,17 @@
+import itertools
 import threading
 from .buffer import SharedBuffer
+from .coalescing_buffer import CoalescingBuffer
 from .producer import Producer
 from .consumer import Consumer
+from .batch_consumer import BatchConsumer
+from .broadcast_ring import BroadcastRing
+from .autoscaler import ConsumerAutoscaler
+from .profiling import LockProfiler
+from .trace import Trace, TraceReplayer
+from .windowing import WindowConsumer
+from .affinity import PLACEMENTS, affinity_supported, plan_placement
+from .wait_strategy import resolve_wait_strategy
 
 
 class ProducerConsumerPipeline:
@@ -13,14 +23,52 @@ class ProducerConsumerPipeline:
     creation, execution, and cleanup automatically.
     """
 
-    def __init__(self, buffer_capacity=10):
+    def __init__(self, buffer_capacity=10, wait_strategy=None, coalesce_key=None,
+                 min_consumers=1, max_consumers=None, idle_cooldown=1.0,
+                 on_scale=None, profile_locks=False, placement=None):
         """
         Initialize the pipeline with buffer configuration.
 
         Args:
             buffer_capacity: Maximum number of items the buffer can hold (default: 10)
+            wait_strategy: Optional wait strategy instance or name ('blocking',
+                          'spin', 'busy_spin') used by the buffer (default: blocking)
+            coalesce_key: Optional function(item) returning a key; when set, a
+                         CoalescingBuffer keeps only the newest pending value per key
+            min_consumers: Minimum number of consumer threads in elastic mode
+                          (default: 1)
+            max_consumers: Optional maximum number of consumer threads; when set,
+                          enables elastic mode where consumers are spawned while
+                          a backlog persists and retired when idle
+            idle_cooldown: Seconds a consumer must be idle before it is retired
+                          in elastic mode (default: 1.0)
+            on_scale: Optional callback function(event) called on each scaling
+                     event in elastic mode
+            profile_locks: Record lock contention on the buffer during each
+                          run (default: False)
+            placement: Optional CPU placement for worker threads: 'spread'
+                      pins workers to separate cores across packages,
+                      'pairs' keeps the producer and first consumer on
+                      sibling hardware threads (default: None, no pinning;
+                      ignored where pinning is unsupported)
+
+        Raises:
+            ValueError: If the placement strategy is unknown
         """
+        if placement is not None and placement not in PLACEMENTS:
+            raise ValueError(
+                f"Unknown placement '{placement}', expected one of {sorted(PLACEMENTS)}"
+            )
+
         self.buffer_capacity = buffer_capacity
+        self.wait_strategy = resolve_wait_strategy(wait_strategy)
+        self.coalesce_key = coalesce_key
+        self.min_consumers = min_consumers
+        self.max_consumers = max_consumers
+        self.idle_cooldown = idle_cooldown
+        self.on_scale = on_scale
+        self.profile_locks = profile_locks
+        self.placement = placement
 
         # These will be initialized when process is called
         self.shared_buffer = None
@@ -29,8 +77,28 @@ class ProducerConsumerPipeline:
         self.producer_thread = None
         self.consumer_thread = None
 
+        # Every consumer of the last run, and the controller in elastic mode
+        self.consumers = None
+        self.autoscaler = None
+
+        # Per-group consumers, set only by process_broadcast
+        self.group_consumers = None
+
+        # File sink of the last run, if any
+        self.sink = None
+
+        # Lock profiler of the last run, when profiling locks
+        self.lock_profiler = None
+
+        # Trace replayer of the last run, set only by replay
+        self.replayer = None
+
+        # CPU assigned to each worker in the last run, when pinning
+        self.placement_plan = {}
+
     def process(self, data, producer_delay=0, consumer_delay=0,
-                on_produce=None, on_consume=None):
+                on_produce=None, on_consume=None, batch_size=None,
+                linger_ms=0, process_fn=None, sink=None, retain=True):
         """
         Execute the producer-consumer pipeline with the given data.
 
@@ -38,34 +106,106 @@ class ProducerConsumerPipeline:
         concurrently in separate threads. Blocks until all data is processed.
 
         Args:
-            data: List of items to process through the pipeline
+            data: Iterable of items to process through the pipeline
             producer_delay: Optional delay between producing items (default: 0)
             consumer_delay: Optional delay between consuming items (default: 0)
             on_produce: Optional callback function(item, count, buffer_size)
                        called after each item is produced
             on_consume: Optional callback function(item, count, buffer_size)
                        called after each item is consumed
+            batch_size: Optional maximum batch size; when set, items are
+                       consumed in micro-batches by a BatchConsumer
+            linger_ms: Maximum time in milliseconds the oldest item of a batch
+                      may wait before flushing (default: 0)
+            process_fn: Optional function(batch) called with each flushed batch
+                       in batch mode
+            sink: Optional FileSink shared by the consumers, which write every
+                 consumed item to it; it is flushed when they finish and stays
+                 open for the caller to close
+            retain: Which consumed items each consumer keeps: True for all,
+                   an integer n for the last n, or False for none, e.g. when
+                   results go to a sink (default: True)
 
         Returns:
-            List of all consumed items in order
+            List of all retained consumed items in order (with an integer
+            retain, a deque of each consumer's last items); in elastic mode,
+            items are grouped by consumer and order across consumers is not
+            preserved
         """
-        # Create shared buffer for communication
-        self.shared_buffer = SharedBuffer(capacity=self.buffer_capacity)
+        self.group_consumers = None
+        self.autoscaler = None
+        self.sink = sink
+        self.replayer = None
+        self.lock_profiler = LockProfiler() if self.profile_locks else None
+
+        # Create shared buffer for communication, coalescing by key if requested
+        if self.coalesce_key:
+            self.shared_buffer = CoalescingBuffer(
+                self.buffer_capacity,
+                self.coalesce_key,
+                wait_strategy=self.wait_strategy,
+                profiler=self.lock_profiler
+            )
+        else:
+            self.shared_buffer = SharedBuffer(
+                capacity=self.buffer_capacity,
+                wait_strategy=self.wait_strategy,
+                profiler=self.lock_profiler
+            )
+
+        # Elastic consumers poll so the autoscaler can retire them when idle
+        elastic = self.max_consumers is not None
+        poll_interval = 0.05 if elastic else None
+
+        # Plan CPUs for the producer and every consumer slot
+        consumer_slots = self.max_consumers if elastic else 1
+        self.placement_plan = self._plan_placement(
+            ['producer'] + [f'consumer-{slot}' for slot in range(consumer_slots)]
+        )
+        created = itertools.count()
 
         # Create producer with source data
         self.producer = Producer(
             self.shared_buffer,
             data,
             delay=producer_delay,
-            on_produce=on_produce
+            on_produce=on_produce,
+            cpus=self.placement_plan.get('producer')
         )
 
-        # Create consumer to process items
-        self.consumer = Consumer(
-            self.shared_buffer,
-            delay=consumer_delay,
-            on_consume=on_consume
-        )
+        def create_consumer():
+            # Replacement consumers reuse the CPUs of earlier slots
+            cpus = self.placement_plan.get(f'consumer-{next(created) % consumer_slots}')
+
+            # Create consumer to process items, batching them if requested
+            if batch_size:
+                return BatchConsumer(
+                    self.shared_buffer,
+                    batch_size,
+                    linger_ms=linger_ms,
+                    process_fn=process_fn,
+                    delay=consumer_delay,
+                    on_consume=on_consume,
+                    poll_interval=poll_interval,
+                    sink=sink,
+                    cpus=cpus,
+                    retain=retain
+                )
+            return Consumer(
+                self.shared_buffer,
+                delay=consumer_delay,
+                on_consume=on_consume,
+                poll_interval=poll_interval,
+                sink=sink,
+                cpus=cpus,
+                retain=retain
+            )
+
+        if elastic:
+            return self._run_elastic(create_consumer)
+
+        self.consumer = create_consumer()
+        self.consumers = [self.consumer]
 
         # Create threads for concurrent execution
         self.producer_thread = threading.Thread(target=self.producer.run)
@@ -82,22 +222,352 @@ class ProducerConsumerPipeline:
         # Return all consumed items
         return self.consumer.consumed_items
 
+    def _run_elastic(self, create_consumer):
+        """
+        Run the producer against an autoscaled pool of consumers.
+
+        Args:
+            create_consumer: Function() returning a new consumer for the pool
+
+        Returns:
+            List of all consumed items, grouped by consumer in start order
+        """
+        self.autoscaler = ConsumerAutoscaler(
+            self.shared_buffer,
+            create_consumer,
+            min_consumers=self.min_consumers,
+            max_consumers=self.max_consumers,
+            idle_cooldown=self.idle_cooldown,
+            on_scale=self.on_scale
+        )
+
+        self.producer_thread = threading.Thread(target=self.producer.run)
+        self.consumer_thread = None
+
+        # Start the producer and the consumer pool, then wait for both
+        self.producer_thread.start()
+        self.autoscaler.start()
+
+        self.producer_thread.join()
+        self.autoscaler.join()
+
+        self.consumers = self.autoscaler.consumers
+        self.consumer = self.consumers[0]
+
+        return [item for consumer in self.consumers for item in consumer.consumed_items]
+
+    def replay(self, trace, speed=1.0, cost_mode='sleep', batch_size=None, linger_ms=0):
+        """
+        Replay a recorded trace through the pipeline with its recorded timing.
+
+        Items arrive on the trace's schedule with payloads of the recorded
+        sizes, and consumers apply each item's recorded processing cost. The
+        same trace can be replayed against different buffer capacities, wait
+        strategies or batching settings to compare them on a real workload.
+
+        Args:
+            trace: Trace instance, or path of a saved trace
+            speed: Replay speed factor for arrivals and costs (default: 1.0)
+            cost_mode: How consumers apply costs: 'sleep', 'spin' (CPU-bound)
+                      or 'none' (default: 'sleep')
+            batch_size: Optional maximum batch size for a BatchConsumer
+            linger_ms: Maximum batch linger time in milliseconds (default: 0)
+
+        Returns:
+            Dictionary with throughput and latency percentiles, as from
+            TraceReplayer.get_stats
+        """
+        if isinstance(trace, str):
+            trace = Trace.load(trace)
+
+        # Replayed payloads are only needed until they are processed
+        replayer = TraceReplayer(trace, speed=speed, cost_mode=cost_mode)
+        self.process(replayer.source(), on_consume=replayer.on_consume,
+                     batch_size=batch_size, linger_ms=linger_ms, retain=False)
+        self.replayer = replayer
+
+        return replayer.get_stats()
+
+    def process_windowed(self, data, aggregator, producer_delay=0, on_produce=None,
+                         on_emit=None, output_buffer=None, sink=None, retain=None):
+        """
+        Aggregate the data stream into time windows as it flows through.
+
+        A single WindowConsumer folds every item into the aggregator's
+        per-window state and emits each window result once the watermark
+        closes it; windows still open at the end of the stream are emitted
+        when production completes.
+
+        Args:
+            data: Iterable of items to process through the pipeline
+            aggregator: WindowAggregator with the window assigner, timestamp,
+                       key and value functions, and allowed lateness
+            producer_delay: Optional delay between producing items (default: 0)
+            on_produce: Optional callback function(item, count, buffer_size)
+                       called after each item is produced
+            on_emit: Optional callback function(result) called for each
+                    window result
+            output_buffer: Optional buffer window results are put into for
+                          a next stage; it is marked complete at the end
+            sink: Optional FileSink window results are written to
+            retain: Which window results to return: True for all, an integer
+                   n for the last n, or False for none (default: True, or
+                   False when on_emit, output_buffer or sink receives them)
+
+        Returns:
+            List of the retained window result dictionaries in emission
+            order (with an integer retain, a deque)
+        """
+        self.group_consumers = None
+        self.autoscaler = None
+        self.sink = sink
+        self.replayer = None
+        self.lock_profiler = LockProfiler() if self.profile_locks else None
+
+        # Windowed runs use a plain buffer; coalescing would drop window input
+        self.shared_buffer = SharedBuffer(
+            capacity=self.buffer_capacity,
+            wait_strategy=self.wait_strategy,
+            profiler=self.lock_profiler
+        )
+        self.placement_plan = self._plan_placement(['producer', 'consumer-0'])
+
+        # Create producer with source data
+        self.producer = Producer(
+            self.shared_buffer,
+            data,
+            delay=producer_delay,
+            on_produce=on_produce,
+            cpus=self.placement_plan.get('producer')
+        )
+
+        # One consumer owns the window state, so no locking is needed on it
+        self.consumer = WindowConsumer(
+            self.shared_buffer,
+            aggregator,
+            on_emit=on_emit,
+            output_buffer=output_buffer,
+            sink=sink,
+            cpus=self.placement_plan.get('consumer-0'),
+            retain=retain
+        )
+        self.consumers = [self.consumer]
+
+        # Run both threads to completion
+        self.producer_thread = threading.Thread(target=self.producer.run)
+        self.consumer_thread = threading.Thread(target=self.consumer.run)
+
+        self.producer_thread.start()
+        self.consumer_thread.start()
+
+        self.producer_thread.join()
+        self.consumer_thread.join()
+
+        return self.consumer.window_results
+
+    def process_broadcast(self, data, groups, producer_delay=0,
+                          consumer_delay=0, on_produce=None, retain=True):
+        """
+        Deliver the same data stream to several independent consumer groups.
+
+        Items are stored once in a BroadcastRing sized by buffer_capacity. Each
+        group gets its own consumer thread reading at its own pace, and the
+        slowest group gates the producer.
+
+        Args:
+            data: Iterable of items to process through the pipeline
+            groups: Dictionary mapping group names to an optional
+                   on_consume callback function(item, count, buffer_size),
+                   where buffer_size is the group's lag
+            producer_delay: Optional delay between producing items (default: 0)
+            consumer_delay: Optional delay between consuming items (default: 0)
+            on_produce: Optional callback function(item, count, buffer_size)
+                       called after each item is produced
+            retain: Which consumed items each group keeps: True for all, an
+                   integer n for the last n, or False for none (default: True)
+
+        Returns:
+            Dictionary mapping each group name to its retained items in order
+        """
+        self.autoscaler = None
+        self.sink = None
+        self.lock_profiler = None
+        self.replayer = None
+
+        # Create the broadcast ring shared by all groups
+        self.shared_buffer = BroadcastRing(
+            self.buffer_capacity,
+            groups,
+            wait_strategy=self.wait_strategy
+        )
+
+        # Plan CPUs for the producer and one consumer per group
+        self.placement_plan = self._plan_placement(['producer'] + list(groups))
+
+        self.producer = Producer(
+            self.shared_buffer,
+            data,
+            delay=producer_delay,
+            on_produce=on_produce,
+            cpus=self.placement_plan.get('producer')
+        )
+
+        # Create one consumer per group, each reading through its own view
+        self.group_consumers = {
+            name: Consumer(
+                self.shared_buffer.group(name),
+                delay=consumer_delay,
+                on_consume=on_consume,
+                cpus=self.placement_plan.get(name),
+                retain=retain
+            )
+            for name, on_consume in groups.items()
+        }
+        self.consumer = None
+        self.consumers = None
+
+        self.producer_thread = threading.Thread(target=self.producer.run)
+        group_threads = [
+            threading.Thread(target=consumer.run)
+            for consumer in self.group_consumers.values()
+        ]
+
+        # Start the producer and every group, then wait for all of them
+        self.producer_thread.start()
+        for thread in group_threads:
+            thread.start()
+
+        self.producer_thread.join()
+        for thread in group_threads:
+            thread.join()
+
+        return {
+            name: consumer.consumed_items
+            for name, consumer in self.group_consumers.items()
+        }
+
     def get_stats(self):
         """
         Get statistics about the last pipeline execution.
 
         Returns a dictionary with production and consumption counts,
         and a success flag indicating if all items were processed.
+        In batch mode, batch-size and linger metrics are included as well.
+        With a coalesce key, 'coalesced' counts replaced values, and success
+        means every produced item was either consumed or coalesced.
+        In elastic mode, 'consumed' is summed over every consumer and
+        'scaling' reports pool limits and scaling events. With a sink,
+        'sink' reports its write throughput and fsync latency. With
+        profile_locks, 'locks' reports lock contention per thread; use
+        lock_profiler for the full report and folded stacks. After replay,
+        'replay' reports throughput and latency percentiles. After
+        process_windowed, 'windows' reports window and late-item counts.
+        With a placement, 'placement' reports the strategy and each worker's CPUs.
+        After process_broadcast, 'consumed' maps each group to its count and
+        'groups' holds the per-group lag reported by the ring.
 
         Returns:
-            Dictionary with 'produced', 'consumed', and 'success' keys,
+            Dictionary with 'produced', 'consumed', and 'success' keys
+            (plus 'batching' in batch mode, 'coalesced' with a coalesce key,
+            'scaling' in elastic mode, 'sink' with a sink, 'locks' with
+            profile_locks, 'replay' after replay, 'windows' after
+            process_windowed, 'placement' with a
+            placement, or 'groups' in broadcast mode),
             or None if process has not been called yet
         """
+        if self.group_consumers is not None:
+            return self._get_broadcast_stats()
+
         if not self.producer or not self.consumer:
             return None
 
-        return {
+        consumed = sum(consumer.items_consumed for consumer in self.consumers)
+
+        stats = {
             'produced': self.producer.items_produced,
-            'consumed': self.consumer.items_consumed,
-            'success': self.producer.items_produced == self.consumer.items_consumed
-        }
\ No newline at end of file
+            'consumed': consumed,
+            'success': self.producer.items_produced == consumed
+        }
+
+        if isinstance(self.shared_buffer, CoalescingBuffer):
+            coalesced = self.shared_buffer.coalesced_count
+            stats['coalesced'] = coalesced
+            stats['success'] = self.producer.items_produced == consumed + coalesced
+
+        if isinstance(self.consumer, BatchConsumer):
+            stats['batching'] = BatchConsumer.combined_stats(self.consumers)
+
+        if self.autoscaler:
+            stats['scaling'] = self.autoscaler.get_stats()
+
+        if self.sink:
+            stats['sink'] = self.sink.get_stats()
+
+        if self.lock_profiler:
+            stats['locks'] = self.lock_profiler.get_stats()
+
+        if self.replayer:
+            stats['replay'] = self.replayer.get_stats()
+
+        if isinstance(self.consumer, WindowConsumer):
+            stats['windows'] = self.consumer.aggregator.get_stats()
+
+        if self.placement:
+            stats['placement'] = self._get_placement_stats()
+
+        return stats
+
+    def _get_broadcast_stats(self):
+        """
+        Get statistics about the last process_broadcast execution.
+
+        Returns:
+            Dictionary with 'produced', per-group 'consumed' counts,
+            'success', and the ring's per-group 'groups' stats
+        """
+        produced = self.producer.items_produced
+        consumed = {
+            name: consumer.items_consumed
+            for name, consumer in self.group_consumers.items()
+        }
+
+        stats = {
+            'produced': produced,
+            'consumed': consumed,
+            'success': all(count == produced for count in consumed.values()),
+            'groups': self.shared_buffer.stats()['groups']
+        }
+
+        if self.placement:
+            stats['placement'] = self._get_placement_stats()
+
+        return stats
+
+    def _plan_placement(self, workers):
+        """
+        Plan CPUs for the workers of a run.
+
+        Args:
+            workers: List of worker names, the producer first
+
+        Returns:
+            Dictionary mapping worker names to CPU lists; empty without a
+            placement or where pinning is unsupported
+        """
+        if self.placement is None or not affinity_supported():
+            return {}
+        return plan_placement(self.placement, workers)
+
+    def _get_placement_stats(self):
+        """
+        Get the placement strategy and the CPUs planned for each worker.
+
+        Returns:
+            Dictionary with 'strategy', 'pinned' (False where pinning is
+            unsupported) and 'workers' mapping worker names to CPU lists
+        """
+        return {
+            'strategy': self.placement,
+            'pinned': bool(self.placement_plan),
+            'workers': dict(self.placement_plan)
+        }
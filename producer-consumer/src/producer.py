@@ -1,4 +1,5 @@
 import time
+from .affinity import pin_current_thread
 
 
 class Producer:
@@ -6,24 +7,31 @@ class Producer:
     Producer that reads items from source data and places them into a shared buffer.
 
     The producer iterates through source data and adds each item to the buffer.
-    It can optionally delay between items and invoke a callback after each production.
+    Source data can be a list or any iterable, including streaming file sources
+    that are read lazily as the buffer accepts items. It can optionally delay
+    between items and invoke a callback after each production.
     """
 
-    def __init__(self, shared_buffer, source_data, delay=0, on_produce=None):
+    __slots__ = ('shared_buffer', 'source_data', 'delay', 'on_produce', 'cpus', 'items_produced')
+
+    def __init__(self, shared_buffer, source_data, delay=0, on_produce=None, cpus=None):
         """
         Initialize the producer with data source and configuration.
 
         Args:
             shared_buffer: The SharedBuffer instance to produce into
-            source_data: List of items to produce
+            source_data: Iterable of items to produce, such as a list or a
+                        FileLineSource / CSVRecordSource
             delay: Optional delay in seconds between producing items (default: 0)
             on_produce: Optional callback function(item, count, buffer_size)
                        called after each item is produced
+            cpus: Optional CPUs to pin the producer's thread to when it starts
         """
         self.shared_buffer = shared_buffer
         self.source_data = source_data
         self.delay = delay
         self.on_produce = on_produce
+        self.cpus = cpus
 
         # Track how many items have been produced
         self.items_produced = 0
@@ -36,6 +44,10 @@ class Producer:
         Calls the callback if provided and applies delay if configured.
         Marks the buffer as complete when all items are produced.
         """
+        # Pin the running thread first if a placement was given
+        if self.cpus:
+            pin_current_thread(self.cpus)
+
         for item in self.source_data:
             # Add item to the shared buffer
             self.shared_buffer.put(item)
@@ -0,0 +1,279 @@
+import sys
+import threading
+import time
+
+
+class _LockStats:
+    """
+    Lock counters for one thread in one buffer operation.
+
+    Only the owning thread updates a record, so no locking is needed.
+    """
+
+    __slots__ = (
+        'thread', 'operation', 'acquires', 'contended', 'acquire_time',
+        'max_acquire_time', 'hold_time', 'held_since', 'waits', 'wait_time',
+        'wakeups', 'spurious_wakeups'
+    )
+
+    def __init__(self, thread, operation):
+        self.thread = thread
+        self.operation = operation
+        self.acquires = 0
+        self.contended = 0
+        self.acquire_time = 0.0
+        self.max_acquire_time = 0.0
+        self.hold_time = 0.0
+        self.held_since = None
+        self.waits = 0
+        self.wait_time = 0.0
+        self.wakeups = 0
+        self.spurious_wakeups = 0
+
+
+class LockProfiler:
+    """
+    Collects lock-contention metrics from profiled conditions.
+
+    Metrics are kept per thread and per buffer operation (put, get, ...):
+    lock acquisitions and how many of them had to block, time spent acquiring
+    and holding the lock, time spent waiting on the condition, wakeups and
+    spurious wakeups (waking with nothing to do). Results are available as a
+    stats dictionary, a text report, or folded stacks for flame graph tools.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty profiler.
+        """
+        self.lock = threading.Lock()
+        self.records = []
+        self.local = threading.local()
+
+    def condition(self):
+        """
+        Create a condition variable that reports to this profiler.
+
+        Returns:
+            ProfiledCondition usable in place of threading.Condition
+        """
+        return ProfiledCondition(self)
+
+    def record_spurious_wakeup(self):
+        """
+        Count a wakeup after which the waiting thread still could not proceed.
+        """
+        self._current().spurious_wakeups += 1
+
+    def get_stats(self):
+        """
+        Get lock metrics per thread.
+
+        Returns:
+            Dictionary with 'threads', mapping each thread name to its
+            metrics, and 'total' with the same metrics over all threads.
+            Metrics are 'acquires', 'contended', 'acquire_ms',
+            'max_acquire_ms', 'hold_ms', 'waits', 'wait_ms', 'wakeups'
+            and 'spurious_wakeups'
+        """
+        with self.lock:
+            records = list(self.records)
+
+        threads = {}
+        for record in records:
+            threads.setdefault(record.thread, []).append(record)
+
+        return {
+            'threads': {name: _summarize(group) for name, group in threads.items()},
+            'total': _summarize(records)
+        }
+
+    def report(self):
+        """
+        Format the metrics as a text table, one row per thread and operation.
+
+        Rows are sorted by time spent acquiring and waiting, most first.
+
+        Returns:
+            Report text
+        """
+        with self.lock:
+            records = sorted(self.records, key=lambda r: r.acquire_time + r.wait_time, reverse=True)
+
+        lines = [
+            f"{'Thread':<24}{'Operation':<16}{'Acquires':>10}{'Contended':>11}"
+            f"{'Acquire ms':>12}{'Hold ms':>10}{'Wait ms':>10}{'Wakeups':>9}{'Spurious':>10}",
+            "-" * 112
+        ]
+        for record in records:
+            lines.append(
+                f"{record.thread[:23]:<24}{record.operation[:15]:<16}{record.acquires:>10}"
+                f"{record.contended:>11}{record.acquire_time * 1000:>12.2f}"
+                f"{record.hold_time * 1000:>10.2f}{record.wait_time * 1000:>10.2f}"
+                f"{record.wakeups:>9}{record.spurious_wakeups:>10}"
+            )
+
+        return "\n".join(lines)
+
+    def folded_stacks(self):
+        """
+        Export lock time in the folded stack format of flame graph tools.
+
+        Each line is 'thread;operation;state microseconds', where state is
+        'acquire', 'hold' or 'wait'. The output can be fed to flamegraph.pl
+        or loaded into speedscope.
+
+        Returns:
+            Folded stack text, one line per non-zero entry
+        """
+        with self.lock:
+            records = list(self.records)
+
+        lines = []
+        for record in records:
+            for state, seconds in (('acquire', record.acquire_time),
+                                   ('hold', record.hold_time),
+                                   ('wait', record.wait_time)):
+                micros = int(seconds * 1e6)
+                if micros:
+                    lines.append(f"{record.thread};{record.operation};{state} {micros}")
+
+        return "\n".join(lines)
+
+    def _begin(self, operation):
+        """Make the calling thread's record for an operation current."""
+        local = self.local
+        try:
+            records = local.records
+        except AttributeError:
+            records = local.records = {}
+
+        stats = records.get(operation)
+        if stats is None:
+            stats = records[operation] = _LockStats(threading.current_thread().name, operation)
+            with self.lock:
+                self.records.append(stats)
+
+        local.stats = stats
+        return stats
+
+    def _current(self):
+        """Get the calling thread's current record."""
+        try:
+            return self.local.stats
+        except AttributeError:
+            return self._begin('<unknown>')
+
+
+class ProfiledCondition:
+    """
+    Condition variable that records lock metrics to a LockProfiler.
+
+    Drop-in replacement for threading.Condition. Uncontended acquisitions
+    take a non-blocking fast path, so only blocked acquisitions are timed.
+    The operation a metric belongs to is the name of the function that
+    entered the condition's with block.
+    """
+
+    def __init__(self, profiler):
+        """
+        Initialize the condition with its own lock.
+
+        Args:
+            profiler: LockProfiler receiving the metrics
+        """
+        self.profiler = profiler
+        self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
+
+    def __enter__(self):
+        # Attribute the metrics to the buffer method entering the block
+        self.profiler._begin(sys._getframe(1).f_code.co_name)
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    def acquire(self, blocking=True, timeout=-1):
+        """
+        Acquire the lock, timing the acquisition if it has to block.
+
+        Returns:
+            True if the lock was acquired
+        """
+        stats = self.profiler._current()
+
+        if not self.lock.acquire(False):
+            if not blocking:
+                return False
+
+            started = time.perf_counter()
+            if not self.lock.acquire(True, timeout):
+                return False
+            elapsed = time.perf_counter() - started
+
+            stats.contended += 1
+            stats.acquire_time += elapsed
+            stats.max_acquire_time = max(stats.max_acquire_time, elapsed)
+
+        stats.acquires += 1
+        stats.held_since = time.perf_counter()
+        return True
+
+    def release(self):
+        """
+        Release the lock, adding the time it was held.
+        """
+        stats = self.profiler._current()
+        if stats.held_since is not None:
+            stats.hold_time += time.perf_counter() - stats.held_since
+            stats.held_since = None
+        self.lock.release()
+
+    def wait(self, timeout=None):
+        """
+        Wait on the condition, timing the wait and counting wakeups.
+
+        Args:
+            timeout: Optional maximum time in seconds to wait
+
+        Returns:
+            True if woken by a notify, False if the timeout expired
+        """
+        stats = self.profiler._current()
+        started = time.perf_counter()
+        if stats.held_since is not None:
+            stats.hold_time += started - stats.held_since
+
+        notified = self.condition.wait(timeout)
+
+        now = time.perf_counter()
+        stats.waits += 1
+        stats.wait_time += now - started
+        if notified:
+            stats.wakeups += 1
+        stats.held_since = now
+        return notified
+
+    def notify(self, n=1):
+        """Wake up to n threads waiting on the condition."""
+        self.condition.notify(n)
+
+    def notify_all(self):
+        """Wake every thread waiting on the condition."""
+        self.condition.notify_all()
+
+
+def _summarize(records):
+    """Sum lock metrics over several records."""
+    return {
+        'acquires': sum(r.acquires for r in records),
+        'contended': sum(r.contended for r in records),
+        'acquire_ms': sum(r.acquire_time for r in records) * 1000,
+        'max_acquire_ms': max((r.max_acquire_time for r in records), default=0) * 1000,
+        'hold_ms': sum(r.hold_time for r in records) * 1000,
+        'waits': sum(r.waits for r in records),
+        'wait_ms': sum(r.wait_time for r in records) * 1000,
+        'wakeups': sum(r.wakeups for r in records),
+        'spurious_wakeups': sum(r.spurious_wakeups for r in records)
+    }
@@ -0,0 +1,278 @@
+import io
+import marshal
+import pickle
+import threading
+import time
+
+
+class Serializer:
+    """
+    Base class for item serializers used by cross-process pipeline modes.
+
+    A serializer turns an item into a list of frames (bytes-like objects) and
+    back. Keeping large buffers as separate frames lets transports send and
+    receive them without copying them into one contiguous payload. Every call
+    is timed, so per-item serialization cost shows up in stats.
+    Subclasses implement _dumps and _loads.
+    """
+
+    name = None
+
+    def __init__(self):
+        """
+        Initialize serialization counters.
+        """
+        self.lock = threading.Lock()
+        self.items_serialized = 0
+        self.items_deserialized = 0
+        self.bytes_serialized = 0
+        self.serialize_time = 0.0
+        self.deserialize_time = 0.0
+
+    def dumps(self, item):
+        """
+        Serialize an item into frames.
+
+        Args:
+            item: The item to serialize
+
+        Returns:
+            List of bytes-like frames
+        """
+        started = time.perf_counter()
+        frames = self._dumps(item)
+        elapsed = time.perf_counter() - started
+
+        size = sum(memoryview(frame).nbytes for frame in frames)
+        with self.lock:
+            self.items_serialized += 1
+            self.bytes_serialized += size
+            self.serialize_time += elapsed
+
+        return frames
+
+    def loads(self, frames):
+        """
+        Rebuild an item from the frames produced by dumps.
+
+        Args:
+            frames: List of bytes-like frames
+
+        Returns:
+            The deserialized item
+        """
+        started = time.perf_counter()
+        item = self._loads(frames)
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            self.items_deserialized += 1
+            self.deserialize_time += elapsed
+
+        return item
+
+    def get_stats(self):
+        """
+        Get serialization counts, bytes and per-item timing.
+
+        Returns:
+            Dictionary with 'serializer', item counts, 'bytes_serialized',
+            and average serialize and deserialize time in microseconds
+        """
+        with self.lock:
+            serialized = self.items_serialized
+            deserialized = self.items_deserialized
+
+            return {
+                'serializer': self.name,
+                'items_serialized': serialized,
+                'items_deserialized': deserialized,
+                'bytes_serialized': self.bytes_serialized,
+                'avg_serialize_us': self.serialize_time * 1e6 / serialized if serialized else 0,
+                'avg_deserialize_us': self.deserialize_time * 1e6 / deserialized if deserialized else 0
+            }
+
+    def _dumps(self, item):
+        raise NotImplementedError
+
+    def _loads(self, frames):
+        raise NotImplementedError
+
+
+# Largest container whose direct values are checked for out-of-band bytes
+_SCAN_LIMIT = 64
+
+
+class _OutOfBandPickler(pickle.Pickler):
+    """
+    Protocol 5 pickler that also sends large bytes and bytearrays out of band.
+
+    Protocol 5 hands PickleBuffers (such as numpy arrays) to the buffer
+    callback, but bytes and bytearray objects are copied into the stream.
+    Those above the threshold are added to the same frame list as persistent
+    references instead, so all out-of-band frames stay in stream order.
+    """
+
+    def __init__(self, file, frames, threshold):
+        super().__init__(file, protocol=5, buffer_callback=frames.append)
+        self.frames = frames
+        self.threshold = threshold
+
+    def persistent_id(self, obj):
+        kind = type(obj)
+        if (kind is bytes or kind is bytearray) and len(obj) >= self.threshold:
+            self.frames.append(obj)
+            return kind.__name__
+        return None
+
+
+class _OutOfBandUnpickler(pickle.Unpickler):
+    """
+    Unpickler that reads out-of-band frames in stream order.
+
+    PickleBuffers and persistent bytes references draw from one shared frame
+    iterator, matching the order they were written in.
+    """
+
+    def __init__(self, file, frames):
+        super().__init__(file, buffers=frames)
+        self.frames = frames
+
+    def persistent_load(self, pid):
+        frame = next(self.frames)
+        return bytearray(frame) if pid == 'bytearray' else bytes(frame)
+
+
+class PickleSerializer(Serializer):
+    """
+    Serializer using pickle protocol 5 with out-of-band buffers.
+
+    The first frame is the pickle stream; large buffers in the item follow as
+    their own frames instead of being copied into the stream. PickleBuffers
+    such as numpy arrays always go out of band. Bytes and bytearrays above the
+    threshold go out of band when they are the item itself or sit directly in
+    a small dict, list or tuple, like a record's payload field; checking every
+    object would slow down items made of many small values.
+    """
+
+    name = 'pickle'
+
+    def __init__(self, out_of_band_threshold=1024):
+        """
+        Initialize the serializer.
+
+        Args:
+            out_of_band_threshold: Minimum size in bytes of a bytes or bytearray
+                                  object to send out of band (default: 1024)
+        """
+        super().__init__()
+        self.out_of_band_threshold = out_of_band_threshold
+
+    def _dumps(self, item):
+        buffers = []
+
+        # Items without large raw buffers take the plain C pickler fast path
+        if not self._has_large_raw_buffer(item):
+            stream = pickle.dumps(item, protocol=5, buffer_callback=buffers.append)
+            return [stream] + [buffer.raw() for buffer in buffers]
+
+        stream = io.BytesIO()
+        _OutOfBandPickler(stream, buffers, self.out_of_band_threshold).dump(item)
+
+        frames = [stream.getbuffer()]
+        for buffer in buffers:
+            frames.append(buffer.raw() if isinstance(buffer, pickle.PickleBuffer) else buffer)
+        return frames
+
+    def _has_large_raw_buffer(self, item):
+        """Check the item and a small container's direct values for large bytes."""
+        kind = type(item)
+        if kind is dict:
+            if len(item) > _SCAN_LIMIT:
+                return False
+            item = item.values()
+        elif kind is list or kind is tuple:
+            if len(item) > _SCAN_LIMIT:
+                return False
+        else:
+            item = (item,)
+
+        return any(
+            (type(value) is bytes or type(value) is bytearray) and
+            len(value) >= self.out_of_band_threshold
+            for value in item
+        )
+
+    def _loads(self, frames):
+        return _OutOfBandUnpickler(io.BytesIO(frames[0]), iter(frames[1:])).load()
+
+
+class MarshalSerializer(Serializer):
+    """
+    Serializer using marshal, fast for simple built-in types.
+
+    Supports only None, bools, numbers, strings, bytes and containers of them.
+    """
+
+    name = 'marshal'
+
+    def _dumps(self, item):
+        return [marshal.dumps(item)]
+
+    def _loads(self, frames):
+        return marshal.loads(frames[0])
+
+
+class BytesSerializer(Serializer):
+    """
+    Passthrough serializer for items that already are bytes.
+
+    The item itself is the only frame, so nothing is encoded or copied.
+    Deserialized items are always returned as bytes.
+    """
+
+    name = 'bytes'
+
+    def _dumps(self, item):
+        if not isinstance(item, (bytes, bytearray, memoryview)):
+            raise TypeError(f"BytesSerializer needs bytes-like items, got {type(item).__name__}")
+        return [item]
+
+    def _loads(self, frames):
+        return bytes(frames[0])
+
+
+# Serializers selectable by name
+SERIALIZERS = {
+    PickleSerializer.name: PickleSerializer,
+    MarshalSerializer.name: MarshalSerializer,
+    BytesSerializer.name: BytesSerializer
+}
+
+
+def resolve_serializer(serializer):
+    """
+    Turn a serializer name or instance into a serializer instance.
+
+    Args:
+        serializer: None for the pickle default, a name from SERIALIZERS,
+                   or a Serializer instance
+
+    Returns:
+        Serializer instance
+
+    Raises:
+        ValueError: If the name is not a known serializer
+    """
+    if serializer is None:
+        return PickleSerializer()
+
+    if isinstance(serializer, str):
+        if serializer not in SERIALIZERS:
+            raise ValueError(
+                f"Unknown serializer '{serializer}', "
+                f"expected one of {sorted(SERIALIZERS)}"
+            )
+        return SERIALIZERS[serializer]()
+
+    return serializer
@@ -0,0 +1,291 @@
+import json
+import os
+import struct
+import threading
+import time
+from .serializers import resolve_serializer
+
+# Binary record header: number of frames; each frame is then prefixed by its length
+RECORD_COUNT = struct.Struct('!I')
+
+
+class FileSink:
+    """
+    Append-only file sink that consumers write items to.
+
+    Encoded items collect in a large in-memory buffer that is written to the
+    file in one system call when it fills, instead of one write per item.
+    For durability, writes are group-committed: the file is fsynced once
+    fsync_bytes have been written since the last sync, or once fsync_interval
+    seconds have passed at the next write, so one fsync covers many items.
+    A sink can be shared by several consumers; a lock serializes writes.
+    Subclasses implement _encode.
+    """
+
+    def __init__(self, path, buffer_size=1 << 20, fsync_bytes=None, fsync_interval=None):
+        """
+        Initialize the sink and open the file for appending.
+
+        Args:
+            path: Path of the file to append to
+            buffer_size: Number of buffered bytes that triggers a write
+                        (default: 1 MiB)
+            fsync_bytes: Optional number of bytes written since the last
+                        fsync that triggers another one
+            fsync_interval: Optional seconds since the last fsync after which
+                           the next write triggers another one
+
+        Raises:
+            ValueError: If buffer_size is not positive
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+
+        self.path = path
+        self.buffer_size = buffer_size
+        self.fsync_bytes = fsync_bytes
+        self.fsync_interval = fsync_interval
+
+        # Unbuffered file; the sink does its own buffering
+        self.file = open(path, 'ab', buffering=0)
+        self.buffer = bytearray()
+        self.lock = threading.Lock()
+
+        # Write and group-commit counters
+        self.items_written = 0
+        self.bytes_written = 0
+        self.writes = 0
+        self.unsynced_bytes = 0
+        self.last_sync = time.monotonic()
+        self.first_write = None
+        self.last_write = None
+
+        # Fsync count and latency
+        self.fsyncs = 0
+        self.fsync_time = 0.0
+        self.max_fsync_time = 0.0
+
+    @property
+    def durable(self):
+        """Whether the sink fsyncs its writes."""
+        return self.fsync_bytes is not None or self.fsync_interval is not None
+
+    def write(self, item):
+        """
+        Append one item.
+
+        Args:
+            item: The item to encode and append
+        """
+        self.write_many([item])
+
+    def write_many(self, items):
+        """
+        Append several items under a single lock acquisition.
+
+        Args:
+            items: Iterable of items to encode and append
+        """
+        encoded = [self._encode(item) for item in items]
+
+        with self.lock:
+            for data in encoded:
+                self.buffer += data
+            self.items_written += len(encoded)
+
+            if len(self.buffer) >= self.buffer_size:
+                self._write_buffer()
+
+            if self._sync_due():
+                self._write_buffer()
+                self._sync()
+
+    def flush(self):
+        """
+        Write buffered items to the file, and fsync them if the sink is durable.
+        """
+        with self.lock:
+            self._write_buffer()
+            if self.durable and self.unsynced_bytes:
+                self._sync()
+
+    def sync(self):
+        """
+        Write buffered items and fsync the file now.
+        """
+        with self.lock:
+            self._write_buffer()
+            self._sync()
+
+    def close(self):
+        """
+        Flush remaining items and close the file.
+        """
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+
+    def get_stats(self):
+        """
+        Get write throughput and fsync latency.
+
+        Returns:
+            Dictionary with 'items_written', 'bytes_written', 'writes' (write
+            system calls), 'bytes_per_sec' between the first and last write,
+            'fsyncs', and average and maximum fsync latency in milliseconds
+        """
+        with self.lock:
+            elapsed = (self.last_write - self.first_write) if self.first_write else 0
+
+            return {
+                'items_written': self.items_written,
+                'bytes_written': self.bytes_written,
+                'writes': self.writes,
+                'bytes_per_sec': self.bytes_written / elapsed if elapsed > 0 else 0,
+                'fsyncs': self.fsyncs,
+                'avg_fsync_ms': self.fsync_time * 1000 / self.fsyncs if self.fsyncs else 0,
+                'max_fsync_ms': self.max_fsync_time * 1000
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _encode(self, item):
+        raise NotImplementedError
+
+    def _sync_due(self):
+        """Check whether a group commit is due. Must hold the lock."""
+        if not self.unsynced_bytes and not self.buffer:
+            return False
+        if self.fsync_bytes is not None and self.unsynced_bytes + len(self.buffer) >= self.fsync_bytes:
+            return True
+        if self.fsync_interval is not None and time.monotonic() - self.last_sync >= self.fsync_interval:
+            return True
+        return False
+
+    def _write_buffer(self):
+        """Write the whole buffer to the file. Must hold the lock."""
+        if not self.buffer:
+            return
+
+        view = memoryview(self.buffer)
+        written = 0
+        while written < len(view):
+            written += self.file.write(view[written:])
+            self.writes += 1
+        view.release()
+
+        now = time.monotonic()
+        if self.first_write is None:
+            self.first_write = now
+        self.last_write = now
+
+        self.bytes_written += written
+        self.unsynced_bytes += written
+        self.buffer.clear()
+
+    def _sync(self):
+        """Fsync the file and record its latency. Must hold the lock."""
+        started = time.perf_counter()
+        os.fsync(self.file.fileno())
+        elapsed = time.perf_counter() - started
+
+        self.fsyncs += 1
+        self.fsync_time += elapsed
+        self.max_fsync_time = max(self.max_fsync_time, elapsed)
+        self.unsynced_bytes = 0
+        self.last_sync = time.monotonic()
+
+
+class JsonLinesSink(FileSink):
+    """
+    File sink that appends each item as one line of JSON.
+    """
+
+    def _encode(self, item):
+        return json.dumps(item, separators=(',', ':')).encode() + b'\n'
+
+
+class BinaryRecordSink(FileSink):
+    """
+    File sink that appends each item as a length-prefixed binary record.
+
+    Items are encoded by a serializer. A record is the number of frames,
+    then each frame as its length followed by its bytes; read the file
+    back with read_binary_records using the same kind of serializer.
+    """
+
+    def __init__(self, path, serializer=None, buffer_size=1 << 20, fsync_bytes=None,
+                 fsync_interval=None):
+        """
+        Initialize the sink and open the file for appending.
+
+        Args:
+            path: Path of the file to append to
+            serializer: Optional serializer instance or name ('pickle',
+                       'marshal', 'bytes'; default: pickle)
+            buffer_size: Number of buffered bytes that triggers a write
+                        (default: 1 MiB)
+            fsync_bytes: Optional number of bytes written since the last
+                        fsync that triggers another one
+            fsync_interval: Optional seconds since the last fsync after which
+                           the next write triggers another one
+        """
+        super().__init__(path, buffer_size=buffer_size, fsync_bytes=fsync_bytes,
+                         fsync_interval=fsync_interval)
+        self.serializer = resolve_serializer(serializer)
+
+    def _encode(self, item):
+        frames = self.serializer.dumps(item)
+        parts = [RECORD_COUNT.pack(len(frames))]
+        for frame in frames:
+            parts.append(RECORD_COUNT.pack(memoryview(frame).nbytes))
+            parts.append(frame)
+        return b''.join(parts)
+
+
+def read_binary_records(path, serializer=None):
+    """
+    Read back the items appended by a BinaryRecordSink.
+
+    Args:
+        path: Path of the record file
+        serializer: Optional serializer instance or name matching the one
+                   the records were written with (default: pickle)
+
+    Yields:
+        Each decoded item in file order
+
+    Raises:
+        ValueError: If the file ends in the middle of a record
+    """
+    serializer = resolve_serializer(serializer)
+
+    with open(path, 'rb') as file:
+        while True:
+            header = file.read(RECORD_COUNT.size)
+            if not header:
+                return
+
+            frames = []
+            for _ in range(RECORD_COUNT.unpack(_check_size(file, header, RECORD_COUNT.size))[0]):
+                length = RECORD_COUNT.unpack(_read_exact(file, RECORD_COUNT.size))[0]
+                frames.append(_read_exact(file, length))
+
+            yield serializer.loads(frames)
+
+
+def _read_exact(file, size):
+    """Read size bytes from a record file."""
+    return _check_size(file, file.read(size), size)
+
+
+def _check_size(file, data, size):
+    """Check that a read returned size bytes."""
+    if len(data) != size:
+        raise ValueError(f"Truncated record in {file.name}")
+    return data
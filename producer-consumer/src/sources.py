@@ -0,0 +1,196 @@
+import csv
+import itertools
+import mmap
+import os
+
+
+# Column types of csv-analysis/data/sales_data.csv; other columns stay strings
+SALES_SCHEMA = {
+    'transaction_id': int,
+    'quantity': int,
+    'price': float
+}
+
+
+class FileLineSource:
+    """
+    Iterable source that streams the lines of a file in large chunks.
+
+    The file is read a chunk at a time, with buffered reads or through a
+    read-only memory map, and split into lines without ever holding more
+    than one chunk in memory. Passed to a Producer, reading overlaps with
+    consumption and the buffer's capacity bounds how far ahead it runs.
+    With a batch_size, lists of lines are produced instead of single lines,
+    so each buffer handoff carries many records.
+    """
+
+    def __init__(self, path, batch_size=None, chunk_size=1 << 20, use_mmap=False,
+                 encoding='utf-8'):
+        """
+        Initialize the source for a file.
+
+        Args:
+            path: Path of the file to read
+            batch_size: Optional number of lines per produced list (default:
+                       None, produce single lines)
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            use_mmap: Read through a memory map instead of buffered reads
+                     (default: False)
+            encoding: Text encoding of the file (default: 'utf-8')
+
+        Raises:
+            ValueError: If batch_size or chunk_size is not positive
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.path = path
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.use_mmap = use_mmap
+        self.encoding = encoding
+
+        # Progress counters, updated as the source is iterated
+        self.bytes_read = 0
+        self.records_read = 0
+
+    def __iter__(self):
+        records = self._records()
+        if self.batch_size is None:
+            return records
+        return _batched(records, self.batch_size)
+
+    def get_stats(self):
+        """
+        Get how much of the file has been read.
+
+        Returns:
+            Dictionary with 'bytes_read' and 'records_read'
+        """
+        return {
+            'bytes_read': self.bytes_read,
+            'records_read': self.records_read
+        }
+
+    def _records(self):
+        """Yield the records of the file; subclasses parse lines into records."""
+        for lines in self._line_blocks():
+            for line in lines:
+                self.records_read += 1
+                yield line
+
+    def _line_blocks(self):
+        """
+        Yield lists of complete lines, one list per chunk read.
+
+        Lines are decoded per chunk rather than one by one. A line cut off at
+        the end of a chunk is carried over to the next one.
+        """
+        remainder = b''
+
+        for chunk in self._chunks():
+            self.bytes_read += len(chunk)
+
+            data = remainder + chunk
+            end = data.rfind(b'\n') + 1
+            remainder = data[end:]
+
+            if end:
+                yield [_strip_cr(line) for line in data[:end - 1].decode(self.encoding).split('\n')]
+
+        # The last line may have no trailing newline
+        if remainder:
+            yield [_strip_cr(remainder.decode(self.encoding))]
+
+    def _chunks(self):
+        """Yield the raw bytes of the file one chunk at a time."""
+        with open(self.path, 'rb') as file:
+            if not self.use_mmap:
+                while True:
+                    chunk = file.read(self.chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+
+            # Empty files cannot be memory mapped
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+                for start in range(0, len(mapped), self.chunk_size):
+                    yield mapped[start:start + self.chunk_size]
+
+
+class CSVRecordSource(FileLineSource):
+    """
+    Iterable source that streams the rows of a CSV file as typed dicts.
+
+    The header row names the fields. Columns listed in the schema are
+    converted with their type (empty values become None); the rest stay
+    strings. The default schema matches csv-analysis/data/sales_data.csv.
+    Rows are parsed a chunk at a time, so quoted fields may contain commas
+    but not newlines. Blank lines are skipped.
+    """
+
+    def __init__(self, path, batch_size=None, chunk_size=1 << 20, use_mmap=False,
+                 encoding='utf-8', schema=None):
+        """
+        Initialize the source for a CSV file.
+
+        Args:
+            path: Path of the CSV file to read
+            batch_size: Optional number of records per produced list (default:
+                       None, produce single records)
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            use_mmap: Read through a memory map instead of buffered reads
+                     (default: False)
+            encoding: Text encoding of the file (default: 'utf-8')
+            schema: Optional dict mapping column names to type functions
+                   (default: SALES_SCHEMA)
+        """
+        super().__init__(path, batch_size=batch_size, chunk_size=chunk_size,
+                         use_mmap=use_mmap, encoding=encoding)
+        self.schema = SALES_SCHEMA if schema is None else schema
+        self.fieldnames = None
+
+    def _records(self):
+        """Yield each data row as a dict with schema columns converted."""
+        converters = None
+
+        for lines in self._line_blocks():
+            rows = csv.reader(line for line in lines if line)
+
+            # The first row of the file is the header
+            if converters is None:
+                header = next(rows, None)
+                if header is None:
+                    continue
+                self.fieldnames = header
+                converters = [self.schema.get(name) for name in header]
+
+            for row in rows:
+                self.records_read += 1
+                yield {
+                    name: (convert(value) if value != '' else None) if convert else value
+                    for name, convert, value in zip(self.fieldnames, converters, row)
+                }
+
+
+def _strip_cr(line):
+    """Remove the carriage return of a Windows line ending."""
+    return line[:-1] if line.endswith('\r') else line
+
+
+def _batched(iterable, size):
+    """Yield lists of up to size consecutive items."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,341 @@
+import json
+import sys
+from array import array
+import threading
+import time
+
+
+class TraceEvent:
+    """
+    One item of a recorded workload.
+
+    Holds when the item arrived relative to the start of the trace, its size
+    in bytes, and how long a consumer spent processing it.
+    """
+
+    __slots__ = ('offset', 'size', 'cost')
+
+    def __init__(self, offset, size, cost=0.0):
+        """
+        Initialize the event.
+
+        Args:
+            offset: Seconds between the start of the trace and the arrival
+            size: Size of the item in bytes
+            cost: Seconds spent processing the item (default: 0.0)
+        """
+        self.offset = offset
+        self.size = size
+        self.cost = cost
+
+    def to_dict(self):
+        """Get the event as a JSON-serializable dictionary."""
+        return {'offset': self.offset, 'size': self.size, 'cost': self.cost}
+
+    def __eq__(self, other):
+        return isinstance(other, TraceEvent) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"TraceEvent(offset={self.offset!r}, size={self.size!r}, cost={self.cost!r})"
+
+
+class Trace:
+    """
+    Recorded workload: item arrival times, sizes and processing costs.
+
+    Traces are saved as JSON lines, one event per line, so a workload
+    captured in production can be replayed later with
+    ProducerConsumerPipeline.replay.
+    """
+
+    def __init__(self, events):
+        """
+        Initialize the trace.
+
+        Args:
+            events: List of TraceEvent instances in arrival order
+        """
+        self.events = list(events)
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    @property
+    def duration(self):
+        """Seconds between the start of the trace and the last arrival."""
+        return self.events[-1].offset if self.events else 0.0
+
+    def save(self, path):
+        """
+        Write the trace to a JSON lines file.
+
+        Args:
+            path: Path of the file to write
+        """
+        with open(path, 'w') as file:
+            for event in self.events:
+                file.write(json.dumps(event.to_dict()) + '\n')
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a trace written by save.
+
+        Args:
+            path: Path of the trace file
+
+        Returns:
+            Trace instance
+        """
+        with open(path) as file:
+            return cls(
+                TraceEvent(**json.loads(line))
+                for line in file if line.strip()
+            )
+
+
+class TraceRecorder:
+    """
+    Records a workload trace from a live pipeline run.
+
+    Wrap the data source to record when each item arrives and how big it is,
+    and wrap the processing callback to record how long each item takes.
+    Costs are matched to arrivals in consumption order, which is arrival
+    order with a single consumer. Per-item metadata is kept in typed arrays,
+    a few bytes per item instead of a tuple of boxed numbers.
+    """
+
+    def __init__(self, size_fn=None):
+        """
+        Initialize an empty recorder.
+
+        Args:
+            size_fn: Optional function(item) returning an item's size in bytes
+                    (default: length of bytes-like items, sys.getsizeof otherwise)
+        """
+        self.size_fn = size_fn or _item_size
+        self.lock = threading.Lock()
+        self.started = None
+
+        # Arrival offsets, sizes and costs, one entry per item
+        self.offsets = array('d')
+        self.sizes = array('q')
+        self.costs = array('d')
+
+    def wrap_source(self, data):
+        """
+        Wrap a data source so every item's arrival and size are recorded.
+
+        Args:
+            data: Iterable of items to produce
+
+        Yields:
+            The items of data, unchanged
+        """
+        for item in data:
+            now = time.perf_counter()
+            if self.started is None:
+                self.started = now
+
+            self.offsets.append(now - self.started)
+            self.sizes.append(self.size_fn(item))
+            yield item
+
+    def wrap_consume(self, on_consume):
+        """
+        Wrap a per-item callback so its run time is recorded as the item's cost.
+
+        Args:
+            on_consume: Callback function(item, count, buffer_size) that does
+                       the processing
+
+        Returns:
+            Callback with the same signature
+        """
+        def timed(item, count, buffer_size):
+            started = time.perf_counter()
+            on_consume(item, count, buffer_size)
+            self._add_costs([time.perf_counter() - started])
+
+        return timed
+
+    def wrap_process(self, process_fn):
+        """
+        Wrap a batch function so its run time is recorded, split evenly per item.
+
+        Args:
+            process_fn: Function(batch) that processes a batch
+
+        Returns:
+            Function with the same signature
+        """
+        def timed(batch):
+            started = time.perf_counter()
+            process_fn(batch)
+            elapsed = time.perf_counter() - started
+            self._add_costs([elapsed / len(batch)] * len(batch))
+
+        return timed
+
+    def trace(self):
+        """
+        Build the trace recorded so far.
+
+        Returns:
+            Trace with one event per arrived item; items without a recorded
+            cost get a cost of 0
+        """
+        with self.lock:
+            costs = array('d', self.costs)
+
+        return Trace(
+            TraceEvent(offset, size, costs[index] if index < len(costs) else 0.0)
+            for index, (offset, size) in enumerate(zip(self.offsets, self.sizes))
+        )
+
+    def _add_costs(self, costs):
+        """Append costs in consumption order."""
+        with self.lock:
+            self.costs.extend(costs)
+
+
+class ReplayItem:
+    """
+    Synthetic item produced when replaying a trace.
+
+    Carries a zero-filled payload of the recorded size, the recorded cost,
+    and the time the item was scheduled to arrive, so its latency can be
+    measured once it is processed.
+    """
+
+    __slots__ = ('index', 'payload', 'cost', 'arrival')
+
+    def __init__(self, index, payload, cost, arrival):
+        self.index = index
+        self.payload = payload
+        self.cost = cost
+        self.arrival = arrival
+
+
+class TraceReplayer:
+    """
+    Replays a trace with its recorded timing.
+
+    Items arrive on the recorded schedule relative to the start of the
+    replay, not relative to each other, so producer delays do not
+    accumulate. Costs are applied by sleeping, by spinning (to reproduce
+    CPU-bound work), or not at all. The speed factor scales arrival times and
+    costs alike.
+    """
+
+    COST_MODES = ('sleep', 'spin', 'none')
+
+    def __init__(self, trace, speed=1.0, cost_mode='sleep'):
+        """
+        Initialize the replayer.
+
+        Args:
+            trace: Trace to replay
+            speed: Replay speed factor; 2.0 replays twice as fast (default: 1.0)
+            cost_mode: How to apply processing costs: 'sleep', 'spin' or
+                      'none' (default: 'sleep')
+
+        Raises:
+            ValueError: If speed is not positive or cost_mode is unknown
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        if cost_mode not in self.COST_MODES:
+            raise ValueError(
+                f"Unknown cost mode '{cost_mode}', expected one of {list(self.COST_MODES)}"
+            )
+
+        self.trace = trace
+        self.speed = speed
+        self.cost_mode = cost_mode
+
+        self.lock = threading.Lock()
+        self.started = None
+        self.finished = None
+        self.latencies = array('d')
+
+    def source(self):
+        """
+        Produce replay items on the recorded schedule.
+
+        Yields:
+            ReplayItem for each trace event, at its scheduled arrival time
+        """
+        self.started = time.perf_counter()
+
+        for index, event in enumerate(self.trace):
+            arrival = self.started + event.offset / self.speed
+
+            # Wait for the scheduled arrival, measured from the replay start
+            delay = arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            yield ReplayItem(index, bytes(event.size), event.cost / self.speed, arrival)
+
+    def on_consume(self, item, count, buffer_size):
+        """
+        Apply an item's recorded cost, then record its latency.
+
+        Matches the Consumer on_consume callback signature.
+        """
+        if self.cost_mode == 'sleep':
+            time.sleep(item.cost)
+        elif self.cost_mode == 'spin':
+            until = time.perf_counter() + item.cost
+            while time.perf_counter() < until:
+                pass
+
+        now = time.perf_counter()
+        with self.lock:
+            self.latencies.append(now - item.arrival)
+            self.finished = now
+
+    def get_stats(self):
+        """
+        Get latency percentiles and throughput of the replay.
+
+        Returns:
+            Dictionary with 'items', 'speed', 'cost_mode', 'duration_s',
+            'throughput' in items per second, and 'latency_ms' with
+            'p50', 'p99' and 'max' from scheduled arrival to processed
+        """
+        with self.lock:
+            latencies = sorted(self.latencies)
+            duration = (self.finished - self.started) if self.finished else 0.0
+
+        return {
+            'items': len(latencies),
+            'speed': self.speed,
+            'cost_mode': self.cost_mode,
+            'duration_s': duration,
+            'throughput': len(latencies) / duration if duration > 0 else 0,
+            'latency_ms': {
+                'p50': _percentile(latencies, 50) * 1000,
+                'p99': _percentile(latencies, 99) * 1000,
+                'max': (latencies[-1] if latencies else 0.0) * 1000
+            }
+        }
+
+
+def _item_size(item):
+    """Estimate an item's size in bytes."""
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return memoryview(item).nbytes
+    return sys.getsizeof(item)
+
+
+def _percentile(sorted_values, pct):
+    """Return the pct-th percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))
+    return sorted_values[index]
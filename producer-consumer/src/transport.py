@@ -0,0 +1,604 @@
+"""
+Network transport for splitting producers and consumers across processes or hosts.
+
+A BufferServer exposes a local SharedBuffer over TCP or a Unix socket, and
+RemoteBuffer clients offer the same put/get interface as SharedBuffer, so an
+unchanged Producer or Consumer can run on another machine.
+
+Wire protocol: every frame is a 4-byte big-endian payload length, a 1-byte
+opcode and the payload. Producers send items in batched PUT frames and may
+only send as many items as they hold credits for; the server grants credits
+equal to the free slots in its buffer, which mirrors the buffer's capacity
+backpressure across the network. Each client keeps one persistent connection
+and reuses it for every request.
+
+Items travel as per-item frames from a pluggable serializer. A batch payload
+is a layout header (item count, then each item's frame count and frame
+lengths) followed by the raw frame data, so large out-of-band buffers are
+written with scatter-gather sends and read back as slices of the receive
+buffer instead of being copied into one contiguous message.
+"""
+
+import collections
+import itertools
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from .serializers import resolve_serializer
+
+# Frame header: payload length, opcode
+HEADER = struct.Struct('!IB')
+
+# Requests
+OP_PUT = 1
+OP_CREDIT = 2
+OP_GET = 3
+OP_COMPLETE = 4
+OP_SIZE = 5
+
+# Responses
+OP_GRANT = 10
+OP_ITEMS = 11
+OP_ACK = 12
+OP_COUNT = 13
+
+# GET request: max items, timeout in seconds (negative means wait indefinitely)
+GET_REQUEST = struct.Struct('!Id')
+
+# ITEMS response prefix: whether the buffer is drained
+ITEMS_PREFIX = struct.Struct('!?')
+
+# GRANT and COUNT responses, and the fields of an item batch layout
+COUNT = struct.Struct('!I')
+
+# Most buffers a single sendmsg call accepts
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+
+def send_frame(sock, opcode, payload=b''):
+    """
+    Send one frame over a socket.
+
+    Args:
+        sock: Connected socket
+        opcode: Frame opcode
+        payload: Frame payload bytes, or a list of bytes-like buffers that
+                together form the payload
+    """
+    if not isinstance(payload, list):
+        sock.sendall(HEADER.pack(len(payload), opcode) + payload)
+        return
+
+    views = [memoryview(buffer).cast('B') for buffer in payload]
+    length = sum(view.nbytes for view in views)
+    send_buffers(sock, [memoryview(HEADER.pack(length, opcode))] + views)
+
+
+def send_buffers(sock, views):
+    """
+    Send several buffers in order without joining them.
+
+    Uses scatter-gather sendmsg calls where available, resuming after
+    partial sends, and falls back to one sendall per buffer.
+
+    Args:
+        sock: Connected socket
+        views: List of byte-format memoryviews
+    """
+    views = collections.deque(view for view in views if view.nbytes)
+
+    if not hasattr(sock, 'sendmsg'):
+        for view in views:
+            sock.sendall(view)
+        return
+
+    while views:
+        sent = sock.sendmsg(list(itertools.islice(views, IOV_MAX)))
+
+        # Drop fully sent buffers and trim a partially sent one
+        while sent:
+            if sent >= views[0].nbytes:
+                sent -= views.popleft().nbytes
+            else:
+                views[0] = views[0][sent:]
+                sent = 0
+
+
+def encode_items(serializer, items, prefix=b''):
+    """
+    Encode a batch of items as a list of payload buffers.
+
+    Args:
+        serializer: Serializer turning each item into frames
+        items: List of items to encode
+        prefix: Optional bytes placed before the layout header
+
+    Returns:
+        List of buffers: the prefix and layout header, then every frame
+    """
+    layout = [prefix, COUNT.pack(len(items))]
+    frames = []
+
+    for item in items:
+        item_frames = [memoryview(frame).cast('B') for frame in serializer.dumps(item)]
+        layout.append(COUNT.pack(len(item_frames)))
+        for frame in item_frames:
+            layout.append(COUNT.pack(frame.nbytes))
+            frames.append(frame)
+
+    return [b''.join(layout)] + frames
+
+
+def decode_items(serializer, payload, offset=0):
+    """
+    Decode a batch of items encoded by encode_items.
+
+    Frames are handed to the serializer as slices of the payload, without
+    copying them out first.
+
+    Args:
+        serializer: Serializer rebuilding each item from its frames
+        payload: Received payload buffer
+        offset: Position of the layout header in the payload
+
+    Returns:
+        List of decoded items
+    """
+    view = memoryview(payload)
+    count = COUNT.unpack_from(view, offset)[0]
+    offset += COUNT.size
+
+    # Read every item's frame lengths from the layout header
+    layout = []
+    for _ in range(count):
+        frame_count = COUNT.unpack_from(view, offset)[0]
+        offset += COUNT.size
+        lengths = [COUNT.unpack_from(view, offset + i * COUNT.size)[0] for i in range(frame_count)]
+        offset += frame_count * COUNT.size
+        layout.append(lengths)
+
+    # Frame data follows the header in the same order
+    items = []
+    for lengths in layout:
+        frames = []
+        for length in lengths:
+            frames.append(view[offset:offset + length])
+            offset += length
+        items.append(serializer.loads(frames))
+
+    return items
+
+
+def recv_frame(sock):
+    """
+    Receive one frame from a socket.
+
+    Args:
+        sock: Connected socket
+
+    Returns:
+        Tuple of (opcode, payload), or (None, None) if the peer closed the
+        connection before a new frame started
+
+    Raises:
+        ConnectionError: If the connection closes in the middle of a frame
+    """
+    header = recv_exact(sock, HEADER.size)
+    if header is None:
+        return None, None
+
+    length, opcode = HEADER.unpack(header)
+    payload = recv_exact(sock, length) if length else b''
+    if payload is None:
+        raise ConnectionError("Connection closed in the middle of a frame")
+
+    return opcode, payload
+
+
+def recv_exact(sock, size):
+    """
+    Receive exactly size bytes from a socket.
+
+    Args:
+        sock: Connected socket
+        size: Number of bytes to receive
+
+    Returns:
+        A bytearray holding the received bytes, or None if the peer closed
+        the connection first
+    """
+    data = bytearray(size)
+    view = memoryview(data)
+    received = 0
+
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            if received == 0:
+                return None
+            raise ConnectionError("Connection closed in the middle of a frame")
+        received += count
+
+    return data
+
+
+def _is_unix_address(address):
+    """Check whether an address is a Unix socket path rather than (host, port)."""
+    return isinstance(address, str)
+
+
+class _BufferRequestHandler(socketserver.BaseRequestHandler):
+    """
+    Serve frames from one client connection against the server's buffer.
+
+    Frames on a connection are handled in order, so a producer's PUT frames
+    are always applied before its COMPLETE frame.
+    """
+
+    def handle(self):
+        buffer = self.server.shared_buffer
+        serializer = self.server.serializer
+
+        while True:
+            opcode, payload = recv_frame(self.request)
+            if opcode is None:
+                break
+
+            if opcode == OP_PUT:
+                for item in decode_items(serializer, payload):
+                    buffer.put(item)
+
+            elif opcode == OP_CREDIT:
+                send_frame(self.request, OP_GRANT, COUNT.pack(buffer.wait_for_space()))
+
+            elif opcode == OP_GET:
+                max_items, timeout = GET_REQUEST.unpack(payload)
+                items = buffer.get_batch(max_items, timeout=timeout if timeout >= 0 else None)
+                drained = not items and buffer.is_drained()
+                send_frame(self.request, OP_ITEMS,
+                           encode_items(serializer, items, ITEMS_PREFIX.pack(drained)))
+
+            elif opcode == OP_COMPLETE:
+                buffer.mark_complete()
+                send_frame(self.request, OP_ACK)
+
+            elif opcode == OP_SIZE:
+                send_frame(self.request, OP_COUNT, COUNT.pack(buffer.size()))
+
+            else:
+                raise ValueError(f"Unknown opcode {opcode}")
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    class _ThreadingUnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+else:
+    _ThreadingUnixServer = None
+
+
+class BufferServer:
+    """
+    Server that exposes a SharedBuffer to remote producers and consumers.
+
+    Each client connection is served by its own thread. The server runs in a
+    background thread between start() and stop(). Clients must use the same
+    kind of serializer as the server.
+    """
+
+    def __init__(self, shared_buffer, address=('127.0.0.1', 0), serializer=None):
+        """
+        Initialize the server for a buffer and bind its socket.
+
+        Args:
+            shared_buffer: The SharedBuffer to expose
+            address: (host, port) tuple for TCP, or a filesystem path for a
+                    Unix socket (default: localhost on a free port)
+            serializer: Optional serializer instance or name ('pickle',
+                       'marshal', 'bytes'; default: pickle)
+        """
+        self.shared_buffer = shared_buffer
+        self.serializer = resolve_serializer(serializer)
+
+        if _is_unix_address(address):
+            if _ThreadingUnixServer is None:
+                raise OSError("Unix sockets are not supported on this platform")
+            self.server = _ThreadingUnixServer(address, _BufferRequestHandler)
+        else:
+            self.server = _ThreadingTCPServer(address, _BufferRequestHandler)
+
+        self.server.shared_buffer = shared_buffer
+        self.server.serializer = self.serializer
+        self.thread = None
+
+    @property
+    def address(self):
+        """
+        The bound address, including the actual port when port 0 was requested.
+        """
+        return self.server.server_address
+
+    def start(self):
+        """
+        Start serving connections in a background thread.
+
+        Returns:
+            The server itself, so it can be started inline
+        """
+        # Poll for shutdown often so stop() returns promptly
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={'poll_interval': 0.05},
+            daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def get_stats(self):
+        """
+        Get serialization stats for items received and sent by the server.
+
+        Returns:
+            Dictionary from the serializer's get_stats
+        """
+        return self.serializer.get_stats()
+
+    def stop(self):
+        """
+        Stop serving and close the listening socket.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class RemoteBuffer:
+    """
+    Client for a BufferServer with the same interface as SharedBuffer.
+
+    Puts are collected into batches and sent within the credits granted by the
+    server; a partial batch is sent once its oldest item has waited linger_ms.
+    Gets fetch up to prefetch items per round trip and hand them out
+    locally. One persistent connection is reused for every request. Use
+    separate clients for producing and consuming, since a waiting get holds
+    the client's connection.
+    """
+
+    def __init__(self, address, batch_size=32, prefetch=16, serializer=None, linger_ms=5):
+        """
+        Initialize the client for a server address.
+
+        Args:
+            address: (host, port) tuple for TCP, or a filesystem path for a
+                    Unix socket
+            batch_size: Maximum number of items per PUT frame; pending items
+                       are also sent on flush(), size() and mark_complete()
+                       (default: 32)
+            prefetch: Maximum number of items fetched per GET round trip
+                     (default: 16)
+            serializer: Optional serializer instance or name matching the
+                       server's ('pickle', 'marshal', 'bytes'; default: pickle)
+            linger_ms: Maximum time in milliseconds a put item waits for its
+                      batch to fill before it is sent anyway; None waits for
+                      a full batch or an explicit send (default: 5)
+        """
+        self.address = address
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        self.serializer = resolve_serializer(serializer)
+        self.linger = None if linger_ms is None else linger_ms / 1000.0
+
+        self.sock = None
+        self.lock = threading.Lock()
+
+        # Producer side: items waiting to be sent and credits left to send them
+        self.pending = []
+        self.credits = 0
+
+        # Thread sending a partial batch once its oldest item has lingered
+        self.linger_thread = None
+        self.linger_wakeup = threading.Condition(self.lock)
+        self.oldest_pending = None
+        self.closed = False
+
+        # Consumer side: items fetched but not yet handed out
+        self.prefetched = collections.deque()
+        self.drained = False
+
+    def put(self, item):
+        """
+        Add an item, sending a batch when it is full or credits run out.
+
+        A partial batch is sent by a background thread once its oldest item
+        has waited linger_ms, so items from a slow producer are not held back.
+
+        Blocks while the server's buffer has no free slots.
+
+        Args:
+            item: The item to add to the remote buffer
+        """
+        with self.lock:
+            self.pending.append(item)
+            if len(self.pending) >= min(self.batch_size, max(self.credits, 1)):
+                self._flush()
+            elif len(self.pending) == 1 and self.linger is not None:
+                self.oldest_pending = time.monotonic()
+                if self.linger_thread is None:
+                    self.linger_thread = threading.Thread(target=self._linger_loop, daemon=True)
+                    self.linger_thread.start()
+                else:
+                    self.linger_wakeup.notify()
+
+    def flush(self):
+        """
+        Send every pending item to the server.
+        """
+        with self.lock:
+            self._flush()
+
+    def get(self, timeout=None):
+        """
+        Remove and return the next item. Blocks if the remote buffer is empty.
+
+        Args:
+            timeout: Optional maximum time in seconds to wait for an item
+
+        Returns:
+            The next item, or None if production is complete or the timeout
+            expired (use is_drained() to tell them apart)
+        """
+        with self.lock:
+            if not self.prefetched:
+                self._fetch(self.prefetch, timeout)
+            return self.prefetched.popleft() if self.prefetched else None
+
+    def get_batch(self, max_items, timeout=None):
+        """
+        Remove and return up to max_items items in one step.
+
+        Args:
+            max_items: Maximum number of items to return
+            timeout: Optional maximum time in seconds to wait for the first item
+
+        Returns:
+            List of items; empty if the timeout expired or production is
+            complete and the remote buffer is empty
+        """
+        with self.lock:
+            if not self.prefetched:
+                self._fetch(max_items, timeout)
+
+            count = min(max_items, len(self.prefetched))
+            return [self.prefetched.popleft() for _ in range(count)]
+
+    def is_drained(self):
+        """
+        Check whether production is complete and every item has been taken.
+        """
+        with self.lock:
+            return self.drained and not self.prefetched
+
+    def mark_complete(self):
+        """
+        Send pending items, then signal that production is complete.
+        """
+        with self.lock:
+            self._flush()
+            self._request(OP_COMPLETE)
+
+    def size(self):
+        """
+        Send pending items, then get the current size of the remote buffer.
+
+        Returns:
+            Current remote buffer size
+        """
+        with self.lock:
+            self._flush()
+            _, payload = self._request(OP_SIZE)
+            return COUNT.unpack(payload)[0]
+
+    def get_stats(self):
+        """
+        Get serialization stats for items sent and received by this client.
+
+        Returns:
+            Dictionary from the serializer's get_stats
+        """
+        return self.serializer.get_stats()
+
+    def close(self):
+        """
+        Send pending items and close the connection.
+        """
+        with self.lock:
+            self.closed = True
+            self.linger_wakeup.notify()
+            if self.sock is None:
+                return
+            self._flush()
+            self.sock.close()
+            self.sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _connection(self):
+        """Get the persistent connection, connecting on first use. Must hold the lock."""
+        if self.sock is None:
+            family = socket.AF_UNIX if _is_unix_address(self.address) else socket.AF_INET
+            self.sock = socket.socket(family, socket.SOCK_STREAM)
+            self.sock.connect(self.address)
+            if family == socket.AF_INET:
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return self.sock
+
+    def _request(self, opcode, payload=b''):
+        """Send a request frame and wait for its response. Must hold the lock."""
+        sock = self._connection()
+        send_frame(sock, opcode, payload)
+
+        response = recv_frame(sock)
+        if response[0] is None:
+            raise ConnectionError("Server closed the connection")
+        return response
+
+    def _linger_loop(self):
+        """Send partial batches whose oldest item has waited linger_ms, until closed."""
+        with self.lock:
+            while not self.closed:
+                if not self.pending:
+                    self.linger_wakeup.wait()
+                    continue
+
+                remaining = self.oldest_pending + self.linger - time.monotonic()
+                if remaining > 0:
+                    self.linger_wakeup.wait(remaining)
+                else:
+                    self._flush()
+
+    def _flush(self):
+        """Send pending items in batches within granted credits. Must hold the lock."""
+        while self.pending:
+            # Wait for the server to grant credits for free buffer slots
+            if self.credits == 0:
+                _, payload = self._request(OP_CREDIT)
+                self.credits = COUNT.unpack(payload)[0]
+
+            count = min(self.credits, self.batch_size, len(self.pending))
+            batch = self.pending[:count]
+            del self.pending[:count]
+
+            send_frame(self._connection(), OP_PUT, encode_items(self.serializer, batch))
+            self.credits -= count
+
+    def _fetch(self, max_items, timeout):
+        """Fetch up to max_items items into the prefetch queue. Must hold the lock."""
+        if self.drained:
+            return
+
+        request = GET_REQUEST.pack(max_items, -1.0 if timeout is None else timeout)
+        _, payload = self._request(OP_GET, request)
+
+        self.drained = ITEMS_PREFIX.unpack_from(payload)[0]
+        self.prefetched.extend(decode_items(self.serializer, payload, ITEMS_PREFIX.size))
@@ -0,0 +1,217 @@
+import time
+
+
+class BlockingWaitStrategy:
+    """
+    Wait strategy that parks the thread on the condition variable.
+
+    This is the classic wait/notify behavior: the waiting thread sleeps until
+    another thread calls notify. It uses no CPU while waiting but pays the
+    sleep/wake cost of the condition variable on every handoff.
+    """
+
+    name = 'blocking'
+
+    def wait(self, condition, ready, timeout=None):
+        """
+        Park on the condition until notified or the timeout expires.
+
+        Must be called with the condition's lock held. The caller re-checks
+        its predicate after this returns.
+
+        Args:
+            condition: The threading.Condition guarding the shared state
+            ready: Callable returning True once the waiter can proceed
+            timeout: Optional maximum time in seconds to wait
+        """
+        condition.wait(timeout)
+
+
+class SpinYieldParkWaitStrategy:
+    """
+    Wait strategy that spins, then yields, then parks.
+
+    The lock is released while spinning so the other side can make progress.
+    A bounded number of tight spins catches handoffs that arrive within
+    microseconds, a bounded number of yields gives other threads the CPU, and
+    only then does the thread park on the condition like the blocking strategy.
+    """
+
+    name = 'spin'
+
+    def __init__(self, spin_iterations=1000, yield_iterations=100):
+        """
+        Initialize the strategy with its spin and yield budgets.
+
+        Args:
+            spin_iterations: Number of tight predicate checks before yielding
+                            (default: 1000)
+            yield_iterations: Number of yield-and-check rounds before parking
+                             (default: 100)
+        """
+        self.spin_iterations = spin_iterations
+        self.yield_iterations = yield_iterations
+
+    def wait(self, condition, ready, timeout=None):
+        """
+        Spin and yield without the lock, then park on the condition.
+
+        Must be called with the condition's lock held; the lock is held again
+        when this returns. The caller re-checks its predicate after this returns.
+
+        Args:
+            condition: The threading.Condition guarding the shared state
+            ready: Callable returning True once the waiter can proceed
+            timeout: Optional maximum time in seconds to wait
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        condition.release()
+        try:
+            # Tight spin for handoffs that arrive almost immediately
+            for _ in range(self.spin_iterations):
+                if ready():
+                    return
+
+            # Give up the CPU between checks
+            for _ in range(self.yield_iterations):
+                time.sleep(0)
+                if ready():
+                    return
+        finally:
+            condition.acquire()
+
+        # Park, re-checking under the lock so no notify can be missed
+        if ready():
+            return
+        if deadline is None:
+            condition.wait()
+        else:
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                condition.wait(remaining)
+
+
+class BusySpinWaitStrategy:
+    """
+    Wait strategy that spins until the waiter can proceed.
+
+    Gives the lowest handoff latency at the cost of keeping a CPU busy for the
+    whole wait. Only suitable when a core can be dedicated to the waiting thread.
+
+    A pure spin only pays off on free-threaded builds. Under the GIL, the
+    spinning thread holds the interpreter the thread it waits on needs, so
+    the spin yields every yield_every checks to let that thread run.
+    """
+
+    name = 'busy_spin'
+
+    def __init__(self, yield_every=100):
+        """
+        Initialize the strategy with its yield interval.
+
+        Args:
+            yield_every: Number of predicate checks between yields of the GIL
+                        (default: 100)
+        """
+        self.yield_every = yield_every
+
+    def wait(self, condition, ready, timeout=None):
+        """
+        Spin without the lock until ready or the timeout expires.
+
+        Must be called with the condition's lock held; the lock is held again
+        when this returns. The caller re-checks its predicate after this returns.
+
+        Args:
+            condition: The threading.Condition guarding the shared state
+            ready: Callable returning True once the waiter can proceed
+            timeout: Optional maximum time in seconds to wait
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        condition.release()
+        try:
+            checks = 0
+            while not ready():
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+                checks += 1
+                if checks % self.yield_every == 0:
+                    # Let the thread being waited on take the GIL
+                    time.sleep(0)
+        finally:
+            condition.acquire()
+
+
+def wait_until(strategy, condition, ready, deadline=None, on_spurious_wakeup=None):
+    """
+    Wait with the given strategy until ready() is true or the deadline passes.
+
+    Must be called with the condition's lock held.
+
+    Args:
+        strategy: Wait strategy instance to wait with
+        condition: The threading.Condition guarding the shared state
+        ready: Callable returning True once the waiter can proceed
+        deadline: Optional time.monotonic() value after which to stop waiting
+        on_spurious_wakeup: Optional callback function() called each time a
+                           wait returns before the deadline with ready()
+                           still false
+
+    Returns:
+        True if ready() holds, False if the deadline passed first
+    """
+    waited = False
+
+    while not ready():
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+        # Woken up with nothing to do, so about to wait again
+        if waited and on_spurious_wakeup is not None:
+            on_spurious_wakeup()
+
+        strategy.wait(condition, ready, remaining)
+        waited = True
+
+    return True
+
+
+# Wait strategies selectable by name
+WAIT_STRATEGIES = {
+    BlockingWaitStrategy.name: BlockingWaitStrategy,
+    SpinYieldParkWaitStrategy.name: SpinYieldParkWaitStrategy,
+    BusySpinWaitStrategy.name: BusySpinWaitStrategy
+}
+
+
+def resolve_wait_strategy(strategy):
+    """
+    Turn a wait strategy name or instance into a wait strategy instance.
+
+    Args:
+        strategy: None for the blocking default, a name from WAIT_STRATEGIES,
+                 or an object with a wait(condition, ready, timeout) method
+
+    Returns:
+        Wait strategy instance
+
+    Raises:
+        ValueError: If the name is not a known wait strategy
+    """
+    if strategy is None:
+        return BlockingWaitStrategy()
+
+    if isinstance(strategy, str):
+        if strategy not in WAIT_STRATEGIES:
+            raise ValueError(
+                f"Unknown wait strategy '{strategy}', "
+                f"expected one of {sorted(WAIT_STRATEGIES)}"
+            )
+        return WAIT_STRATEGIES[strategy]()
+
+    return strategy
@@ -0,0 +1,369 @@
+import heapq
+import time
+from .consumer import Consumer, _retention
+from .affinity import pin_current_thread
+
+
+class TumblingWindows:
+    """
+    Fixed-size, non-overlapping time windows.
+
+    Every timestamp falls into exactly one window [start, start + size),
+    where start is a multiple of size.
+    """
+
+    def __init__(self, size):
+        """
+        Initialize the window assigner.
+
+        Args:
+            size: Window length in timestamp units (e.g. seconds)
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size <= 0:
+            raise ValueError("Window size must be positive")
+        self.size = size
+
+    def assign(self, timestamp):
+        """
+        Get the start of every window a timestamp falls into.
+
+        Args:
+            timestamp: Event timestamp
+
+        Returns:
+            List of window starts
+        """
+        return [timestamp - timestamp % self.size]
+
+
+class SlidingWindows:
+    """
+    Fixed-size windows that start every slide units and may overlap.
+
+    Every timestamp falls into size / slide windows [start, start + size),
+    where start is a multiple of slide.
+    """
+
+    def __init__(self, size, slide):
+        """
+        Initialize the window assigner.
+
+        Args:
+            size: Window length in timestamp units (e.g. seconds)
+            slide: Distance between the starts of consecutive windows
+
+        Raises:
+            ValueError: If size or slide is not positive, or slide exceeds size
+        """
+        if size <= 0 or slide <= 0:
+            raise ValueError("Window size and slide must be positive")
+        if slide > size:
+            raise ValueError("Window slide must not exceed the window size")
+        self.size = size
+        self.slide = slide
+
+    def assign(self, timestamp):
+        """
+        Get the start of every window a timestamp falls into.
+
+        Args:
+            timestamp: Event timestamp
+
+        Returns:
+            List of window starts, latest first
+        """
+        starts = []
+        start = timestamp - timestamp % self.slide
+        while start > timestamp - self.size:
+            starts.append(start)
+            start -= self.slide
+        return starts
+
+
+class _WindowState:
+    """
+    Running count, sum, min and max of one key's window.
+    """
+
+    __slots__ = ('count', 'total', 'minimum', 'maximum')
+
+    def __init__(self, value):
+        self.count = 1
+        self.total = value
+        self.minimum = value
+        self.maximum = value
+
+
+class WindowAggregator:
+    """
+    Incremental count, sum, min and max per key and time window.
+
+    Each open window keeps a single accumulator, so state grows with the
+    number of open windows and keys, not with the number of items. Event
+    time is tracked by a watermark, the largest timestamp seen so far. A
+    window closes and is emitted once the watermark passes its end plus the
+    allowed lateness; items arriving later for a closed window are dropped
+    and counted.
+    """
+
+    def __init__(self, windows, timestamp_fn, value_fn=None, key_fn=None,
+                 allowed_lateness=0):
+        """
+        Initialize the aggregator.
+
+        Args:
+            windows: TumblingWindows or SlidingWindows assigner
+            timestamp_fn: Function(item) returning the item's event timestamp
+            value_fn: Optional function(item) returning the value to sum, min
+                     and max (default: None, count items only)
+            key_fn: Optional function(item) returning the key to aggregate by
+                   (default: None, one aggregate per window)
+            allowed_lateness: How far behind the watermark, in timestamp
+                             units, an item may arrive and still be counted
+                             (default: 0)
+        """
+        self.windows = windows
+        self.timestamp_fn = timestamp_fn
+        self.value_fn = value_fn
+        self.key_fn = key_fn
+        self.allowed_lateness = allowed_lateness
+
+        # Accumulators of open windows: (key, start) -> _WindowState
+        self.open_windows = {}
+
+        # Open windows ordered by closing time: (close_at, start, sort key, key)
+        self.closing = []
+
+        # Largest timestamp seen so far
+        self.watermark = None
+
+        # Counters
+        self.items_added = 0
+        self.late_dropped = 0
+        self.windows_emitted = 0
+
+    def add(self, item):
+        """
+        Add an item to its windows and close windows the watermark has passed.
+
+        Args:
+            item: The item to aggregate
+
+        Returns:
+            List of results for windows closed by this item, in closing order
+        """
+        timestamp = self.timestamp_fn(item)
+        key = self.key_fn(item) if self.key_fn else None
+        value = self.value_fn(item) if self.value_fn else None
+
+        accepted = False
+        for start in self.windows.assign(timestamp):
+            close_at = start + self.windows.size + self.allowed_lateness
+
+            # Skip windows that have already been emitted
+            if self.watermark is not None and close_at <= self.watermark:
+                continue
+
+            accepted = True
+            state = self.open_windows.get((key, start))
+            if state is None:
+                self.open_windows[(key, start)] = _WindowState(value)
+                heapq.heappush(self.closing, (close_at, start, _sort_key(key), key))
+                continue
+
+            state.count += 1
+            if value is not None:
+                state.total += value
+                if value < state.minimum:
+                    state.minimum = value
+                if value > state.maximum:
+                    state.maximum = value
+
+        if not accepted:
+            self.late_dropped += 1
+            return []
+
+        self.items_added += 1
+        if self.watermark is None or timestamp > self.watermark:
+            self.watermark = timestamp
+            return self._close(self.watermark)
+        return []
+
+    def flush(self):
+        """
+        Close and emit every open window, e.g. at the end of the stream.
+
+        Returns:
+            List of results in closing order
+        """
+        return self._close(None)
+
+    def get_stats(self):
+        """
+        Get item, lateness and window counts.
+
+        Returns:
+            Dictionary with 'items', 'late_dropped', 'open_windows',
+            'windows_emitted' and 'watermark'
+        """
+        return {
+            'items': self.items_added,
+            'late_dropped': self.late_dropped,
+            'open_windows': len(self.open_windows),
+            'windows_emitted': self.windows_emitted,
+            'watermark': self.watermark
+        }
+
+    def _close(self, watermark):
+        """
+        Emit windows whose closing time the watermark has reached.
+
+        Args:
+            watermark: Current watermark, or None to close every window
+
+        Returns:
+            List of result dictionaries
+        """
+        results = []
+
+        while self.closing and (watermark is None or self.closing[0][0] <= watermark):
+            _, start, _, key = heapq.heappop(self.closing)
+            state = self.open_windows.pop((key, start))
+
+            results.append({
+                'key': key,
+                'start': start,
+                'end': start + self.windows.size,
+                'count': state.count,
+                'sum': state.total,
+                'min': state.minimum,
+                'max': state.maximum
+            })
+
+        self.windows_emitted += len(results)
+        return results
+
+
+class WindowConsumer(Consumer):
+    """
+    Consumer that aggregates items into time windows instead of storing them.
+
+    Each item is added to a WindowAggregator, and every window result it
+    closes is emitted downstream: to an on_emit callback, an output buffer
+    feeding a next pipeline stage, a file sink, and the window_results list,
+    which by default is only kept when there is no other destination.
+    Remaining windows are flushed when production completes, after
+    which the output buffer, if any, is marked complete. The aggregator is
+    not thread-safe, so each WindowConsumer needs its own.
+    """
+
+    __slots__ = ('aggregator', 'on_emit', 'output_buffer', 'window_results', '_retain_result')
+
+    def __init__(self, shared_buffer, aggregator, on_emit=None, output_buffer=None,
+                 delay=0, on_consume=None, poll_interval=None, sink=None, cpus=None,
+                 retain=None):
+        """
+        Initialize the window consumer.
+
+        Args:
+            shared_buffer: The SharedBuffer instance to consume from
+            aggregator: WindowAggregator holding the window state
+            on_emit: Optional callback function(result) called for each
+                    emitted window result
+            output_buffer: Optional buffer each window result is put into
+            delay: Optional delay in seconds between items (default: 0)
+            on_consume: Optional callback function(item, count, buffer_size)
+                       called after each item is aggregated
+            poll_interval: Optional time in seconds to wait for an item before
+                          checking whether the consumer was asked to retire
+            sink: Optional FileSink every window result is written to
+            cpus: Optional CPUs to pin the consumer's thread to when it starts
+            retain: Which window results to keep in window_results: True for
+                   all, an integer n for the last n, or False for none
+                   (default: True, or False when on_emit, output_buffer or
+                   sink receives them)
+
+        Raises:
+            ValueError: If retain is a negative integer
+        """
+        super().__init__(shared_buffer, delay=delay, on_consume=on_consume,
+                         poll_interval=poll_interval, sink=sink, cpus=cpus,
+                         retain=False)
+        self.aggregator = aggregator
+        self.on_emit = on_emit
+        self.output_buffer = output_buffer
+
+        # Emitted window results in emission order, kept only as retain allows
+        if retain is None:
+            retain = on_emit is None and output_buffer is None and sink is None
+        self.window_results, self._retain_result = _retention(retain)
+
+    def run(self):
+        """
+        Execute the aggregation loop.
+
+        Aggregates items until production is complete and the buffer is
+        empty, emitting window results as the watermark closes them, then
+        flushes the remaining windows and the sink, if any.
+        """
+        # Pin the running thread first if a placement was given
+        if self.cpus:
+            pin_current_thread(self.cpus)
+
+        while True:
+            item = self._next_item()
+
+            # None signals end of production
+            if item is None:
+                break
+
+            started = time.perf_counter()
+
+            # Fold the item into its windows and emit any that closed
+            self._emit(self.aggregator.add(item))
+            self.items_consumed += 1
+
+            if self.on_consume:
+                self.on_consume(item, self.items_consumed, self.shared_buffer.size())
+
+            if self.delay > 0:
+                time.sleep(self.delay)
+
+            self.busy_time += time.perf_counter() - started
+            self.last_active = time.monotonic()
+
+        # Emit what is left and let the next stage finish
+        self._emit(self.aggregator.flush())
+        if self.output_buffer is not None:
+            self.output_buffer.mark_complete()
+
+        if self.sink:
+            self.sink.flush()
+
+    def _emit(self, results):
+        """
+        Send window results downstream.
+
+        Args:
+            results: List of window result dictionaries
+        """
+        for result in results:
+            if self._retain_result:
+                self._retain_result(result)
+
+            if self.on_emit:
+                self.on_emit(result)
+
+            if self.output_buffer is not None:
+                self.output_buffer.put(result)
+
+        if self.sink and results:
+            self.sink.write_many(results)
+
+
+def _sort_key(key):
+    """Order keys of mixed types deterministically in the closing heap."""
+    return (type(key).__name__, key if key is not None else 0)
@@ -0,0 +1,114 @@
+import unittest
+import os
+import tempfile
+import threading
+import sys
+sys.path.insert(0, '..')
+
+from src.pipeline import ProducerConsumerPipeline
+from src.affinity import (
+    CpuTopology,
+    affinity_supported,
+    available_cpus,
+    pin_current_thread,
+    plan_placement
+)
+
+# Two packages with two cores each and two hardware threads per core
+TWO_SOCKET_SMT = CpuTopology({
+    (0, 0): [0, 4], (0, 1): [1, 5],
+    (1, 0): [2, 6], (1, 1): [3, 7]
+})
+
+# Four cores on one package without SMT
+FOUR_CORES = CpuTopology({(0, core): [core] for core in range(4)})
+
+
+class TestAffinity(unittest.TestCase):
+
+    def test_spread_uses_separate_cores_across_packages(self):
+        self.assertEqual(TWO_SOCKET_SMT.spread_order(), [0, 2, 1, 3, 4, 6, 5, 7])
+
+        plan = plan_placement('spread', ['producer', 'consumer-0', 'consumer-1'], TWO_SOCKET_SMT)
+        self.assertEqual(plan, {'producer': [0], 'consumer-0': [2], 'consumer-1': [1]})
+
+    def test_pairs_share_a_core(self):
+        plan = plan_placement('pairs', ['producer', 'consumer-0', 'consumer-1'], TWO_SOCKET_SMT)
+
+        # Producer and first consumer are hardware threads of core (0, 0)
+        self.assertEqual(plan, {'producer': [0], 'consumer-0': [4], 'consumer-1': [1]})
+
+    def test_pairs_without_smt_use_neighbouring_cores(self):
+        plan = plan_placement('pairs', ['producer', 'consumer-0'], FOUR_CORES)
+
+        self.assertEqual(plan, {'producer': [0], 'consumer-0': [1]})
+
+    def test_more_workers_than_cpus_wrap_around(self):
+        plan = plan_placement('spread', [f'w{i}' for i in range(6)], FOUR_CORES)
+
+        self.assertEqual([cpus[0] for cpus in plan.values()], [0, 1, 2, 3, 0, 1])
+
+    def test_no_placement_and_unknown_placement(self):
+        self.assertEqual(plan_placement(None, ['producer']), {})
+        with self.assertRaises(ValueError):
+            plan_placement('random', ['producer'], FOUR_CORES)
+        with self.assertRaises(ValueError):
+            ProducerConsumerPipeline(placement='random')
+
+    def test_detect_reads_sysfs_topology(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for cpu in available_cpus():
+                path = os.path.join(tmp, f'cpu{cpu}', 'topology')
+                os.makedirs(path)
+                with open(os.path.join(path, 'physical_package_id'), 'w') as file:
+                    file.write('0\n')
+                with open(os.path.join(path, 'core_id'), 'w') as file:
+                    file.write(f'{cpu // 2}\n')
+
+            topology = CpuTopology.detect(tmp)
+
+        self.assertEqual(topology.cpus, available_cpus())
+        for (package, core), cpus in topology.cores.items():
+            self.assertEqual(package, 0)
+            self.assertTrue(all(cpu // 2 == core for cpu in cpus))
+
+    def test_detect_without_sysfs(self):
+        topology = CpuTopology.detect('/nonexistent')
+
+        self.assertEqual(len(topology.cores), len(available_cpus()))
+
+    @unittest.skipUnless(affinity_supported(), "CPU affinity not supported")
+    def test_pin_current_thread(self):
+        cpu = available_cpus()[-1]
+        result = []
+
+        def pinned():
+            pin_current_thread([cpu])
+            result.append(os.sched_getaffinity(0))
+
+        thread = threading.Thread(target=pinned)
+        thread.start()
+        thread.join()
+
+        # Only the pinned thread is restricted
+        self.assertEqual(result, [{cpu}])
+        self.assertEqual(sorted(os.sched_getaffinity(0)), available_cpus())
+
+    def test_pipeline_reports_placement(self):
+        pipeline = ProducerConsumerPipeline(placement='spread')
+        results = pipeline.process(list(range(50)))
+        stats = pipeline.get_stats()
+
+        self.assertEqual(results, list(range(50)))
+        self.assertEqual(stats['placement']['strategy'], 'spread')
+        self.assertEqual(stats['placement']['pinned'], affinity_supported())
+        if affinity_supported():
+            self.assertEqual(set(stats['placement']['workers']), {'producer', 'consumer-0'})
+
+        unpinned = ProducerConsumerPipeline()
+        unpinned.process([1, 2, 3])
+        self.assertNotIn('placement', unpinned.get_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import time
+import sys
+sys.path.insert(0, '..')
+
+from src.buffer import SharedBuffer
+from src.consumer import Consumer
+from src.producer import Producer
+from src.autoscaler import ConsumerAutoscaler
+from src.pipeline import ProducerConsumerPipeline
+
+
+def bursty_source(burst, pause):
+    """Yield one burst of items, go quiet for a while, then yield one more"""
+    for item in range(burst):
+        yield item
+    time.sleep(pause)
+    yield burst
+
+
+class TestConsumerAutoscaler(unittest.TestCase):
+
+    def test_invalid_limits(self):
+        buffer = SharedBuffer(capacity=5)
+        with self.assertRaises(ValueError):
+            ConsumerAutoscaler(buffer, lambda: Consumer(buffer), min_consumers=0)
+        with self.assertRaises(ValueError):
+            ConsumerAutoscaler(buffer, lambda: Consumer(buffer),
+                               min_consumers=3, max_consumers=2)
+
+    def test_default_scale_up_depth(self):
+        buffer = SharedBuffer(capacity=10)
+        autoscaler = ConsumerAutoscaler(buffer, lambda: Consumer(buffer))
+        self.assertEqual(autoscaler.scale_up_depth, 5)
+
+    def test_starts_min_consumers(self):
+        buffer = SharedBuffer(capacity=5)
+        buffer.mark_complete()
+
+        autoscaler = ConsumerAutoscaler(
+            buffer,
+            lambda: Consumer(buffer, poll_interval=0.01),
+            min_consumers=2,
+            max_consumers=4
+        )
+        autoscaler.start()
+        autoscaler.join()
+
+        self.assertEqual(len(autoscaler.consumers), 2)
+        self.assertEqual(autoscaler.events, [])
+
+    def test_scales_up_under_backlog(self):
+        buffer = SharedBuffer(capacity=10)
+        producer = Producer(buffer, list(range(150)))
+        events = []
+
+        autoscaler = ConsumerAutoscaler(
+            buffer,
+            lambda: Consumer(buffer, delay=0.005, poll_interval=0.01),
+            min_consumers=1,
+            max_consumers=3,
+            interval=0.02,
+            on_scale=events.append
+        )
+        autoscaler.start()
+        producer.run()
+        autoscaler.join()
+
+        consumed = sum(c.items_consumed for c in autoscaler.consumers)
+        self.assertEqual(consumed, 150)
+        self.assertGreater(autoscaler.peak_consumers, 1)
+        self.assertLessEqual(autoscaler.peak_consumers, 3)
+        self.assertTrue(any(e['action'] == 'scale_up' for e in events))
+        self.assertEqual(events, autoscaler.events)
+
+    def test_retires_idle_consumers_after_cooldown(self):
+        buffer = SharedBuffer(capacity=10)
+        producer = Producer(buffer, bursty_source(150, pause=0.6))
+
+        autoscaler = ConsumerAutoscaler(
+            buffer,
+            lambda: Consumer(buffer, delay=0.005, poll_interval=0.01),
+            min_consumers=1,
+            max_consumers=3,
+            interval=0.02,
+            idle_cooldown=0.1
+        )
+        autoscaler.start()
+        producer.run()
+        autoscaler.join()
+
+        actions = [e['action'] for e in autoscaler.events]
+        self.assertIn('scale_up', actions)
+        self.assertIn('scale_down', actions)
+        self.assertEqual(sum(c.items_consumed for c in autoscaler.consumers), 151)
+
+    def test_stats(self):
+        buffer = SharedBuffer(capacity=5)
+        buffer.mark_complete()
+        autoscaler = ConsumerAutoscaler(
+            buffer,
+            lambda: Consumer(buffer, poll_interval=0.01),
+            min_consumers=1,
+            max_consumers=2
+        )
+        autoscaler.start()
+        autoscaler.join()
+        stats = autoscaler.get_stats()
+
+        self.assertEqual(stats['min_consumers'], 1)
+        self.assertEqual(stats['max_consumers'], 2)
+        self.assertEqual(stats['total_consumers'], 1)
+        self.assertEqual(stats['events'], [])
+
+    def test_pipeline_elastic_mode(self):
+        pipeline = ProducerConsumerPipeline(
+            buffer_capacity=10,
+            min_consumers=1,
+            max_consumers=4
+        )
+        data = list(range(200))
+
+        results = pipeline.process(data, consumer_delay=0.005)
+        stats = pipeline.get_stats()
+
+        self.assertEqual(sorted(results), data)
+        self.assertTrue(stats['success'])
+        self.assertEqual(stats['consumed'], 200)
+        self.assertIn('scaling', stats)
+        self.assertGreater(stats['scaling']['peak_consumers'], 1)
+
+    def test_pipeline_elastic_batch_mode(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=10, max_consumers=2)
+        data = list(range(100))
+
+        results = pipeline.process(data, batch_size=5, consumer_delay=0.001)
+        stats = pipeline.get_stats()
+
+        self.assertEqual(sorted(results), data)
+        self.assertTrue(stats['success'])
+        self.assertEqual(stats['batching']['avg_batch_size'] * stats['batching']['batches'], 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+import threading
+import time
+import sys
+sys.path.insert(0, '..')
+
+from src.buffer import SharedBuffer
+from src.batch_consumer import BatchConsumer
+
+
+class TestBatchConsumer(unittest.TestCase):
+
+    def test_batch_consumer_initialization(self):
+        buffer = SharedBuffer(capacity=5)
+        consumer = BatchConsumer(buffer, batch_size=3, linger_ms=50)
+
+        self.assertEqual(consumer.batch_size, 3)
+        self.assertEqual(consumer.linger, 0.05)
+        self.assertEqual(consumer.items_consumed, 0)
+        self.assertEqual(consumer.batches_flushed, 0)
+
+    def test_invalid_batch_size(self):
+        buffer = SharedBuffer(capacity=5)
+        with self.assertRaises(ValueError):
+            BatchConsumer(buffer, batch_size=0)
+
+    def test_flushes_full_batches(self):
+        buffer = SharedBuffer(capacity=10)
+        for item in range(6):
+            buffer.put(item)
+        buffer.mark_complete()
+
+        batches = []
+        consumer = BatchConsumer(buffer, batch_size=3, linger_ms=1000,
+                                 process_fn=batches.append)
+        consumer.run()
+
+        self.assertEqual(batches, [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(consumer.flush_reasons['size'], 2)
+        self.assertEqual(consumer.consumed_items, list(range(6)))
+
+    def test_flushes_final_partial_batch_on_complete(self):
+        buffer = SharedBuffer(capacity=10)
+        batches = []
+        consumer = BatchConsumer(buffer, batch_size=4, linger_ms=5000,
+                                 process_fn=batches.append)
+
+        def producer():
+            for item in range(6):
+                buffer.put(item)
+            time.sleep(0.05)
+            buffer.mark_complete()
+
+        producer_thread = threading.Thread(target=producer)
+        consumer_thread = threading.Thread(target=consumer.run)
+
+        start = time.time()
+        producer_thread.start()
+        consumer_thread.start()
+        producer_thread.join()
+        consumer_thread.join()
+
+        self.assertEqual([len(b) for b in batches], [4, 2])
+        self.assertEqual(consumer.flush_reasons['complete'], 1)
+        self.assertLess(time.time() - start, 2)
+
+    def test_flushes_partial_batch_after_linger(self):
+        buffer = SharedBuffer(capacity=10)
+        batches = []
+        consumer = BatchConsumer(buffer, batch_size=10, linger_ms=30,
+                                 process_fn=batches.append)
+
+        def producer():
+            buffer.put(1)
+            buffer.put(2)
+            time.sleep(0.2)
+            buffer.put(3)
+            buffer.mark_complete()
+
+        producer_thread = threading.Thread(target=producer)
+        consumer_thread = threading.Thread(target=consumer.run)
+
+        producer_thread.start()
+        consumer_thread.start()
+        producer_thread.join()
+        consumer_thread.join()
+
+        self.assertEqual(batches, [[1, 2], [3]])
+        self.assertEqual(consumer.flush_reasons['linger'], 1)
+
+    def test_callback_called_per_item(self):
+        buffer = SharedBuffer(capacity=5)
+        for item in [1, 2, 3]:
+            buffer.put(item)
+        buffer.mark_complete()
+
+        counts = []
+
+        def callback(item, count, buffer_size):
+            counts.append(count)
+
+        consumer = BatchConsumer(buffer, batch_size=2, on_consume=callback)
+        consumer.run()
+
+        self.assertEqual(counts, [1, 2, 3])
+
+    def test_empty_buffer(self):
+        buffer = SharedBuffer(capacity=5)
+        buffer.mark_complete()
+
+        batches = []
+        consumer = BatchConsumer(buffer, batch_size=3, process_fn=batches.append)
+        consumer.run()
+
+        self.assertEqual(batches, [])
+        self.assertEqual(consumer.get_batch_stats()['batches'], 0)
+
+    def test_batch_stats(self):
+        buffer = SharedBuffer(capacity=10)
+        for item in range(5):
+            buffer.put(item)
+        buffer.mark_complete()
+
+        consumer = BatchConsumer(buffer, batch_size=2, linger_ms=100)
+        consumer.run()
+        stats = consumer.get_batch_stats()
+
+        self.assertEqual(stats['batches'], 3)
+        self.assertEqual(stats['avg_batch_size'], 5 / 3)
+        self.assertEqual(stats['max_batch_size'], 2)
+        self.assertGreaterEqual(stats['max_linger_ms'], stats['avg_linger_ms'])
+        self.assertEqual(sum(stats['flush_reasons'].values()), 3)
+
+    def test_concurrent_producer(self):
+        buffer = SharedBuffer(capacity=4)
+        items = list(range(100))
+
+        def producer():
+            for item in items:
+                buffer.put(item)
+            buffer.mark_complete()
+
+        consumer = BatchConsumer(buffer, batch_size=8, linger_ms=5)
+
+        producer_thread = threading.Thread(target=producer)
+        consumer_thread = threading.Thread(target=consumer.run)
+
+        producer_thread.start()
+        consumer_thread.start()
+        producer_thread.join()
+        consumer_thread.join()
+
+        self.assertEqual(consumer.consumed_items, items)
+        self.assertLessEqual(consumer.max_batch_size, 8)
+
+    def test_bounded_retention(self):
+        buffer = SharedBuffer(capacity=20)
+        for item in range(20):
+            buffer.put(item)
+        buffer.mark_complete()
+
+        consumer = BatchConsumer(buffer, batch_size=6, retain=4)
+        consumer.run()
+
+        self.assertEqual(consumer.items_consumed, 20)
+        self.assertEqual(list(consumer.consumed_items), [16, 17, 18, 19])
+        self.assertEqual(consumer.get_batch_stats()['avg_batch_size'], 20 / 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
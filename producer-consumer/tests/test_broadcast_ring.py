@@ -0,0 +1,146 @@
+import unittest
+import threading
+import time
+import sys
+sys.path.insert(0, '..')
+
+from src.broadcast_ring import BroadcastRing
+from src.consumer import Consumer
+from src.pipeline import ProducerConsumerPipeline
+
+
+class TestBroadcastRing(unittest.TestCase):
+
+    def test_ring_initialization(self):
+        ring = BroadcastRing(capacity=4, groups=['a', 'b'])
+
+        self.assertEqual(len(ring.slots), 4)
+        self.assertEqual(ring.cursor, 0)
+        self.assertEqual(ring.group_cursors, {'a': 0, 'b': 0})
+        self.assertEqual(ring.size(), 0)
+
+    def test_ring_requires_groups(self):
+        with self.assertRaises(ValueError):
+            BroadcastRing(capacity=4, groups=[])
+
+    def test_every_group_receives_every_item(self):
+        ring = BroadcastRing(capacity=5, groups=['a', 'b'])
+        for item in [1, 2, 3]:
+            ring.put(item)
+        ring.mark_complete()
+
+        for group in ['a', 'b']:
+            received = []
+            while True:
+                item = ring.get(group)
+                if item is None:
+                    break
+                received.append(item)
+            self.assertEqual(received, [1, 2, 3])
+
+    def test_lag_per_group(self):
+        ring = BroadcastRing(capacity=5, groups=['fast', 'slow'])
+        for item in range(4):
+            ring.put(item)
+
+        ring.get('fast')
+        ring.get('fast')
+        ring.get('fast')
+        ring.get('slow')
+
+        stats = ring.stats()
+        self.assertEqual(stats['produced'], 4)
+        self.assertEqual(stats['groups']['fast'], {'consumed': 3, 'lag': 1})
+        self.assertEqual(stats['groups']['slow'], {'consumed': 1, 'lag': 3})
+        self.assertEqual(stats['max_lag'], 3)
+        self.assertEqual(ring.size(), 3)
+
+    def test_slowest_group_gates_producer(self):
+        ring = BroadcastRing(capacity=2, groups=['fast', 'slow'])
+        ring.put(1)
+        ring.put(2)
+        ring.get('fast')
+        ring.get('fast')
+
+        put_completed = [False]
+
+        def try_put():
+            ring.put(3)
+            put_completed[0] = True
+
+        thread = threading.Thread(target=try_put)
+        thread.start()
+        time.sleep(0.05)
+        self.assertFalse(put_completed[0])
+
+        ring.get('slow')
+        thread.join(timeout=1)
+        self.assertTrue(put_completed[0])
+
+    def test_slot_released_after_all_groups_read(self):
+        ring = BroadcastRing(capacity=3, groups=['a', 'b'])
+        ring.put('x')
+
+        ring.get('a')
+        self.assertEqual(ring.slots[0], 'x')
+        ring.get('b')
+        self.assertIsNone(ring.slots[0])
+
+    def test_group_view_with_consumer(self):
+        ring = BroadcastRing(capacity=3, groups=['indexer', 'archiver'])
+        indexer = Consumer(ring.group('indexer'))
+        archiver = Consumer(ring.group('archiver'))
+
+        def producer():
+            for item in range(20):
+                ring.put(item)
+            ring.mark_complete()
+
+        threads = [
+            threading.Thread(target=producer),
+            threading.Thread(target=indexer.run),
+            threading.Thread(target=archiver.run)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(indexer.consumed_items, list(range(20)))
+        self.assertEqual(archiver.consumed_items, list(range(20)))
+        self.assertTrue(ring.group('indexer').is_drained())
+
+    def test_unknown_group(self):
+        ring = BroadcastRing(capacity=3, groups=['a'])
+        with self.assertRaises(KeyError):
+            ring.group('b')
+
+    def test_pipeline_process_broadcast(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=4)
+        data = list(range(50))
+        tapped = []
+
+        results = pipeline.process_broadcast(data, {
+            'indexer': None,
+            'archiver': None,
+            'metrics': lambda item, count, lag: tapped.append(item)
+        })
+
+        self.assertEqual(set(results), {'indexer', 'archiver', 'metrics'})
+        for items in results.values():
+            self.assertEqual(items, data)
+        self.assertEqual(tapped, data)
+
+    def test_pipeline_broadcast_stats(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=4)
+        pipeline.process_broadcast([1, 2, 3], {'a': None, 'b': None})
+        stats = pipeline.get_stats()
+
+        self.assertTrue(stats['success'])
+        self.assertEqual(stats['produced'], 3)
+        self.assertEqual(stats['consumed'], {'a': 3, 'b': 3})
+        self.assertEqual(stats['groups']['a']['lag'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -181,5 +181,71 @@ class TestSharedBuffer(unittest.TestCase):
         self.assertEqual(buffer.get(), [1, 2, 3])
         self.assertEqual(buffer.get(), (1, 2))
 
+    def test_get_batch_returns_available_items(self):
+        buffer = SharedBuffer(capacity=5)
+        for item in [1, 2, 3]:
+            buffer.put(item)
+
+        self.assertEqual(buffer.get_batch(2), [1, 2])
+        self.assertEqual(buffer.get_batch(5), [3])
+        self.assertEqual(buffer.size(), 0)
+
+    def test_get_batch_times_out_when_empty(self):
+        buffer = SharedBuffer(capacity=5)
+
+        start = time.time()
+        items = buffer.get_batch(3, timeout=0.05)
+
+        self.assertEqual(items, [])
+        self.assertGreaterEqual(time.time() - start, 0.05)
+        self.assertFalse(buffer.is_drained())
+
+    def test_get_batch_wakes_blocked_producers(self):
+        buffer = SharedBuffer(capacity=2)
+        buffer.put(1)
+        buffer.put(2)
+
+        def producer():
+            buffer.put(3)
+            buffer.put(4)
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        time.sleep(0.05)
+
+        self.assertEqual(buffer.get_batch(2), [1, 2])
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(buffer.size(), 2)
+
+    def test_get_times_out_when_empty(self):
+        buffer = SharedBuffer(capacity=5)
+
+        start = time.time()
+        self.assertIsNone(buffer.get(timeout=0.05))
+        self.assertGreaterEqual(time.time() - start, 0.05)
+
+    def test_mark_complete_wakes_all_consumers(self):
+        buffer = SharedBuffer(capacity=5)
+
+        threads = [threading.Thread(target=buffer.get) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+
+        buffer.mark_complete()
+        for thread in threads:
+            thread.join(timeout=1)
+            self.assertFalse(thread.is_alive())
+
+    def test_is_drained(self):
+        buffer = SharedBuffer(capacity=5)
+        buffer.put(1)
+        buffer.mark_complete()
+
+        self.assertFalse(buffer.is_drained())
+        buffer.get()
+        self.assertTrue(buffer.is_drained())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import threading
+import time
+import sys
+sys.path.insert(0, '..')
+
+from src.coalescing_buffer import CoalescingBuffer
+from src.batch_consumer import BatchConsumer
+from src.pipeline import ProducerConsumerPipeline
+
+
+def tick(symbol, price):
+    return {'symbol': symbol, 'price': price}
+
+
+def by_symbol(item):
+    return item['symbol']
+
+
+class TestCoalescingBuffer(unittest.TestCase):
+
+    def test_buffer_initialization(self):
+        buffer = CoalescingBuffer(capacity=5, key_fn=by_symbol)
+
+        self.assertEqual(buffer.capacity, 5)
+        self.assertEqual(buffer.size(), 0)
+        self.assertEqual(buffer.coalesced_count, 0)
+
+    def test_distinct_keys_fifo(self):
+        buffer = CoalescingBuffer(capacity=5, key_fn=by_symbol)
+        buffer.put(tick('A', 1))
+        buffer.put(tick('B', 2))
+        buffer.put(tick('C', 3))
+
+        self.assertEqual([buffer.get()['symbol'] for _ in range(3)], ['A', 'B', 'C'])
+
+    def test_latest_value_wins_and_keeps_position(self):
+        buffer = CoalescingBuffer(capacity=5, key_fn=by_symbol)
+        buffer.put(tick('A', 1))
+        buffer.put(tick('B', 2))
+        buffer.put(tick('A', 3))
+
+        self.assertEqual(buffer.size(), 2)
+        self.assertEqual(buffer.get(), tick('A', 3))
+        self.assertEqual(buffer.get(), tick('B', 2))
+        self.assertEqual(buffer.coalesced_count, 1)
+
+    def test_key_requeued_after_consumed(self):
+        buffer = CoalescingBuffer(capacity=5, key_fn=by_symbol)
+        buffer.put(tick('A', 1))
+        buffer.get()
+        buffer.put(tick('A', 2))
+
+        self.assertEqual(buffer.get(), tick('A', 2))
+        self.assertEqual(buffer.coalesced_count, 0)
+
+    def test_replace_does_not_block_when_full(self):
+        buffer = CoalescingBuffer(capacity=2, key_fn=by_symbol)
+        buffer.put(tick('A', 1))
+        buffer.put(tick('B', 1))
+
+        thread = threading.Thread(target=buffer.put, args=(tick('A', 2),))
+        thread.start()
+        thread.join(timeout=1)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(buffer.get(), tick('A', 2))
+
+    def test_new_key_blocks_when_full(self):
+        buffer = CoalescingBuffer(capacity=1, key_fn=by_symbol)
+        buffer.put(tick('A', 1))
+
+        thread = threading.Thread(target=buffer.put, args=(tick('B', 1),))
+        thread.start()
+        time.sleep(0.05)
+        self.assertTrue(thread.is_alive())
+
+        buffer.get()
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(buffer.get(), tick('B', 1))
+
+    def test_get_batch(self):
+        buffer = CoalescingBuffer(capacity=5, key_fn=by_symbol)
+        for symbol, price in [('A', 1), ('B', 1), ('A', 2), ('C', 1)]:
+            buffer.put(tick(symbol, price))
+
+        self.assertEqual(buffer.get_batch(2), [tick('A', 2), tick('B', 1)])
+        self.assertEqual(buffer.get_batch(5), [tick('C', 1)])
+
+    def test_works_with_batch_consumer(self):
+        buffer = CoalescingBuffer(capacity=5, key_fn=by_symbol)
+        for price in range(10):
+            buffer.put(tick('A', price))
+        buffer.put(tick('B', 0))
+        buffer.mark_complete()
+
+        consumer = BatchConsumer(buffer, batch_size=4)
+        consumer.run()
+
+        self.assertEqual(consumer.consumed_items, [tick('A', 9), tick('B', 0)])
+
+    def test_pipeline_with_coalesce_key(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=3, coalesce_key=by_symbol)
+        data = [tick(symbol, price) for price in range(50) for symbol in 'ABC']
+
+        results = pipeline.process(data, consumer_delay=0.001)
+        stats = pipeline.get_stats()
+
+        self.assertTrue(stats['success'])
+        self.assertEqual(stats['produced'], 150)
+        self.assertEqual(stats['consumed'] + stats['coalesced'], 150)
+        self.assertGreater(stats['coalesced'], 0)
+
+        # The newest value of every key is always delivered
+        last = {}
+        for item in results:
+            last[item['symbol']] = item['price']
+        self.assertEqual(last, {'A': 49, 'B': 49, 'C': 49})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import threading
+import time
 import sys
 sys.path.insert(0, '..')
 
@@ -191,6 +192,85 @@ class TestConsumer(unittest.TestCase):
         self.assertEqual(consumer.items_consumed, 100)
         self.assertEqual(sorted(consumer.consumed_items), items)
 
+    def test_consumer_tracks_busy_time(self):
+        buffer = SharedBuffer(capacity=5)
+        buffer.put(1)
+        buffer.put(2)
+        buffer.mark_complete()
+
+        consumer = Consumer(buffer, delay=0.02)
+        consumer.run()
+
+        self.assertGreaterEqual(consumer.busy_time, 0.04)
+
+    def test_polling_consumer_retires_when_idle(self):
+        buffer = SharedBuffer(capacity=5)
+        consumer = Consumer(buffer, poll_interval=0.01)
+
+        thread = threading.Thread(target=consumer.run)
+        thread.start()
+        buffer.put(1)
+        time.sleep(0.05)
+
+        consumer.retire()
+        thread.join(timeout=1)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(consumer.consumed_items, [1])
+        self.assertFalse(buffer.production_complete)
+
+    def test_polling_consumer_stops_when_drained(self):
+        buffer = SharedBuffer(capacity=5)
+        consumer = Consumer(buffer, poll_interval=0.01)
+
+        thread = threading.Thread(target=consumer.run)
+        thread.start()
+        time.sleep(0.03)
+        buffer.put(1)
+        buffer.mark_complete()
+        thread.join(timeout=1)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(consumer.consumed_items, [1])
+
+    def test_consumer_retains_last_items(self):
+        buffer = SharedBuffer(capacity=200)
+        for i in range(100):
+            buffer.put(i)
+        buffer.mark_complete()
+
+        consumer = Consumer(buffer, retain=3)
+        consumer.run()
+
+        self.assertEqual(consumer.items_consumed, 100)
+        self.assertEqual(list(consumer.consumed_items), [97, 98, 99])
+
+    def test_consumer_without_retention(self):
+        buffer = SharedBuffer(capacity=10)
+        for i in range(5):
+            buffer.put(i)
+        buffer.mark_complete()
+
+        seen = []
+        consumer = Consumer(buffer, retain=False,
+                            on_consume=lambda item, count, size: seen.append(item))
+        consumer.run()
+
+        self.assertEqual(consumer.items_consumed, 5)
+        self.assertEqual(consumer.consumed_items, [])
+        self.assertEqual(seen, [0, 1, 2, 3, 4])
+
+    def test_consumer_rejects_negative_retain(self):
+        with self.assertRaises(ValueError):
+            Consumer(SharedBuffer(capacity=5), retain=-1)
+
+    def test_consumer_has_no_instance_dict(self):
+        consumer = Consumer(SharedBuffer(capacity=5))
+
+        self.assertFalse(hasattr(consumer, '__dict__'))
+        with self.assertRaises(AttributeError):
+            consumer.unknown = 1
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,8 +1,11 @@
 import unittest
+import os
+import tempfile
 import sys
 sys.path.insert(0, '..')
 
 from src.pipeline import ProducerConsumerPipeline
+from src.sinks import JsonLinesSink
 
 
 class TestProducerConsumerPipeline(unittest.TestCase):
@@ -195,6 +198,52 @@ class TestProducerConsumerPipeline(unittest.TestCase):
         self.assertEqual(produce_counts, [1, 2, 3])
         self.assertEqual(consume_counts, [1, 2, 3])
 
+    def test_pipeline_batch_mode(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=5)
+        data = list(range(20))
+        batches = []
+
+        results = pipeline.process(
+            data,
+            batch_size=4,
+            linger_ms=10,
+            process_fn=batches.append
+        )
+
+        self.assertEqual(results, data)
+        self.assertEqual(sum(len(b) for b in batches), 20)
+        self.assertTrue(all(len(b) <= 4 for b in batches))
+
+    def test_pipeline_batch_mode_stats(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=5)
+        pipeline.process(list(range(10)), batch_size=3)
+        stats = pipeline.get_stats()
+
+        self.assertTrue(stats['success'])
+        self.assertIn('batching', stats)
+        self.assertGreater(stats['batching']['batches'], 0)
+
+    def test_pipeline_stats_without_batch_mode(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=5)
+        pipeline.process([1, 2, 3])
+
+        self.assertNotIn('batching', pipeline.get_stats())
+
+    def test_pipeline_without_retention_routes_to_sink(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'out.jsonl')
+            pipeline = ProducerConsumerPipeline(buffer_capacity=8)
+
+            with JsonLinesSink(path) as sink:
+                results = pipeline.process(range(1000), batch_size=16, sink=sink, retain=False)
+
+            with open(path) as file:
+                written = [int(line) for line in file]
+
+        self.assertEqual(list(results), [])
+        self.assertEqual(written, list(range(1000)))
+        self.assertTrue(pipeline.get_stats()['success'])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
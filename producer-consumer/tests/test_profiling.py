@@ -0,0 +1,141 @@
+import unittest
+import re
+import threading
+import time
+import sys
+sys.path.insert(0, '..')
+
+from src.buffer import SharedBuffer
+from src.coalescing_buffer import CoalescingBuffer
+from src.pipeline import ProducerConsumerPipeline
+from src.profiling import LockProfiler, ProfiledCondition
+
+
+class TestLockProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = LockProfiler()
+
+    def start(self, target):
+        thread = threading.Thread(target=target, name='worker')
+        thread.start()
+        return thread
+
+    def test_disabled_by_default(self):
+        buffer = SharedBuffer(capacity=2)
+
+        self.assertIsNone(buffer.profiler)
+        self.assertNotIsInstance(buffer.condition, ProfiledCondition)
+
+    def test_counts_acquires_per_operation(self):
+        buffer = SharedBuffer(capacity=5, profiler=self.profiler)
+        buffer.put(1)
+        buffer.put(2)
+        buffer.get()
+
+        rows = {(r.thread, r.operation): r for r in self.profiler.records}
+        main = threading.current_thread().name
+        self.assertEqual(rows[(main, 'put')].acquires, 2)
+        self.assertEqual(rows[(main, 'get')].acquires, 1)
+        self.assertEqual(self.profiler.get_stats()['total']['contended'], 0)
+
+    def test_contended_acquire_is_timed(self):
+        buffer = SharedBuffer(capacity=5, profiler=self.profiler)
+
+        with buffer.condition:
+            thread = self.start(lambda: buffer.put(1))
+            time.sleep(0.05)
+        thread.join()
+
+        worker = self.profiler.get_stats()['threads']['worker']
+        self.assertEqual(worker['contended'], 1)
+        self.assertGreaterEqual(worker['acquire_ms'], 40)
+        self.assertGreaterEqual(worker['max_acquire_ms'], 40)
+
+    def test_wait_and_wakeups(self):
+        buffer = SharedBuffer(capacity=5, profiler=self.profiler)
+
+        thread = self.start(buffer.get)
+        time.sleep(0.05)
+        buffer.put('item')
+        thread.join()
+
+        worker = self.profiler.get_stats()['threads']['worker']
+        self.assertEqual(worker['waits'], 1)
+        self.assertEqual(worker['wakeups'], 1)
+        self.assertGreaterEqual(worker['wait_ms'], 40)
+        self.assertEqual(worker['spurious_wakeups'], 0)
+
+    def test_spurious_wakeups(self):
+        buffer = SharedBuffer(capacity=5, profiler=self.profiler)
+
+        thread = self.start(buffer.get)
+        time.sleep(0.05)
+
+        # Wake the consumer with nothing to take
+        with buffer.condition:
+            buffer.condition.notify()
+        time.sleep(0.05)
+
+        buffer.put('item')
+        thread.join()
+
+        worker = self.profiler.get_stats()['threads']['worker']
+        self.assertEqual(worker['wakeups'], 2)
+        self.assertEqual(worker['spurious_wakeups'], 1)
+
+    def test_timeout_is_not_spurious(self):
+        buffer = SharedBuffer(capacity=5, profiler=self.profiler)
+
+        self.assertIsNone(buffer.get(timeout=0.02))
+
+        total = self.profiler.get_stats()['total']
+        self.assertEqual(total['waits'], 1)
+        self.assertEqual(total['wakeups'], 0)
+        self.assertEqual(total['spurious_wakeups'], 0)
+
+    def test_report_and_folded_stacks(self):
+        buffer = CoalescingBuffer(4, key_fn=lambda item: item, profiler=self.profiler)
+        thread = self.start(buffer.get)
+        time.sleep(0.02)
+        buffer.put('a')
+        thread.join()
+
+        report = self.profiler.report()
+        self.assertIn('worker', report)
+        self.assertIn('put', report)
+
+        lines = self.profiler.folded_stacks().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            self.assertRegex(line, r'^[^;]+;\w+;(acquire|hold|wait) \d+$')
+        self.assertTrue(any(re.match(r'worker;get;wait \d+', line) for line in lines))
+
+    def test_spin_strategy_reacquires_are_counted(self):
+        buffer = SharedBuffer(capacity=5, wait_strategy='spin', profiler=self.profiler)
+
+        thread = self.start(buffer.get)
+        time.sleep(0.05)
+        buffer.put('item')
+        thread.join()
+
+        # Spinning releases and reacquires the lock before parking
+        self.assertGreater(self.profiler.get_stats()['threads']['worker']['acquires'], 1)
+
+    def test_pipeline_profile_locks(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=2, profile_locks=True)
+        pipeline.process(list(range(100)))
+
+        locks = pipeline.get_stats()['locks']
+        self.assertGreaterEqual(locks['total']['acquires'], 200)
+        self.assertEqual(len(locks['threads']), 2)
+        self.assertIsNotNone(pipeline.lock_profiler)
+
+        unprofiled = ProducerConsumerPipeline()
+        unprofiled.process([1, 2, 3])
+        self.assertNotIn('locks', unprofiled.get_stats())
+        self.assertIsNone(unprofiled.lock_profiler)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import sys
+sys.path.insert(0, '..')
+
+from src.serializers import (
+    PickleSerializer,
+    MarshalSerializer,
+    BytesSerializer,
+    resolve_serializer
+)
+from src.transport import encode_items, decode_items
+
+
+class TestSerializers(unittest.TestCase):
+
+    def test_resolve_default_is_pickle(self):
+        self.assertIsInstance(resolve_serializer(None), PickleSerializer)
+
+    def test_resolve_by_name(self):
+        self.assertIsInstance(resolve_serializer('pickle'), PickleSerializer)
+        self.assertIsInstance(resolve_serializer('marshal'), MarshalSerializer)
+        self.assertIsInstance(resolve_serializer('bytes'), BytesSerializer)
+
+    def test_resolve_unknown_name(self):
+        with self.assertRaises(ValueError):
+            resolve_serializer('json')
+
+    def test_pickle_round_trip(self):
+        serializer = PickleSerializer()
+        item = {'id': 7, 'tags': ('a', 'b'), 'price': 9.5}
+
+        self.assertEqual(serializer.loads(serializer.dumps(item)), item)
+
+    def test_pickle_large_buffers_out_of_band(self):
+        serializer = PickleSerializer(out_of_band_threshold=1024)
+        payload = b'x' * 5000
+        item = {'payload': payload, 'scratch': bytearray(b'y' * 3000), 'small': b'z'}
+
+        frames = serializer.dumps(item)
+
+        # Stream first, then one frame per large buffer in stream order
+        self.assertEqual([memoryview(f).nbytes for f in frames[1:]], [5000, 3000])
+        self.assertIs(frames[1], payload)
+
+        result = serializer.loads(frames)
+        self.assertEqual(result, item)
+        self.assertIsInstance(result['scratch'], bytearray)
+
+    def test_marshal_round_trip(self):
+        serializer = MarshalSerializer()
+        item = [1, 2.5, 'three', b'four', {'five': None}]
+
+        self.assertEqual(serializer.loads(serializer.dumps(item)), item)
+
+    def test_marshal_rejects_custom_objects(self):
+        with self.assertRaises(ValueError):
+            MarshalSerializer().dumps(object())
+
+    def test_bytes_passthrough(self):
+        serializer = BytesSerializer()
+        item = b'raw record'
+
+        frames = serializer.dumps(item)
+        self.assertIs(frames[0], item)
+        self.assertEqual(serializer.loads(frames), item)
+
+        with self.assertRaises(TypeError):
+            serializer.dumps('text')
+
+    def test_stats_track_items_and_timing(self):
+        serializer = PickleSerializer()
+        for item in range(3):
+            serializer.loads(serializer.dumps(item))
+
+        stats = serializer.get_stats()
+        self.assertEqual(stats['serializer'], 'pickle')
+        self.assertEqual(stats['items_serialized'], 3)
+        self.assertEqual(stats['items_deserialized'], 3)
+        self.assertGreater(stats['bytes_serialized'], 0)
+        self.assertGreater(stats['avg_serialize_us'], 0)
+
+    def test_batch_encoding_round_trip(self):
+        serializer = PickleSerializer(out_of_band_threshold=16)
+        items = [b'a' * 100, {'n': 1}, bytearray(b'b' * 50)]
+
+        payload = b''.join(bytes(buffer) for buffer in encode_items(serializer, items, b'!'))
+
+        self.assertEqual(decode_items(serializer, payload, offset=1), items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+import time
+import sys
+sys.path.insert(0, '..')
+
+from src.buffer import SharedBuffer
+from src.consumer import Consumer
+from src.batch_consumer import BatchConsumer
+from src.pipeline import ProducerConsumerPipeline
+from src.sinks import JsonLinesSink, BinaryRecordSink, read_binary_records
+
+
+class TestSinks(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'out')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_json_lines(self):
+        with open(self.path) as file:
+            return [json.loads(line) for line in file]
+
+    def test_json_lines_round_trip(self):
+        items = [{'id': 1, 'tags': ['a']}, [1, 2], 'text', None]
+
+        with JsonLinesSink(self.path) as sink:
+            for item in items:
+                sink.write(item)
+
+        self.assertEqual(self.read_json_lines(), items)
+
+    def test_writes_are_buffered(self):
+        with JsonLinesSink(self.path, buffer_size=1000) as sink:
+            for item in range(100):
+                sink.write(item)
+
+            # 100 short lines fit in one buffer, so nothing is written yet
+            self.assertEqual(os.path.getsize(self.path), 0)
+            self.assertEqual(sink.get_stats()['writes'], 0)
+
+            sink.write_many(range(500))
+            self.assertGreater(os.path.getsize(self.path), 0)
+
+        self.assertEqual(len(self.read_json_lines()), 600)
+
+    def test_appends_to_existing_file(self):
+        with JsonLinesSink(self.path) as sink:
+            sink.write(1)
+        with JsonLinesSink(self.path) as sink:
+            sink.write(2)
+
+        self.assertEqual(self.read_json_lines(), [1, 2])
+
+    def test_group_commit_by_bytes(self):
+        with JsonLinesSink(self.path, buffer_size=64, fsync_bytes=100) as sink:
+            for item in range(200):
+                sink.write(item)
+            stats = sink.get_stats()
+
+        # One fsync per ~100 bytes, not one per item
+        self.assertGreater(stats['fsyncs'], 3)
+        self.assertLess(stats['fsyncs'], 20)
+        self.assertGreaterEqual(stats['max_fsync_ms'], stats['avg_fsync_ms'])
+
+    def test_group_commit_by_interval(self):
+        with JsonLinesSink(self.path, fsync_interval=0.05) as sink:
+            sink.write(1)
+            sink.write(2)
+            self.assertEqual(sink.get_stats()['fsyncs'], 0)
+
+            time.sleep(0.06)
+            sink.write(3)
+            self.assertEqual(sink.get_stats()['fsyncs'], 1)
+
+        self.assertEqual(self.read_json_lines(), [1, 2, 3])
+
+    def test_stats_report_throughput(self):
+        with JsonLinesSink(self.path, buffer_size=16) as sink:
+            for item in range(100):
+                sink.write('x' * 10)
+                time.sleep(0.0005)
+            stats = sink.get_stats()
+
+        self.assertEqual(stats['items_written'], 100)
+        self.assertEqual(stats['bytes_written'], 1300)
+        self.assertGreater(stats['writes'], 1)
+        self.assertGreater(stats['bytes_per_sec'], 0)
+
+    def test_binary_records_round_trip(self):
+        items = [{'id': 1, 'payload': b'x' * 5000}, (2, 'two'), b'']
+
+        with BinaryRecordSink(self.path) as sink:
+            sink.write_many(items)
+
+        self.assertEqual(list(read_binary_records(self.path)), items)
+
+        with BinaryRecordSink(self.path, serializer='marshal') as sink:
+            sink.write([3])
+
+        with self.assertRaises(Exception):
+            list(read_binary_records(self.path))
+
+    def test_shared_sink_across_consumers(self):
+        buffer = SharedBuffer(capacity=10)
+        sink = JsonLinesSink(self.path, buffer_size=256)
+        consumers = [Consumer(buffer, sink=sink), BatchConsumer(buffer, 4, sink=sink)]
+        threads = [threading.Thread(target=c.run) for c in consumers]
+        for thread in threads:
+            thread.start()
+
+        for item in range(300):
+            buffer.put(item)
+        buffer.mark_complete()
+        for thread in threads:
+            thread.join()
+
+        # Consumers flush on exit, so the file is complete before close
+        self.assertEqual(sorted(self.read_json_lines()), list(range(300)))
+        sink.close()
+
+    def test_pipeline_sink_stats(self):
+        with JsonLinesSink(self.path, fsync_bytes=1000) as sink:
+            pipeline = ProducerConsumerPipeline(buffer_capacity=8)
+            pipeline.process(list(range(500)), batch_size=32, sink=sink)
+            stats = pipeline.get_stats()
+
+        self.assertEqual(stats['sink']['items_written'], 500)
+        self.assertGreater(stats['sink']['fsyncs'], 0)
+        self.assertEqual(self.read_json_lines(), list(range(500)))
+
+
+if __name__ == '__main__':
+    unittest.main()
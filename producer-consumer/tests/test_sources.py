@@ -0,0 +1,117 @@
+import unittest
+import os
+import tempfile
+import sys
+sys.path.insert(0, '..')
+
+from src.buffer import SharedBuffer
+from src.producer import Producer
+from src.pipeline import ProducerConsumerPipeline
+from src.sources import FileLineSource, CSVRecordSource
+
+SALES_CSV = os.path.join(os.path.dirname(__file__), '..', '..', 'csv-analysis', 'data', 'sales_data.csv')
+
+
+class TestSources(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, content, name='data.txt'):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_lines_across_chunk_boundaries(self):
+        lines = [f"line {i} " + 'x' * i for i in range(50)]
+        path = self.write('\n'.join(lines).encode() + b'\n')
+
+        self.assertEqual(list(FileLineSource(path, chunk_size=7)), lines)
+
+    def test_last_line_without_newline_and_crlf(self):
+        path = self.write(b'first\r\nsecond\r\n\r\nlast')
+
+        self.assertEqual(list(FileLineSource(path, chunk_size=4)), ['first', 'second', '', 'last'])
+
+    def test_mmap_matches_buffered_reads(self):
+        path = self.write(b''.join(f"{i},{i * i}\n".encode() for i in range(1000)))
+
+        buffered = list(FileLineSource(path, chunk_size=100))
+        mapped = list(FileLineSource(path, chunk_size=100, use_mmap=True))
+
+        self.assertEqual(mapped, buffered)
+        self.assertEqual(len(mapped), 1000)
+
+    def test_empty_file(self):
+        path = self.write(b'')
+
+        self.assertEqual(list(FileLineSource(path)), [])
+        self.assertEqual(list(FileLineSource(path, use_mmap=True)), [])
+        self.assertEqual(list(CSVRecordSource(path)), [])
+
+    def test_batches_and_stats(self):
+        path = self.write(b'a\nb\nc\nd\ne\n')
+        source = FileLineSource(path, batch_size=2)
+
+        self.assertEqual(list(source), [['a', 'b'], ['c', 'd'], ['e']])
+        self.assertEqual(source.get_stats(), {'bytes_read': 10, 'records_read': 5})
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            FileLineSource('unused', batch_size=0)
+
+    def test_csv_records_typed_by_schema(self):
+        path = self.write(
+            b'transaction_id,date,product,category,region,quantity,price\n'
+            b'1,2024-03-09,Laptop,Electronics,East,4,1212.55\n'
+            b'\n'
+            b'2,2024-06-30,"Toaster, 2 slot",Appliances,East,,43.65\n',
+            'sales.csv'
+        )
+
+        records = list(CSVRecordSource(path, chunk_size=16))
+
+        self.assertEqual(records[0], {
+            'transaction_id': 1, 'date': '2024-03-09', 'product': 'Laptop',
+            'category': 'Electronics', 'region': 'East', 'quantity': 4, 'price': 1212.55
+        })
+        self.assertEqual(records[1]['product'], 'Toaster, 2 slot')
+        self.assertIsNone(records[1]['quantity'])
+        self.assertEqual(len(records), 2)
+
+    @unittest.skipUnless(os.path.exists(SALES_CSV), "csv-analysis dataset required")
+    def test_csv_sales_dataset(self):
+        source = CSVRecordSource(SALES_CSV, batch_size=64, chunk_size=4096, use_mmap=True)
+        batches = list(source)
+
+        self.assertEqual(sum(len(batch) for batch in batches), 500)
+        self.assertTrue(all(len(batch) <= 64 for batch in batches))
+        self.assertIsInstance(batches[0][0]['price'], float)
+        self.assertEqual(source.fieldnames[0], 'transaction_id')
+
+    def test_producer_streams_source_into_buffer(self):
+        path = self.write(b''.join(f"{i}\n".encode() for i in range(20)))
+        buffer = SharedBuffer(capacity=100)
+
+        Producer(buffer, FileLineSource(path, batch_size=8)).run()
+
+        self.assertEqual(buffer.get_batch(10), [
+            [str(i) for i in range(8)], [str(i) for i in range(8, 16)], ['16', '17', '18', '19']
+        ])
+        self.assertTrue(buffer.is_drained())
+
+    @unittest.skipUnless(os.path.exists(SALES_CSV), "csv-analysis dataset required")
+    def test_pipeline_with_csv_source(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=4)
+
+        results = pipeline.process(CSVRecordSource(SALES_CSV, batch_size=100))
+
+        self.assertEqual(sum(len(batch) for batch in results), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
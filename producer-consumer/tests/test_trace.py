@@ -0,0 +1,118 @@
+import unittest
+import os
+import tempfile
+import time
+import sys
+sys.path.insert(0, '..')
+
+from src.pipeline import ProducerConsumerPipeline
+from src.trace import Trace, TraceEvent, TraceRecorder, TraceReplayer
+
+
+def paced_source(count, gap):
+    for i in range(count):
+        time.sleep(gap)
+        yield b'x' * (i + 1)
+
+
+class TestTrace(unittest.TestCase):
+
+    def make_trace(self, count=20, gap=0.002, cost=0.001):
+        return Trace(TraceEvent(i * gap, 10, cost) for i in range(count))
+
+    def test_record_arrivals_sizes_and_costs(self):
+        recorder = TraceRecorder()
+        pipeline = ProducerConsumerPipeline(buffer_capacity=4)
+
+        pipeline.process(recorder.wrap_source(paced_source(10, 0.005)),
+                         on_consume=recorder.wrap_consume(lambda item, count, size: time.sleep(0.002)))
+        trace = recorder.trace()
+
+        self.assertEqual(len(trace), 10)
+        self.assertEqual([event.size for event in trace], list(range(1, 11)))
+        self.assertEqual(trace.events[0].offset, 0.0)
+        self.assertGreaterEqual(trace.duration, 0.04)
+        self.assertTrue(all(event.cost >= 0.0015 for event in trace))
+
+    def test_record_batch_costs(self):
+        recorder = TraceRecorder(size_fn=lambda item: 1)
+        pipeline = ProducerConsumerPipeline(buffer_capacity=8)
+
+        pipeline.process(recorder.wrap_source(range(8)), batch_size=4,
+                         process_fn=recorder.wrap_process(lambda batch: time.sleep(0.004)))
+        trace = recorder.trace()
+
+        self.assertEqual(len(trace), 8)
+        self.assertTrue(all(0.0008 <= event.cost < 0.004 for event in trace))
+
+    def test_save_and_load(self):
+        trace = self.make_trace(5)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'workload.trace')
+            trace.save(path)
+            loaded = Trace.load(path)
+
+        self.assertEqual(loaded.events, trace.events)
+
+    def test_replay_follows_schedule(self):
+        replayer = TraceReplayer(self.make_trace(10, gap=0.01, cost=0), cost_mode='none')
+
+        started = time.perf_counter()
+        items = list(replayer.source())
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual([item.index for item in items], list(range(10)))
+        self.assertEqual(len(items[0].payload), 10)
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.2)
+
+    def test_replay_speed_scales_timing(self):
+        replayer = TraceReplayer(self.make_trace(10, gap=0.02, cost=0.01), speed=4)
+        items = list(replayer.source())
+
+        self.assertAlmostEqual(items[-1].arrival - replayer.started, 0.045, places=6)
+        self.assertAlmostEqual(items[0].cost, 0.0025)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            TraceReplayer(self.make_trace(), speed=0)
+        with self.assertRaises(ValueError):
+            TraceReplayer(self.make_trace(), cost_mode='guess')
+
+    def test_pipeline_replay_stats(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=4)
+
+        result = pipeline.replay(self.make_trace(20), cost_mode='spin')
+
+        self.assertEqual(result['items'], 20)
+        self.assertGreater(result['throughput'], 0)
+        self.assertGreaterEqual(result['latency_ms']['p50'], 0.9)
+        self.assertLessEqual(result['latency_ms']['p50'], result['latency_ms']['p99'])
+        self.assertEqual(pipeline.get_stats()['replay']['items'], 20)
+        self.assertTrue(pipeline.get_stats()['success'])
+
+    def test_replay_is_reproducible(self):
+        trace = self.make_trace(30, gap=0.003, cost=0.001)
+        pipeline = ProducerConsumerPipeline(buffer_capacity=4)
+
+        durations = [pipeline.replay(trace)['duration_s'] for _ in range(2)]
+
+        # The schedule, not run-to-run jitter, dominates the replay time
+        self.assertGreaterEqual(min(durations), trace.duration)
+        self.assertLess(abs(durations[0] - durations[1]), 0.03)
+
+    def test_replay_from_saved_trace_with_batching(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'workload.trace')
+            self.make_trace(12).save(path)
+
+            pipeline = ProducerConsumerPipeline(buffer_capacity=4)
+            result = pipeline.replay(path, batch_size=4, linger_ms=5)
+
+        self.assertEqual(result['items'], 12)
+        self.assertIn('batching', pipeline.get_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import unittest
+import os
+import tempfile
+import threading
+import sys
+sys.path.insert(0, '..')
+
+from src.buffer import SharedBuffer
+from src.producer import Producer
+from src.consumer import Consumer
+from src.batch_consumer import BatchConsumer
+from src.transport import BufferServer, RemoteBuffer
+
+
+class TestTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.buffer = SharedBuffer(capacity=8)
+        self.server = BufferServer(self.buffer).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_server_binds_free_port(self):
+        host, port = self.server.address
+        self.assertEqual(host, '127.0.0.1')
+        self.assertGreater(port, 0)
+
+    def test_remote_put_reaches_local_buffer(self):
+        with RemoteBuffer(self.server.address) as remote:
+            remote.put(1)
+            remote.put(2)
+            remote.flush()
+            self.assertEqual(remote.size(), 2)
+
+        self.assertEqual(self.buffer.get(), 1)
+        self.assertEqual(self.buffer.get(), 2)
+
+    def test_lingering_put_is_sent_without_flush(self):
+        with RemoteBuffer(self.server.address, batch_size=100, linger_ms=10) as remote:
+            remote.put('only')
+
+            # Read locally while the client stays open and idle
+            self.assertEqual(self.buffer.get(timeout=1), 'only')
+            self.assertEqual(remote.pending, [])
+
+    def test_remote_get_from_local_buffer(self):
+        for item in ['a', 'b', 'c']:
+            self.buffer.put(item)
+        self.buffer.mark_complete()
+
+        with RemoteBuffer(self.server.address) as remote:
+            self.assertEqual([remote.get(), remote.get(), remote.get()], ['a', 'b', 'c'])
+            self.assertIsNone(remote.get())
+            self.assertTrue(remote.is_drained())
+
+    def test_remote_get_timeout(self):
+        with RemoteBuffer(self.server.address) as remote:
+            self.assertIsNone(remote.get(timeout=0.05))
+            self.assertFalse(remote.is_drained())
+
+    def test_mark_complete_flushes_pending_items(self):
+        with RemoteBuffer(self.server.address, batch_size=100) as remote:
+            for item in range(5):
+                remote.put(item)
+            remote.mark_complete()
+
+        self.assertTrue(self.buffer.production_complete)
+        self.assertEqual(self.buffer.get_batch(10), list(range(5)))
+
+    def test_credits_mirror_capacity_backpressure(self):
+        remote = RemoteBuffer(self.server.address, batch_size=4)
+        sent = []
+
+        def produce():
+            for item in range(12):
+                remote.put(item)
+                sent.append(item)
+            remote.flush()
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join(timeout=0.3)
+
+        # The producer is held back once the remote buffer is full
+        self.assertTrue(thread.is_alive())
+        self.assertLessEqual(self.buffer.size(), 8)
+
+        received = [self.buffer.get() for _ in range(12)]
+        thread.join(timeout=1)
+        remote.close()
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(received, list(range(12)))
+
+    def test_connection_is_reused(self):
+        with RemoteBuffer(self.server.address) as remote:
+            remote.put(1)
+            remote.flush()
+            sock = remote.sock
+            remote.size()
+            remote.put(2)
+            remote.flush()
+            self.assertIs(remote.sock, sock)
+
+    def test_remote_producer_and_consumer(self):
+        data = [{'id': i, 'payload': b'x' * i} for i in range(200)]
+
+        producer = Producer(RemoteBuffer(self.server.address, batch_size=16), data)
+        consumer = Consumer(RemoteBuffer(self.server.address, prefetch=8))
+
+        producer_thread = threading.Thread(target=producer.run)
+        consumer_thread = threading.Thread(target=consumer.run)
+        producer_thread.start()
+        consumer_thread.start()
+        producer_thread.join()
+        consumer_thread.join()
+
+        self.assertEqual(consumer.consumed_items, data)
+        producer.shared_buffer.close()
+        consumer.shared_buffer.close()
+
+    def test_remote_batch_consumer(self):
+        for item in range(7):
+            self.buffer.put(item)
+        self.buffer.mark_complete()
+
+        batches = []
+        consumer = BatchConsumer(RemoteBuffer(self.server.address), batch_size=4,
+                                 process_fn=batches.append)
+        consumer.run()
+        consumer.shared_buffer.close()
+
+        self.assertEqual(batches, [[0, 1, 2, 3], [4, 5, 6]])
+
+    def test_large_bytes_items(self):
+        data = [bytes([i]) * 200000 for i in range(4)]
+
+        with RemoteBuffer(self.server.address) as remote:
+            for item in data:
+                remote.put(item)
+            remote.mark_complete()
+
+        with RemoteBuffer(self.server.address) as remote:
+            received = [remote.get() for _ in range(4)]
+
+        self.assertEqual(received, data)
+
+    def test_serializer_option_and_stats(self):
+        buffer = SharedBuffer(capacity=4)
+
+        with BufferServer(buffer, serializer='marshal') as server:
+            with RemoteBuffer(server.address, serializer='marshal') as remote:
+                remote.put({'id': 1})
+                remote.put([2, 3])
+                self.assertEqual(remote.size(), 2)
+                self.assertEqual(remote.get_stats()['items_serialized'], 2)
+
+            self.assertEqual(buffer.get_batch(2), [{'id': 1}, [2, 3]])
+            self.assertEqual(server.get_stats()['serializer'], 'marshal')
+            self.assertEqual(server.get_stats()['items_deserialized'], 2)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "Unix sockets required")
+    def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'buffer.sock')
+            buffer = SharedBuffer(capacity=4)
+
+            with BufferServer(buffer, path) as server:
+                with RemoteBuffer(server.address) as remote:
+                    remote.put('hello')
+                    remote.mark_complete()
+
+                with RemoteBuffer(server.address) as remote:
+                    self.assertEqual(remote.get(), 'hello')
+                    self.assertIsNone(remote.get())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+import threading
+import time
+import sys
+sys.path.insert(0, '..')
+
+from src.buffer import SharedBuffer
+from src.pipeline import ProducerConsumerPipeline
+from src.wait_strategy import (
+    BlockingWaitStrategy,
+    SpinYieldParkWaitStrategy,
+    BusySpinWaitStrategy,
+    resolve_wait_strategy
+)
+
+STRATEGY_NAMES = ['blocking', 'spin', 'busy_spin']
+
+
+class TestWaitStrategy(unittest.TestCase):
+
+    def test_resolve_default_is_blocking(self):
+        self.assertIsInstance(resolve_wait_strategy(None), BlockingWaitStrategy)
+
+    def test_resolve_by_name(self):
+        self.assertIsInstance(resolve_wait_strategy('blocking'), BlockingWaitStrategy)
+        self.assertIsInstance(resolve_wait_strategy('spin'), SpinYieldParkWaitStrategy)
+        self.assertIsInstance(resolve_wait_strategy('busy_spin'), BusySpinWaitStrategy)
+
+    def test_resolve_instance_passthrough(self):
+        strategy = SpinYieldParkWaitStrategy(spin_iterations=10, yield_iterations=1)
+        self.assertIs(resolve_wait_strategy(strategy), strategy)
+
+    def test_resolve_unknown_name(self):
+        with self.assertRaises(ValueError):
+            resolve_wait_strategy('sleepy')
+
+    def test_buffer_uses_strategy(self):
+        buffer = SharedBuffer(capacity=5, wait_strategy='busy_spin')
+        self.assertIsInstance(buffer.wait_strategy, BusySpinWaitStrategy)
+
+    def test_blocking_get_wakes_for_each_strategy(self):
+        for name in STRATEGY_NAMES:
+            with self.subTest(strategy=name):
+                buffer = SharedBuffer(capacity=5, wait_strategy=name)
+                result = [None]
+
+                def try_get():
+                    result[0] = buffer.get()
+
+                thread = threading.Thread(target=try_get)
+                thread.start()
+                time.sleep(0.05)
+                self.assertTrue(thread.is_alive())
+
+                buffer.put(7)
+                thread.join(timeout=1)
+                self.assertEqual(result[0], 7)
+
+    def test_blocking_put_wakes_for_each_strategy(self):
+        for name in STRATEGY_NAMES:
+            with self.subTest(strategy=name):
+                buffer = SharedBuffer(capacity=1, wait_strategy=name)
+                buffer.put(1)
+
+                thread = threading.Thread(target=buffer.put, args=(2,))
+                thread.start()
+                time.sleep(0.05)
+                self.assertTrue(thread.is_alive())
+
+                self.assertEqual(buffer.get(), 1)
+                thread.join(timeout=1)
+                self.assertFalse(thread.is_alive())
+                self.assertEqual(buffer.get(), 2)
+
+    def test_get_batch_timeout_for_each_strategy(self):
+        for name in STRATEGY_NAMES:
+            with self.subTest(strategy=name):
+                buffer = SharedBuffer(capacity=5, wait_strategy=name)
+
+                start = time.time()
+                self.assertEqual(buffer.get_batch(2, timeout=0.05), [])
+                self.assertGreaterEqual(time.time() - start, 0.05)
+
+    def test_mark_complete_releases_waiting_consumer(self):
+        for name in STRATEGY_NAMES:
+            with self.subTest(strategy=name):
+                buffer = SharedBuffer(capacity=5, wait_strategy=name)
+                result = ['unset']
+
+                def try_get():
+                    result[0] = buffer.get()
+
+                thread = threading.Thread(target=try_get)
+                thread.start()
+                time.sleep(0.05)
+
+                buffer.mark_complete()
+                thread.join(timeout=1)
+                self.assertIsNone(result[0])
+
+    def test_pipeline_with_each_strategy(self):
+        data = list(range(200))
+        for name in STRATEGY_NAMES:
+            with self.subTest(strategy=name):
+                pipeline = ProducerConsumerPipeline(buffer_capacity=4, wait_strategy=name)
+                self.assertEqual(pipeline.process(data), data)
+                self.assertTrue(pipeline.get_stats()['success'])
+
+    def test_busy_spin_yields_to_waited_on_thread(self):
+        # Without yielding, the spin starves the producer under the GIL for seconds
+        pipeline = ProducerConsumerPipeline(wait_strategy='busy_spin')
+        start = time.monotonic()
+        self.assertEqual(len(pipeline.process(range(3000))), 3000)
+        self.assertLess(time.monotonic() - start, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import unittest
+import threading
+import sys
+sys.path.insert(0, '..')
+
+from src.buffer import SharedBuffer
+from src.consumer import Consumer
+from src.pipeline import ProducerConsumerPipeline
+from src.windowing import (
+    TumblingWindows, SlidingWindows, WindowAggregator, WindowConsumer
+)
+
+
+def event(ts, value=1, key='a'):
+    return {'ts': ts, 'value': value, 'key': key}
+
+
+def make_aggregator(windows, allowed_lateness=0, keyed=False):
+    return WindowAggregator(
+        windows,
+        timestamp_fn=lambda item: item['ts'],
+        value_fn=lambda item: item['value'],
+        key_fn=(lambda item: item['key']) if keyed else None,
+        allowed_lateness=allowed_lateness
+    )
+
+
+class TestWindowing(unittest.TestCase):
+
+    def test_window_assignment(self):
+        self.assertEqual(TumblingWindows(10).assign(25), [20])
+        self.assertEqual(TumblingWindows(10).assign(20), [20])
+        self.assertEqual(SlidingWindows(10, 5).assign(12), [10, 5])
+        self.assertEqual(SlidingWindows(9, 3).assign(7), [6, 3, 0])
+
+        with self.assertRaises(ValueError):
+            TumblingWindows(0)
+        with self.assertRaises(ValueError):
+            SlidingWindows(5, 10)
+
+    def test_tumbling_aggregates(self):
+        aggregator = make_aggregator(TumblingWindows(10))
+        results = []
+        for ts, value in [(1, 4), (3, 2), (9, 7), (12, 1), (15, 5)]:
+            results.extend(aggregator.add(event(ts, value)))
+
+        # Reaching the end of the first window closes it
+        self.assertEqual(results, [
+            {'key': None, 'start': 0, 'end': 10, 'count': 3, 'sum': 13, 'min': 2, 'max': 7}
+        ])
+
+        results = aggregator.flush()
+        self.assertEqual(results, [
+            {'key': None, 'start': 10, 'end': 20, 'count': 2, 'sum': 6, 'min': 1, 'max': 5}
+        ])
+
+    def test_sliding_windows_overlap(self):
+        aggregator = make_aggregator(SlidingWindows(10, 5))
+        results = []
+        for ts in [1, 6, 11]:
+            results.extend(aggregator.add(event(ts)))
+
+        results.extend(aggregator.flush())
+        counts = {(r['start'], r['end']): r['count'] for r in results}
+
+        self.assertEqual(counts, {(-5, 5): 1, (0, 10): 2, (5, 15): 2, (10, 20): 1})
+        self.assertEqual([r['end'] for r in results], sorted(r['end'] for r in results))
+
+    def test_keyed_windows(self):
+        aggregator = make_aggregator(TumblingWindows(10), keyed=True)
+        for ts, key in [(1, 'a'), (2, 'b'), (3, 'a'), (4, 'a')]:
+            aggregator.add(event(ts, key=key))
+
+        results = aggregator.flush()
+
+        self.assertEqual({r['key']: r['count'] for r in results}, {'a': 3, 'b': 1})
+
+    def test_state_is_bounded_by_open_windows(self):
+        aggregator = make_aggregator(TumblingWindows(10), keyed=True)
+        emitted = 0
+        for ts in range(10000):
+            emitted += len(aggregator.add(event(ts, key=ts % 3)))
+            self.assertLessEqual(len(aggregator.open_windows), 3)
+
+        emitted += len(aggregator.flush())
+
+        self.assertEqual(emitted, 3000)
+        self.assertEqual(aggregator.get_stats()['open_windows'], 0)
+        self.assertEqual(aggregator.get_stats()['windows_emitted'], 3000)
+
+    def test_late_items_dropped(self):
+        aggregator = make_aggregator(TumblingWindows(10))
+        aggregator.add(event(5))
+        aggregator.add(event(12))
+
+        # Window [0, 10) closed when the watermark passed 10
+        self.assertEqual(aggregator.add(event(8)), [])
+
+        stats = aggregator.get_stats()
+        self.assertEqual(stats['late_dropped'], 1)
+        self.assertEqual(stats['items'], 2)
+        self.assertEqual(stats['watermark'], 12)
+
+    def test_allowed_lateness(self):
+        aggregator = make_aggregator(TumblingWindows(10), allowed_lateness=5)
+        results = []
+        for ts in [5, 12, 8, 14, 16, 3]:
+            results.extend(aggregator.add(event(ts)))
+
+        # 8 was within the lateness, 3 arrived after the window closed at 15
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['count'], 2)
+        self.assertEqual(aggregator.late_dropped, 1)
+
+    def test_consumer_emits_downstream(self):
+        buffer = SharedBuffer(capacity=8)
+        output = SharedBuffer(capacity=8)
+        emitted = []
+        consumer = WindowConsumer(buffer, make_aggregator(TumblingWindows(10)),
+                                  on_emit=emitted.append, output_buffer=output)
+        downstream = Consumer(output)
+
+        threads = [threading.Thread(target=consumer.run),
+                   threading.Thread(target=downstream.run)]
+        for thread in threads:
+            thread.start()
+
+        for ts in range(35):
+            buffer.put(event(ts))
+        buffer.mark_complete()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(consumer.items_consumed, 35)
+        self.assertEqual(consumer.consumed_items, [])
+        self.assertEqual([r['count'] for r in emitted], [10, 10, 10, 5])
+        self.assertEqual(downstream.consumed_items, emitted)
+        # Results sent downstream are not also kept
+        self.assertEqual(consumer.window_results, [])
+
+    def test_consumer_window_retention(self):
+        for retain, expected in ((None, [10, 10, 10, 5]), (2, [10, 5]), (False, [])):
+            with self.subTest(retain=retain):
+                buffer = SharedBuffer(capacity=64)
+                emitted = []
+                consumer = WindowConsumer(buffer, make_aggregator(TumblingWindows(10)),
+                                          on_emit=emitted.append if retain is not None else None,
+                                          retain=retain)
+                for ts in range(35):
+                    buffer.put(event(ts))
+                buffer.mark_complete()
+                consumer.run()
+
+                self.assertEqual([r['count'] for r in consumer.window_results], expected)
+
+        with self.assertRaises(ValueError):
+            WindowConsumer(SharedBuffer(capacity=4), make_aggregator(TumblingWindows(10)), retain=-1)
+
+    def test_pipeline_process_windowed(self):
+        pipeline = ProducerConsumerPipeline(buffer_capacity=16)
+        data = [event(ts, value=ts) for ts in range(100)]
+
+        results = pipeline.process_windowed(data, make_aggregator(SlidingWindows(20, 10)))
+
+        self.assertEqual(len(results), 11)
+        self.assertEqual(sum(r['count'] for r in results), 200)
+
+        stats = pipeline.get_stats()
+        self.assertTrue(stats['success'])
+        self.assertEqual(stats['windows']['items'], 100)
+        self.assertEqual(stats['windows']['late_dropped'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()